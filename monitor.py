@@ -4,25 +4,31 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import copy
+import fnmatch
 import glob
+import hashlib
 import json
 import os
+import queue
 import re
+import selectors
 import subprocess
 import sys
 import threading
 import time
-import tkinter as tk
-from collections import deque
-from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
-from tkinter import messagebox, ttk
-from typing import Any
+from typing import Any, Callable
 
 from monitor_actions import (
     _action_arg_options,
     _action_primary_arg,
     _apply_action_placeholders,
+    _has_action_placeholders,
+    _has_unresolved_placeholder,
     _normalize_cmd,
     _validate_action_arg_value,
 )
@@ -33,8 +39,11 @@ from monitor_config_payload import (
 )
 from monitor_ipc import (
     _iter_jsonpath_tokens,
+    _json_loads,
     _parse_endpoint,
     _request_ipc_v0,
+    _request_ipc_v0_async,
+    compile_json_path,
     json_path_get,
     render_value,
     try_extract_json_object,
@@ -49,6 +58,158 @@ MIN_REFRESH_TICK_SECONDS = 0.2
 DEFAULT_CONTROL_TIMEOUT_SECONDS = 8.0
 DEFAULT_CONTROL_JOB_POLL_MS = 200
 DEFAULT_CONTROL_JOB_TIMEOUT_SECONDS = 120.0
+CONTROL_JOB_POLL_BACKOFF = 1.5
+CONTROL_JOB_POLL_MAX_FACTOR = 5.0
+UI_DRAIN_MS = 30
+UI_DRAIN_MAX_OPS = 500
+# Normalized include files kept across load_monitor_config calls (see _load_include_targets).
+INCLUDE_CACHE_MAX_ENTRIES = 64
+# Include files read concurrently per load; they are often on network shares.
+INCLUDE_LOAD_MAX_WORKERS = 8
+_INCLUDE_CACHE: dict[tuple[str, int, int, tuple[float, float, int, int]], list[dict[str, Any]]] = {}
+# Same results keyed on file content, so one target shared by several root configs is parsed once.
+_INCLUDE_BY_HASH: dict[tuple[bytes, str, tuple[float, float, int, int]], list[dict[str, Any]]] = {}
+_INCLUDE_CACHE_LOCK = threading.Lock()
+
+# Allowed keys for the documents checked on every load, built once at import.
+ROOT_CONFIG_KEYS = frozenset({"refreshSeconds", "commandTimeoutSeconds", "actionOutput", "includeFiles"})
+V2_CONTAINER_KEYS = frozenset({"configVersion", "target", "targets"})
+V2_TARGET_KEYS = frozenset(
+    {
+        "configVersion",
+        "id",
+        "title",
+        "refreshSeconds",
+        "status",
+        "logs",
+        "actions",
+        "ui",
+        "actionOutput",
+        "control",
+        "bootstrap",
+    }
+)
+V2_CONTROL_KEYS = frozenset({"mode", "endpoint", "appId", "timeoutSeconds", "jobPollMs", "jobTimeoutSeconds"})
+V2_TAB_KEYS = frozenset({"id", "title", "widgets", "children"})
+V2_LOG_KEYS = frozenset(
+    {"stream", "title", "glob", "tailLines", "newestFirst", "maxLineBytes", "pollMs", "encoding", "allowMissing"}
+)
+V2_ACTION_KEYS = frozenset(
+    {
+        "name",
+        "label",
+        "cwd",
+        "cmd",
+        "timeoutSeconds",
+        "confirm",
+        "showOutputPanel",
+        "mutex",
+        "detached",
+        "args",
+    }
+)
+V2_ACTION_ARG_KEYS = frozenset(
+    {
+        "name",
+        "label",
+        "required",
+        "type",
+        "placeholder",
+        "pattern",
+        "optionsJsonpath",
+        "options",
+    }
+)
+# Allowed keys per v2 widget type; a type missing here is rejected as unsupported.
+V2_WIDGET_KEYS: dict[str, frozenset[str]] = {
+    "kv": frozenset({"type", "title", "items", "columns"}),
+    "table": frozenset({"type", "title", "columns"}),
+    "rows_table": frozenset({"type", "title", "rowsJsonpath", "columns", "emptyText", "maxRows", "height"}),
+    "log": frozenset({"type", "title", "stream", "showPath", "openPathButton", "copyPathButton"}),
+    "button": frozenset({"type", "label", "action", "prefix", "prefixLabel", "buttons"}),
+    "profile_select": frozenset(
+        {
+            "type",
+            "title",
+            "action",
+            "optionsJsonpath",
+            "currentJsonpath",
+            "emptyLabel",
+            "applyLabel",
+        }
+    ),
+    "action_map": frozenset({"type", "title", "includeCommands", "showActionName", "includePrefix", "includeRegex"}),
+    "action_select": frozenset(
+        {
+            "type",
+            "title",
+            "includePrefix",
+            "includeRegex",
+            "emptyLabel",
+            "runLabel",
+            "showCommand",
+        }
+    ),
+    "action_output": frozenset({"type", "title"}),
+    "text_block": frozenset({"type", "title", "text", "height"}),
+    "file_view": frozenset(
+        {
+            "type",
+            "title",
+            "pathJsonpath",
+            "pathLiteral",
+            "maxBytes",
+            "encoding",
+            "showContent",
+            "height",
+        }
+    ),
+    "config_editor": frozenset(
+        {
+            "type",
+            "title",
+            "showAction",
+            "setAction",
+            "pathJsonpath",
+            "pathLiteral",
+            "pathKey",
+            "includePrefix",
+            "includeKeys",
+            "excludeKeys",
+            "settableOnly",
+            "reloadLabel",
+        }
+    ),
+    "config_file_select": frozenset(
+        {
+            "type",
+            "title",
+            "showAction",
+            "setAction",
+            "key",
+            "pathKey",
+            "emptyLabel",
+            "applyLabel",
+            "reloadLabel",
+        }
+    ),
+}
+
+# Tk is bound on first GUI use so --validate-config and helper imports never load Tcl.
+tk: Any = None
+ttk: Any = None
+messagebox: Any = None
+
+
+def _ensure_tk() -> None:
+    global tk, ttk, messagebox
+    if tk is not None:
+        return
+    import tkinter
+    from tkinter import messagebox as tk_messagebox
+    from tkinter import ttk as tk_ttk
+
+    tk, ttk, messagebox = tkinter, tk_ttk, tk_messagebox
 
 
 class RuntimeProcessPublisher:
@@ -166,20 +327,31 @@ def _no_window_creationflags() -> int:
     return int(getattr(subprocess, "CREATE_NO_WINDOW", 0))
 
 
+def _missing_value(_: Any) -> None:
+    return None
+
+
+def _decode_action_line(raw: bytes) -> str:
+    return raw.decode("utf-8", errors="replace").rstrip("\r\n")
+
+
 def _assert_allowed_keys(
     obj: dict[str, Any],
-    allowed: set[str],
+    allowed: set[str] | frozenset[str],
     context: str,
     *,
     allow_prefixes: tuple[str, ...] = ("x-",),
 ) -> None:
+    # Valid documents are the common case: one C-level subset test settles them.
+    if obj.keys() <= allowed:
+        return
     extras: list[str] = []
     for key in obj.keys():
         if key in allowed:
             continue
         if key == "$schema":
             continue
-        if any(str(key).startswith(prefix) for prefix in allow_prefixes):
+        if str(key).startswith(allow_prefixes):
             continue
         extras.append(str(key))
     extras = sorted(set(extras))
@@ -244,7 +416,7 @@ def _is_ipc_control(target: dict[str, Any]) -> bool:
 def _validate_root_config_payload(base: dict[str, Any], source_path: Path) -> None:
     _assert_allowed_keys(
         base,
-        {"refreshSeconds", "commandTimeoutSeconds", "actionOutput", "includeFiles"},
+        ROOT_CONFIG_KEYS,
         f"Root config {source_path}",
     )
     _require_string_list(base.get("includeFiles"), f"{source_path} includeFiles")
@@ -259,8 +431,12 @@ def _validate_root_config_payload(base: dict[str, Any], source_path: Path) -> No
 
 def _validate_v2_widget(widget: dict[str, Any], context: str) -> None:
     widget_type = str(widget.get("type") or "").strip().lower()
+    allowed = V2_WIDGET_KEYS.get(widget_type)
+    if allowed is None:
+        raise ValueError(f"{context} has unsupported widget type '{widget_type or '(blank)'}'.")
+    _assert_allowed_keys(widget, allowed, context)
+
     if widget_type == "kv":
-        _assert_allowed_keys(widget, {"type", "title", "items", "columns"}, context)
         items = widget.get("items")
         if not isinstance(items, list):
             raise ValueError(f"{context}.items must be a list.")
@@ -271,7 +447,6 @@ def _validate_v2_widget(widget: dict[str, Any], context: str) -> None:
         return
 
     if widget_type == "table":
-        _assert_allowed_keys(widget, {"type", "title", "columns"}, context)
         columns = widget.get("columns")
         if not isinstance(columns, list):
             raise ValueError(f"{context}.columns must be a list.")
@@ -282,7 +457,6 @@ def _validate_v2_widget(widget: dict[str, Any], context: str) -> None:
         return
 
     if widget_type == "rows_table":
-        _assert_allowed_keys(widget, {"type", "title", "rowsJsonpath", "columns", "emptyText", "maxRows", "height"}, context)
         rows_path = str(widget.get("rowsJsonpath") or "").strip()
         if not rows_path:
             raise ValueError(f"{context}.rowsJsonpath must be a non-empty string.")
@@ -302,16 +476,7 @@ def _validate_v2_widget(widget: dict[str, Any], context: str) -> None:
                 raise ValueError(f"{context}.columns[{idx}] requires key or jsonpath.")
         return
 
-    if widget_type == "log":
-        _assert_allowed_keys(
-            widget,
-            {"type", "title", "stream", "showPath", "openPathButton", "copyPathButton"},
-            context,
-        )
-        return
-
     if widget_type == "button":
-        _assert_allowed_keys(widget, {"type", "label", "action", "prefix", "prefixLabel", "buttons"}, context)
         buttons_raw = widget.get("buttons")
         if buttons_raw is not None:
             if not isinstance(buttons_raw, list):
@@ -327,65 +492,7 @@ def _validate_v2_widget(widget: dict[str, Any], context: str) -> None:
             raise ValueError(f"{context}.action must be a non-empty string when buttons is not provided.")
         return
 
-    if widget_type == "profile_select":
-        _assert_allowed_keys(
-            widget,
-            {"type", "title", "action", "optionsJsonpath", "currentJsonpath", "emptyLabel", "applyLabel"},
-            context,
-        )
-        return
-
-    if widget_type == "action_map":
-        _assert_allowed_keys(
-            widget,
-            {"type", "title", "includeCommands", "showActionName", "includePrefix", "includeRegex"},
-            context,
-        )
-        return
-
-    if widget_type == "action_select":
-        _assert_allowed_keys(
-            widget,
-            {"type", "title", "includePrefix", "includeRegex", "emptyLabel", "runLabel", "showCommand"},
-            context,
-        )
-        return
-
-    if widget_type == "action_output":
-        _assert_allowed_keys(widget, {"type", "title"}, context)
-        return
-
-    if widget_type == "text_block":
-        _assert_allowed_keys(widget, {"type", "title", "text", "height"}, context)
-        return
-
-    if widget_type == "file_view":
-        _assert_allowed_keys(
-            widget,
-            {"type", "title", "pathJsonpath", "pathLiteral", "maxBytes", "encoding", "showContent", "height"},
-            context,
-        )
-        return
-
     if widget_type == "config_editor":
-        _assert_allowed_keys(
-            widget,
-            {
-                "type",
-                "title",
-                "showAction",
-                "setAction",
-                "pathJsonpath",
-                "pathLiteral",
-                "pathKey",
-                "includePrefix",
-                "includeKeys",
-                "excludeKeys",
-                "settableOnly",
-                "reloadLabel",
-            },
-            context,
-        )
         show_action = str(widget.get("showAction") or "").strip()
         set_action = str(widget.get("setAction") or "").strip()
         if not show_action:
@@ -404,21 +511,6 @@ def _validate_v2_widget(widget: dict[str, Any], context: str) -> None:
         return
 
     if widget_type == "config_file_select":
-        _assert_allowed_keys(
-            widget,
-            {
-                "type",
-                "title",
-                "showAction",
-                "setAction",
-                "key",
-                "pathKey",
-                "emptyLabel",
-                "applyLabel",
-                "reloadLabel",
-            },
-            context,
-        )
         show_action = str(widget.get("showAction") or "").strip()
         set_action = str(widget.get("setAction") or "").strip()
         key = str(widget.get("key") or "").strip()
@@ -431,26 +523,10 @@ def _validate_v2_widget(widget: dict[str, Any], context: str) -> None:
             raise ValueError(f"{context}.key must be a non-empty string.")
         if not path_key:
             raise ValueError(f"{context}.pathKey must be a non-empty string.")
-        return
-
-    raise ValueError(f"{context} has unsupported widget type '{widget_type or '(blank)'}'.")
 
 
 def _validate_action_arg(arg: dict[str, Any], context: str) -> None:
-    _assert_allowed_keys(
-        arg,
-        {
-            "name",
-            "label",
-            "required",
-            "type",
-            "placeholder",
-            "pattern",
-            "optionsJsonpath",
-            "options",
-        },
-        context,
-    )
+    _assert_allowed_keys(arg, V2_ACTION_ARG_KEYS, context)
     name = str(arg.get("name") or "").strip()
     if not name:
         raise ValueError(f"{context}.name must be a non-empty string.")
@@ -470,7 +546,7 @@ def _validate_action_arg(arg: dict[str, Any], context: str) -> None:
 
 
 def _validate_v2_tab(tab: dict[str, Any], source_path: Path, context: str) -> None:
-    _assert_allowed_keys(tab, {"id", "title", "widgets", "children"}, f"{context} in {source_path}")
+    _assert_allowed_keys(tab, V2_TAB_KEYS, f"{context} in {source_path}")
     widgets = tab.get("widgets")
     children = tab.get("children")
 
@@ -518,7 +594,7 @@ def _validate_v2_control_payload(value: Any, source_path: Path, context: str) ->
 
     _assert_allowed_keys(
         value,
-        {"mode", "endpoint", "appId", "timeoutSeconds", "jobPollMs", "jobTimeoutSeconds"},
+        V2_CONTROL_KEYS,
         f"{context} in {source_path}",
     )
     mode = str(value.get("mode") or "").strip().lower()
@@ -548,23 +624,7 @@ def _validate_v2_bootstrap_payload(value: Any, source_path: Path, context: str)
 
 
 def _validate_v2_target_payload(target: dict[str, Any], source_path: Path, context: str) -> None:
-    _assert_allowed_keys(
-        target,
-        {
-            "configVersion",
-            "id",
-            "title",
-            "refreshSeconds",
-            "status",
-            "logs",
-            "actions",
-            "ui",
-            "actionOutput",
-            "control",
-            "bootstrap",
-        },
-        f"{context} in {source_path}",
-    )
+    _assert_allowed_keys(target, V2_TARGET_KEYS, f"{context} in {source_path}")
     control = _validate_v2_control_payload(target.get("control"), source_path, f"{context}.control")
     _validate_v2_bootstrap_payload(target.get("bootstrap"), source_path, f"{context}.bootstrap")
     ipc_mode = str(control.get("mode") or "") == "ipc"
@@ -581,11 +641,7 @@ def _validate_v2_target_payload(target: dict[str, Any], source_path: Path, conte
         for idx, log in enumerate(logs, 1):
             if not isinstance(log, dict):
                 raise ValueError(f"{context}.logs[{idx}] in {source_path} must be an object.")
-            _assert_allowed_keys(
-                log,
-                {"stream", "title", "glob", "tailLines", "newestFirst", "maxLineBytes", "pollMs", "encoding", "allowMissing"},
-                f"{context}.logs[{idx}] in {source_path}",
-            )
+            _assert_allowed_keys(log, V2_LOG_KEYS, f"{context}.logs[{idx}] in {source_path}")
             stream_name = str(log.get("stream") or "").strip()
             if not stream_name:
                 raise ValueError(f"{context}.logs[{idx}].stream in {source_path} must be a non-empty string.")
@@ -601,22 +657,7 @@ def _validate_v2_target_payload(target: dict[str, Any], source_path: Path, conte
         for idx, action in enumerate(actions, 1):
             if not isinstance(action, dict):
                 raise ValueError(f"{context}.actions[{idx}] in {source_path} must be an object.")
-            _assert_allowed_keys(
-                action,
-                {
-                    "name",
-                    "label",
-                    "cwd",
-                    "cmd",
-                    "timeoutSeconds",
-                    "confirm",
-                    "showOutputPanel",
-                    "mutex",
-                    "detached",
-                    "args",
-                },
-                f"{context}.actions[{idx}] in {source_path}",
-            )
+            _assert_allowed_keys(action, V2_ACTION_KEYS, f"{context}.actions[{idx}] in {source_path}")
             action_name = str(action.get("name") or "").strip()
             if not action_name:
                 raise ValueError(f"{context}.actions[{idx}].name in {source_path} must be a non-empty string.")
@@ -708,7 +749,14 @@ def utc_now_iso() -> str:
 
 
 def load_json(path: Path) -> dict[str, Any]:
-    payload = json.loads(path.read_text(encoding="utf-8-sig"))
+    return _parse_json_object(path.read_bytes(), path)
+
+
+def _parse_json_object(data: bytes, path: Path) -> dict[str, Any]:
+    if data.startswith(b"\xef\xbb\xbf"):
+        # Keep utf-8-sig semantics; orjson rejects a leading BOM.
+        data = data[3:]
+    payload = _json_loads(data)
     if not isinstance(payload, dict):
         raise ValueError(f"Expected object JSON: {path}")
     return payload
@@ -778,19 +826,42 @@ def resolve_latest_file(path_expr: str) -> Path | None:
             return candidate
         return None
 
-    newest: tuple[int, str, Path] | None = None
-    for item in glob.glob(expression, recursive=True):
-        candidate = Path(item)
-        if not candidate.is_file():
-            continue
+    directory, pattern = os.path.split(expression)
+    if "**" in expression or any(token in directory for token in ("*", "?", "[")):
+        candidates = [(item, Path(item)) for item in glob.glob(expression, recursive=True)]
+    else:
+        candidates = _scan_matching_files(directory, pattern)
+
+    # Candidates are Path or DirEntry; both answer is_file() and stat().
+    newest: tuple[int, str] | None = None
+    for text, candidate in candidates:
         try:
+            if not candidate.is_file():
+                continue
             mtime_ns = candidate.stat().st_mtime_ns
         except OSError:
             continue
-        key = (int(mtime_ns), str(candidate))
-        if newest is None or key > (newest[0], newest[1]):
-            newest = (key[0], key[1], candidate)
-    return newest[2] if newest else None
+        key = (int(mtime_ns), text)
+        if newest is None or key > newest:
+            newest = key
+    return Path(newest[1]) if newest else None
+
+
+def _scan_matching_files(directory: str, pattern: str) -> list[tuple[str, os.DirEntry[str]]]:
+    # Wildcards only in the file name (the usual rotated-log case): one scandir, and each
+    # DirEntry answers is_file()/stat() from the listing where the platform allows.
+    # Hidden names match only a pattern that starts with a dot, as with glob.
+    include_hidden = pattern.startswith(".")
+    try:
+        with os.scandir(directory or ".") as entries:
+            return [
+                (os.path.join(directory, entry.name), entry)
+                for entry in entries
+                if (include_hidden or not entry.name.startswith("."))
+                and fnmatch.fnmatch(entry.name, pattern)
+            ]
+    except OSError:
+        return []
 
 
 def tail_lines(path: Path, max_lines: int, encoding: str = "utf-8") -> str:
@@ -877,6 +948,7 @@ def _normalize_v1_include(
                         "label": label,
                         "cwd": action_cwd,
                         "cmd": action_cmd,
+                        "hasPlaceholders": _has_action_placeholders(action_cmd, action_cwd),
                         "timeoutSeconds": float(command.get("timeoutSeconds", 120.0)),
                         "confirm": str(command.get("confirm") or ""),
                         "showOutputPanel": bool(command.get("showOutputPanel", False)),
@@ -1045,6 +1117,7 @@ def _normalize_v2_target(
                     "label": str(action.get("label") or name),
                     "cwd": action_cwd,
                     "cmd": cmd,
+                    "hasPlaceholders": _has_action_placeholders(cmd, action_cwd),
                     "timeoutSeconds": float(action.get("timeoutSeconds", 120.0)),
                     "confirm": str(action.get("confirm") or ""),
                     "showOutputPanel": bool(action.get("showOutputPanel", False)),
@@ -1098,7 +1171,7 @@ def _normalize_v2_include(
     if candidates:
         _assert_allowed_keys(
             payload,
-            {"configVersion", "target", "targets"},
+            V2_CONTAINER_KEYS,
             f"v2 include container {source_path}",
         )
         for index, candidate in enumerate(candidates, 1):
@@ -1123,11 +1196,84 @@ def _normalize_v2_include(
     return result
 
 
+def _normalize_include(
+    payload: dict[str, Any],
+    include_path: Path,
+    defaults: tuple[float, float, int, int],
+) -> list[dict[str, Any]]:
+    include_version = payload.get("configVersion")
+    if include_version is None:
+        include_version = 1
+    include_version_int = int(include_version)
+
+    if include_version_int == 1:
+        normalize = _normalize_v1_include
+    elif include_version_int == 2:
+        normalize = _normalize_v2_include
+    else:
+        raise ValueError(f"Unsupported configVersion={include_version_int} in {include_path}.")
+    refresh_seconds, timeout_seconds, max_lines, max_bytes = defaults
+    return normalize(
+        payload,
+        include_path,
+        default_refresh_seconds=refresh_seconds,
+        default_timeout_seconds=timeout_seconds,
+        default_action_output_max_lines=max_lines,
+        default_action_output_max_bytes=max_bytes,
+    )
+
+
+def clear_config_cache() -> None:
+    with _INCLUDE_CACHE_LOCK:
+        _INCLUDE_CACHE.clear()
+        _INCLUDE_BY_HASH.clear()
+
+
+def _cache_put(cache: dict[Any, Any], key: Any, value: Any) -> None:
+    # Caller holds _INCLUDE_CACHE_LOCK.
+    cache[key] = value
+    while len(cache) > INCLUDE_CACHE_MAX_ENTRIES:
+        del cache[next(iter(cache))]
+
+
+def _load_include_targets(include_path: Path, defaults: tuple[float, float, int, int]) -> list[dict[str, Any]]:
+    # Keyed on the file's identity and the root defaults folded into each target, so a reload
+    # of unchanged includes is one stat per file. Callers get their own copy to mutate.
+    try:
+        stat = include_path.stat()
+    except OSError:
+        return _normalize_include(load_json(include_path), include_path, defaults)
+    key = (str(include_path), stat.st_mtime_ns, stat.st_size, defaults)
+    with _INCLUDE_CACHE_LOCK:
+        cached = _INCLUDE_CACHE.pop(key, None)
+        if cached is not None:
+            _INCLUDE_CACHE[key] = cached
+    if cached is None:
+        data = include_path.read_bytes()
+        # v1 target ids fall back to the file stem, so it is part of the content key.
+        hash_key = (hashlib.blake2b(data, digest_size=16).digest(), include_path.stem, defaults)
+        with _INCLUDE_CACHE_LOCK:
+            cached = _INCLUDE_BY_HASH.get(hash_key)
+        if cached is None:
+            cached = _normalize_include(_parse_json_object(data, include_path), include_path, defaults)
+        else:
+            # A content hit still names the file that filled the entry; sourcePath is the only
+            # field taken from the path (the stem is part of the key), so restamp it.
+            source = str(include_path)
+            cached = [{**target, "sourcePath": source} for target in cached]
+        with _INCLUDE_CACHE_LOCK:
+            _cache_put(_INCLUDE_BY_HASH, hash_key, cached)
+            _cache_put(_INCLUDE_CACHE, key, cached)
+    return copy.deepcopy(cached)
+
+
 def load_monitor_config(path: Path) -> dict[str, Any]:
-    base = load_json(path)
-    _validate_root_config_payload(base, path)
-    include_files = _require_string_list(base.get("includeFiles"), f"{path} includeFiles")
+    return _resolve_config(load_json(path), path)
+
 
+def _root_config_defaults(base: dict[str, Any], path: Path) -> tuple[float, float, int, int]:
+    # Validates the root config and returns the defaults it folds into every include target.
+    _validate_root_config_payload(base, path)
     default_refresh_seconds = float(base.get("refreshSeconds", DEFAULT_REFRESH_SECONDS))
     default_timeout_seconds = float(base.get("commandTimeoutSeconds", DEFAULT_COMMAND_TIMEOUT_SECONDS))
 
@@ -1136,51 +1282,38 @@ def load_monitor_config(path: Path) -> dict[str, Any]:
     default_action_output_max_lines = int(root_action_output_obj.get("maxLines", DEFAULT_ACTION_OUTPUT_MAX_LINES))
     default_action_output_max_bytes = int(root_action_output_obj.get("maxBytes", DEFAULT_ACTION_OUTPUT_MAX_BYTES))
 
-    normalized_targets: list[dict[str, Any]] = []
+    return (
+        default_refresh_seconds,
+        default_timeout_seconds,
+        default_action_output_max_lines,
+        default_action_output_max_bytes,
+    )
 
-    for include in include_files:
-        include_path = resolve_path(path, include)
-        payload = load_json(include_path)
-        include_version = payload.get("configVersion")
-        if include_version is None:
-            include_version = 1
-        include_version_int = int(include_version)
-
-        if include_version_int == 1:
-            normalized_targets.extend(
-                _normalize_v1_include(
-                    payload,
-                    include_path,
-                    default_refresh_seconds=default_refresh_seconds,
-                    default_timeout_seconds=default_timeout_seconds,
-                    default_action_output_max_lines=default_action_output_max_lines,
-                    default_action_output_max_bytes=default_action_output_max_bytes,
-                )
-            )
-            continue
 
-        if include_version_int == 2:
-            normalized_targets.extend(
-                _normalize_v2_include(
-                    payload,
-                    include_path,
-                    default_refresh_seconds=default_refresh_seconds,
-                    default_timeout_seconds=default_timeout_seconds,
-                    default_action_output_max_lines=default_action_output_max_lines,
-                    default_action_output_max_bytes=default_action_output_max_bytes,
-                )
-            )
-            continue
-
-        raise ValueError(f"Unsupported configVersion={include_version_int} in {include_path}.")
+def _resolve_config(base: dict[str, Any], path: Path) -> dict[str, Any]:
+    # `path` names the root config for messages and relative includes.
+    defaults = _root_config_defaults(base, path)
+    include_files = _require_string_list(base.get("includeFiles"), f"{path} includeFiles")
+    include_paths = [resolve_path(path, include) for include in include_files]
+    if len(include_paths) > 1:
+        # map() keeps includeFiles order and re-raises the first failing file in that order.
+        workers = min(INCLUDE_LOAD_MAX_WORKERS, len(include_paths))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="include") as pool:
+            loaded = list(pool.map(_load_include_targets, include_paths, [defaults] * len(include_paths)))
+    else:
+        loaded = [_load_include_targets(include_path, defaults) for include_path in include_paths]
+    normalized_targets: list[dict[str, Any]] = []
+    for targets in loaded:
+        normalized_targets.extend(targets)
 
+    refresh_seconds, timeout_seconds, max_lines, max_bytes = defaults
     return {
-        "refreshSeconds": default_refresh_seconds,
-        "commandTimeoutSeconds": default_timeout_seconds,
+        "refreshSeconds": refresh_seconds,
+        "commandTimeoutSeconds": timeout_seconds,
         "targets": normalized_targets,
         "actionOutput": {
-            "maxLines": default_action_output_max_lines,
-            "maxBytes": default_action_output_max_bytes,
+            "maxLines": max_lines,
+            "maxBytes": max_bytes,
         },
         "includeFiles": include_files,
     }
@@ -1194,7 +1327,7 @@ class ActionOutputBuffer:
         self._total_bytes = 0
         self._lock = threading.Lock()
 
-    def append(self, stream: str, text: str) -> tuple[str, str]:
+    def append(self, stream: str, text: str) -> str:
         line = f"[{stream}] {text}".rstrip("\r\n")
         size = len(line.encode("utf-8", errors="ignore")) + 1
         with self._lock:
@@ -1203,7 +1336,7 @@ class ActionOutputBuffer:
             while self._lines and (len(self._lines) > self.max_lines or self._total_bytes > self.max_bytes):
                 removed_size, _ = self._lines.popleft()
                 self._total_bytes -= removed_size
-            return "\n".join(item for _, item in self._lines), line
+            return line
 
     def snapshot(self) -> str:
         with self._lock:
@@ -1215,6 +1348,27 @@ class ActionOutputBuffer:
             self._total_bytes = 0
 
 
+def _trim_shown_lines(
+    sizes: deque[int],
+    total_bytes: int,
+    text: str,
+    *,
+    max_lines: int,
+    max_bytes: int,
+) -> tuple[int, int]:
+    # Applies ActionOutputBuffer's limits to the lines shown in a Text widget: records the size
+    # of each new widget line in `sizes` and returns (oldest lines to delete, bytes still shown).
+    for part in text.split("\n"):
+        size = len(part.encode("utf-8", errors="ignore")) + 1
+        sizes.append(size)
+        total_bytes += size
+    excess = 0
+    while sizes and (len(sizes) > max_lines or total_bytes > max_bytes):
+        total_bytes -= sizes.popleft()
+        excess += 1
+    return excess, total_bytes
+
+
 class LogTailWorker(threading.Thread):
     def __init__(
         self,
@@ -1325,16 +1479,17 @@ class LogTailWorker(threading.Thread):
         if self._last_render_key == render_key:
             return
         self._last_render_key = render_key
-        self.app.root.after(
-            0,
+        self.app._post_ui(
             lambda tid=self.target_id, stream=self.stream, text=render, active=header_path: self.app._apply_log_render(
                 tid, stream, text, active
             ),
+            key=("log", self.target_id, self.stream),
         )
 
 
 class MonitorApp:
     def __init__(self, root: tk.Tk, config_path: Path) -> None:
+        _ensure_tk()
         self.root = root
         self.config_path = config_path
         self.config = load_monitor_config(config_path)
@@ -1348,11 +1503,20 @@ class MonitorApp:
         self.refresh_lock = threading.Lock()
         self.stop_event = threading.Event()
         self.log_workers: list[LogTailWorker] = []
-        self.action_mutexes: dict[str, threading.Lock] = {}
+        self.action_mutexes: defaultdict[str, threading.Lock] = defaultdict(threading.Lock)
+        self._pending_ui_ops: queue.SimpleQueue = queue.SimpleQueue()
+        self._keyed_ui_ops: dict[Any, Any] = {}
+        self._ui_ops_lock = threading.Lock()
+        self._action_output_file_lock = threading.Lock()
+        self._refresh_pool = ThreadPoolExecutor(max_workers=max(4, os.cpu_count() or 4), thread_name_prefix="refresh")
+        self._aio_loop = asyncio.new_event_loop()
+        self._aio_thread = threading.Thread(target=self._aio_loop.run_forever, name="ipc-actions", daemon=True)
+        self._aio_thread.start()
 
         self._build_ui()
         self._start_log_workers()
         self._schedule_refresh()
+        self.root.after(UI_DRAIN_MS, self._drain_ui_ops)
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def _window_title(self) -> str:
@@ -1453,6 +1617,7 @@ class MonitorApp:
         ui = target.get("ui") if isinstance(target.get("ui"), dict) else {}
         ui_tabs = ui.get("tabs") if isinstance(ui.get("tabs"), list) else []
         self._build_tabs(tabs, runtime, ui_tabs, top_level=True)
+        self._build_render_plan(runtime)
         self._refresh_action_catalog_async(tid, force=True)
 
     def _build_tabs(
@@ -1609,7 +1774,7 @@ class MonitorApp:
             ttk.Label(frame, text=label).grid(row=row_index, column=label_col, sticky="w", padx=8, pady=4)
             value_var = tk.StringVar(value="-")
             ttk.Label(frame, textvariable=value_var).grid(row=row_index, column=value_col, sticky="w", padx=8, pady=4)
-            runtime["bindings"].append((path, value_var))
+            runtime["bindings"].append((compile_json_path(path), value_var))
         for column_group in range(columns):
             frame.columnconfigure(column_group * 2 + 1, weight=1)
 
@@ -1627,7 +1792,7 @@ class MonitorApp:
             ttk.Label(frame, text=label).grid(row=0, column=col, sticky="w", padx=6, pady=(6, 2))
             value_var = tk.StringVar(value="-")
             ttk.Label(frame, textvariable=value_var).grid(row=1, column=col, sticky="w", padx=6, pady=(2, 6))
-            runtime["bindings"].append((path, value_var))
+            runtime["bindings"].append((compile_json_path(path), value_var))
 
     def _build_widget_rows_table(self, parent: ttk.Frame, runtime: dict[str, Any], widget: dict[str, Any]) -> None:
         table_height = max(3, int(widget.get("height", 0) or 0))
@@ -1816,15 +1981,29 @@ class MonitorApp:
 
     def _ipc_control_for_runtime(self, runtime: dict[str, Any]) -> dict[str, Any] | None:
         control = runtime.get("control")
-        if not isinstance(control, dict):
-            return None
-        if str(control.get("mode") or "").strip().lower() != "ipc":
-            return None
-        endpoint = str(control.get("endpoint") or "").strip()
-        app_id = str(control.get("appId") or "").strip()
-        if not endpoint or not app_id:
-            return None
-        return control
+        cached = runtime.get("ipcControlCache")
+        if isinstance(cached, tuple) and cached[0] is control:
+            return cached[1]
+        resolved: dict[str, Any] | None = None
+        if isinstance(control, dict) and str(control.get("mode") or "").strip().lower() == "ipc":
+            endpoint = str(control.get("endpoint") or "").strip()
+            app_id = str(control.get("appId") or "").strip()
+            if endpoint and app_id:
+                # Resolve once per control object so hot IPC paths can index typed fields directly.
+                # configuredTimeoutSeconds is the control's own value (0.0 when unset), for call
+                # sites whose fallback is not DEFAULT_CONTROL_TIMEOUT_SECONDS.
+                configured_timeout = float(control.get("timeoutSeconds") or 0.0)
+                resolved = {
+                    "mode": "ipc",
+                    "endpoint": endpoint,
+                    "appId": app_id,
+                    "timeoutSeconds": configured_timeout or DEFAULT_CONTROL_TIMEOUT_SECONDS,
+                    "configuredTimeoutSeconds": configured_timeout,
+                    "jobPollMs": int(control.get("jobPollMs") or DEFAULT_CONTROL_JOB_POLL_MS),
+                    "jobTimeoutSeconds": float(control.get("jobTimeoutSeconds") or DEFAULT_CONTROL_JOB_TIMEOUT_SECONDS),
+                }
+        runtime["ipcControlCache"] = (control, resolved)
+        return resolved
 
     def _action_items_for_runtime(self, runtime: dict[str, Any]) -> list[dict[str, Any]]:
         target = runtime.get("target") if isinstance(runtime.get("target"), dict) else {}
@@ -1898,24 +2077,17 @@ class MonitorApp:
                     pass
 
         control = self._ipc_control_for_runtime(runtime)
-        if self._action_prefers_local_command(action):
-            thread = threading.Thread(
-                target=self._run_action,
-                args=(target_id, action, action_value, action_args),
-                daemon=True,
-            )
-        elif control is not None:
-            thread = threading.Thread(
-                target=self._run_action_ipc,
-                args=(target_id, action, action_value, action_args),
-                daemon=True,
-            )
-        else:
-            thread = threading.Thread(
-                target=self._run_action,
-                args=(target_id, action, action_value, action_args),
-                daemon=True,
+        if control is not None and not self._action_prefers_local_command(action):
+            asyncio.run_coroutine_threadsafe(
+                self._run_action_ipc(target_id, action, action_value, action_args),
+                self._aio_loop,
             )
+            return
+        thread = threading.Thread(
+            target=self._run_action,
+            args=(target_id, action, action_value, action_args),
+            daemon=True,
+        )
         thread.start()
 
     def _refresh_action_catalog_async(self, target_id: str, *, force: bool = False) -> None:
@@ -1939,20 +2111,19 @@ class MonitorApp:
             return
         control = self._ipc_control_for_runtime(runtime)
         if control is None:
-            self.root.after(0, lambda: self._finalize_action_catalog_load(target_id, [], ""))
+            self._post_ui(lambda: self._finalize_action_catalog_load(target_id, [], ""))
             return
 
-        endpoint = str(control.get("endpoint") or "")
-        app_id = str(control.get("appId") or "")
-        timeout_seconds = float(control.get("timeoutSeconds") or DEFAULT_CONTROL_TIMEOUT_SECONDS)
+        endpoint = control["endpoint"]
+        app_id = control["appId"]
+        timeout_seconds = control["timeoutSeconds"]
         rc, response_obj, error_text = _request_ipc_v0(
             endpoint,
             {"method": "action.list", "params": {"appId": app_id}},
             timeout_seconds=timeout_seconds,
         )
         if rc != 0:
-            self.root.after(
-                0,
+            self._post_ui(
                 lambda: self._finalize_action_catalog_load(
                     target_id,
                     [],
@@ -1964,8 +2135,7 @@ class MonitorApp:
         response = response_obj.get("response")
         actions_raw = response.get("actions") if isinstance(response, dict) else None
         if not isinstance(actions_raw, list):
-            self.root.after(
-                0,
+            self._post_ui(
                 lambda: self._finalize_action_catalog_load(target_id, [], "invalid action catalog payload"),
             )
             return
@@ -1987,7 +2157,7 @@ class MonitorApp:
                 action_item["cmd"] = [str(part) for part in cmd_value]
             actions.append(action_item)
 
-        self.root.after(0, lambda: self._finalize_action_catalog_load(target_id, actions, ""))
+        self._post_ui(lambda: self._finalize_action_catalog_load(target_id, actions, ""))
 
     def _finalize_action_catalog_load(self, target_id: str, actions: list[dict[str, Any]], error_text: str) -> None:
         runtime = self.target_runtime.get(target_id)
@@ -2284,6 +2454,7 @@ class MonitorApp:
             max_lines=int(action_output_cfg.get("maxLines", DEFAULT_ACTION_OUTPUT_MAX_LINES)),
             max_bytes=int(action_output_cfg.get("maxBytes", DEFAULT_ACTION_OUTPUT_MAX_BYTES)),
         )
+        runtime["actionOutputPending"] = queue.SimpleQueue()
 
     def _resolve_tab_for_widget_parent(self, parent: ttk.Frame) -> tuple[ttk.Notebook | None, ttk.Frame | None]:
         current: Any = parent
@@ -2569,8 +2740,7 @@ class MonitorApp:
         show_action = str(selector.get("showAction") or "").strip()
         payload, load_error = self._load_config_payload(target_id, show_action)
         if payload is None:
-            self.root.after(
-                0,
+            self._post_ui(
                 lambda: self._finalize_config_file_selector_load(selector, "", "", [], {}, load_error),
             )
             return
@@ -2620,8 +2790,7 @@ class MonitorApp:
             if isinstance(path_match, dict):
                 path_value = str(path_match.get("value") or "").strip()
 
-        self.root.after(
-            0,
+        self._post_ui(
             lambda: self._finalize_config_file_selector_load(
                 selector,
                 current_text,
@@ -2710,10 +2879,10 @@ class MonitorApp:
         def run_set() -> None:
             rc, error_text = self._set_config_value(target_id, set_action, key, set_value)
             if rc != 0:
-                self.root.after(0, lambda: self._set_stringvar_if_changed(status_var, error_text))
+                self._post_ui(lambda: self._set_stringvar_if_changed(status_var, error_text))
                 return
             self._mark_target_config_widgets_for_refresh(target_id)
-            self.root.after(0, lambda: self._refresh_target_config_widgets(target_id, show_loading=False))
+            self._post_ui(lambda: self._refresh_target_config_widgets(target_id, show_loading=False))
             self._refresh_async()
 
         threading.Thread(target=run_set, daemon=True).start()
@@ -2753,17 +2922,12 @@ class MonitorApp:
         if not cmd:
             return 2, "", "", f"action command is empty: {action_name}"
 
-        replacements_map = {str(k): str(v) for k, v in (replacements or {}).items()}
-        if replacements_map:
-            for key, value in replacements_map.items():
-                token = "{" + key + "}"
-                cmd = [part.replace(token, value) for part in cmd]
+        if replacements:
+            cmd = _apply_action_placeholders(cmd, replacements)
 
         cwd_text = str(action.get("cwd") or "").strip()
-        if replacements_map and cwd_text:
-            for key, value in replacements_map.items():
-                token = "{" + key + "}"
-                cwd_text = cwd_text.replace(token, value)
+        if replacements and cwd_text:
+            cwd_text = _apply_action_placeholders([cwd_text], replacements)[0]
         cwd = Path(cwd_text) if cwd_text else None
         timeout_seconds = float(action.get("timeoutSeconds") or self.default_command_timeout_seconds)
 
@@ -2782,9 +2946,9 @@ class MonitorApp:
         control = self._ipc_control_for_runtime(runtime)
         if control is None:
             return 2, {}, "ipc control is not configured"
-        endpoint = str(control.get("endpoint") or "")
-        app_id = str(control.get("appId") or "")
-        timeout_seconds = float(control.get("timeoutSeconds") or DEFAULT_CONTROL_TIMEOUT_SECONDS)
+        endpoint = control["endpoint"]
+        app_id = control["appId"]
+        timeout_seconds = control["timeoutSeconds"]
         rc, response, error_text = _request_ipc_v0(
             endpoint,
             {"method": "config.get", "params": {"appId": app_id}},
@@ -2804,9 +2968,9 @@ class MonitorApp:
         control = self._ipc_control_for_runtime(runtime)
         if control is None:
             return 2, "ipc control is not configured"
-        endpoint = str(control.get("endpoint") or "")
-        app_id = str(control.get("appId") or "")
-        timeout_seconds = float(control.get("timeoutSeconds") or DEFAULT_CONTROL_TIMEOUT_SECONDS)
+        endpoint = control["endpoint"]
+        app_id = control["appId"]
+        timeout_seconds = control["timeoutSeconds"]
         rc, response, error_text = _request_ipc_v0(
             endpoint,
             {"method": "config.set", "params": {"appId": app_id, "key": key, "value": value}},
@@ -2924,7 +3088,7 @@ class MonitorApp:
         show_action = str(editor.get("showAction") or "").strip()
         payload, load_error = self._load_config_payload(target_id, show_action)
         if payload is None:
-            self.root.after(0, lambda: self._finalize_config_editor_load(editor, [], "", load_error))
+            self._post_ui(lambda: self._finalize_config_editor_load(editor, [], "", load_error))
             return
 
         path_value = ""
@@ -2946,7 +3110,7 @@ class MonitorApp:
         entries_raw = payload.get("entries")
         entries = entries_raw if isinstance(entries_raw, list) else []
         filtered = self._filter_config_editor_entries(entries, editor)
-        self.root.after(0, lambda: self._finalize_config_editor_load(editor, filtered, path_value, ""))
+        self._post_ui(lambda: self._finalize_config_editor_load(editor, filtered, path_value, ""))
 
     def _filter_config_editor_entries(self, entries: list[Any], editor: dict[str, Any]) -> list[dict[str, Any]]:
         path_key = str(editor.get("pathKey") or "").strip()
@@ -3147,11 +3311,11 @@ class MonitorApp:
         def run_set() -> None:
             rc, error_text = self._set_config_value(target_id, set_action, key, set_value)
             if rc != 0:
-                self.root.after(0, lambda: validation_var.set(error_text))
+                self._post_ui(lambda: validation_var.set(error_text))
                 return
-            self.root.after(0, lambda: validation_var.set("saved"))
+            self._post_ui(lambda: validation_var.set("saved"))
             self._mark_target_config_widgets_for_refresh(target_id)
-            self.root.after(0, lambda: self._refresh_target_config_widgets(target_id, show_loading=False))
+            self._post_ui(lambda: self._refresh_target_config_widgets(target_id, show_loading=False))
             self._refresh_async()
 
         threading.Thread(target=run_set, daemon=True).start()
@@ -3427,16 +3591,18 @@ class MonitorApp:
             widget.insert(tk.END, content + "\n")
             widget.configure(state=tk.DISABLED)
 
-    def _rows_table_column_value(self, row_payload: Any, column: dict[str, Any]) -> Any | None:
+    @staticmethod
+    def _rows_table_column_getter(column: Any) -> Callable[[Any], Any | None]:
+        # Resolved once per table refresh, then applied to every row.
+        if not isinstance(column, dict):
+            return _missing_value
         key = str(column.get("key") or "").strip()
         if key:
-            if isinstance(row_payload, dict):
-                return row_payload.get(key)
-            return None
+            return lambda row_payload: row_payload.get(key) if isinstance(row_payload, dict) else None
         jsonpath = str(column.get("jsonpath") or "").strip()
         if jsonpath:
-            return json_path_get(row_payload, jsonpath)
-        return None
+            return compile_json_path(jsonpath)
+        return _missing_value
 
     def _refresh_rows_tables(self, runtime: dict[str, Any], payload: dict[str, Any]) -> None:
         tables = runtime.get("rowsTables")
@@ -3456,15 +3622,10 @@ class MonitorApp:
             max_rows = max(1, int(table.get("maxRows", 200)))
             visible_rows = rows[:max_rows]
 
-            rendered_rows: list[tuple[str, ...]] = []
-            for row_payload in visible_rows:
-                values: list[str] = []
-                for column in columns:
-                    if not isinstance(column, dict):
-                        values.append("-")
-                        continue
-                    values.append(render_value(self._rows_table_column_value(row_payload, column)))
-                rendered_rows.append(tuple(values))
+            getters = [self._rows_table_column_getter(column) for column in columns]
+            rendered_rows: list[tuple[str, ...]] = [
+                tuple(render_value(getter(row_payload)) for getter in getters) for row_payload in visible_rows
+            ]
 
             signature = tuple(rendered_rows)
             if signature != table.get("lastSignature"):
@@ -3504,6 +3665,37 @@ class MonitorApp:
         delay_ms = int(max(MIN_REFRESH_TICK_SECONDS, 0.25) * 1000)
         self.root.after(delay_ms, self._schedule_refresh)
 
+    def _post_ui(self, callback: Any, *, key: Any = None) -> None:
+        # Worker threads hand UI work to one periodic drain instead of scheduling a Tk callback each.
+        # Keyed ops coalesce: only the latest callback for a key runs on the next drain.
+        if key is None:
+            self._pending_ui_ops.put(callback)
+            return
+        with self._ui_ops_lock:
+            first = key not in self._keyed_ui_ops
+            self._keyed_ui_ops[key] = callback
+        if first:
+            self._pending_ui_ops.put(lambda: self._run_keyed_ui_op(key))
+
+    def _run_keyed_ui_op(self, key: Any) -> None:
+        with self._ui_ops_lock:
+            callback = self._keyed_ui_ops.pop(key, None)
+        if callback is not None:
+            callback()
+
+    def _drain_ui_ops(self) -> None:
+        for _ in range(UI_DRAIN_MAX_OPS):
+            try:
+                callback = self._pending_ui_ops.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback()
+            except Exception:
+                self.root.report_callback_exception(*sys.exc_info())
+        if not self.stop_event.is_set():
+            self.root.after(UI_DRAIN_MS, self._drain_ui_ops)
+
     def _refresh_async(self) -> None:
         if self.refresh_lock.locked():
             return
@@ -3529,48 +3721,68 @@ class MonitorApp:
             if not due_targets:
                 return
 
-            with ThreadPoolExecutor(max_workers=max(1, len(due_targets))) as executor:
-                futures = [executor.submit(self._refresh_target, target) for target in due_targets]
-                for future in futures:
-                    future.result()
-
-            self.root.after(0, lambda: self.console_var.set(time.strftime("%H:%M:%S") + " refreshed"))
+            local_targets: list[dict[str, Any]] = []
+            ipc_targets: list[tuple[dict[str, Any], dict[str, Any]]] = []
+            for target in due_targets:
+                runtime = self.target_runtime.get(str(target.get("id") or ""))
+                control = self._ipc_control_for_runtime(runtime) if runtime is not None else None
+                if control is None:
+                    local_targets.append(target)
+                else:
+                    ipc_targets.append((target, control))
+
+            # IPC status calls are pure socket waits: run them as one gather on the shared loop
+            # and keep pool threads for targets that shell out to a local status_get command.
+            futures = [self._refresh_pool.submit(self._refresh_target_local, target) for target in local_targets]
+            if ipc_targets:
+                futures.append(asyncio.run_coroutine_threadsafe(self._refresh_ipc_targets(ipc_targets), self._aio_loop))
+            wait(futures)
+            for future in futures:
+                future.result()
+
+            self._post_ui(lambda: self.console_var.set(time.strftime("%H:%M:%S") + " refreshed"))
         except Exception as ex:
-            self.root.after(0, lambda: self.console_var.set(f"refresh error: {ex}"))
+            self._post_ui(lambda: self.console_var.set(f"refresh error: {ex}"))
         finally:
             self.refresh_lock.release()
 
-    def _refresh_target(self, target: dict[str, Any]) -> None:
+    def _refresh_target_local(self, target: dict[str, Any]) -> None:
         tid = str(target.get("id") or "")
         runtime = self.target_runtime.get(tid)
         if runtime is None:
             return
 
-        control = self._ipc_control_for_runtime(runtime)
-        if control is None:
-            payload: dict[str, Any] | None = None
-            error_message = ""
-            if self._has_local_action_command(target, "status_get"):
-                rc, stdout, stderr, command_error = self._run_named_action_command(tid, "status_get")
-                if command_error:
-                    error_message = command_error
-                elif rc != 0:
-                    error_message = (stderr or stdout or f"status_get failed rc={rc}").strip()
-                else:
-                    parsed, parse_error = try_extract_json_object(stdout)
-                    if isinstance(parsed, dict):
-                        payload = parsed
-                    else:
-                        error_message = parse_error or "status_get returned invalid payload"
+        payload: dict[str, Any] | None = None
+        error_message = ""
+        if self._has_local_action_command(target, "status_get"):
+            rc, stdout, stderr, command_error = self._run_named_action_command(tid, "status_get")
+            if command_error:
+                error_message = command_error
+            elif rc != 0:
+                error_message = (stderr or stdout or f"status_get failed rc={rc}").strip()
             else:
-                error_message = "ipc control is not configured"
+                parsed, parse_error = try_extract_json_object(stdout)
+                if isinstance(parsed, dict):
+                    payload = parsed
+                else:
+                    error_message = parse_error or "status_get returned invalid payload"
+        else:
+            error_message = "ipc control is not configured"
 
-            if payload is not None:
-                runtime["lastGoodStatus"] = payload
-                runtime["lastStatusError"] = None
-            else:
-                self._set_status_error(tid, error_message or "status_get failed")
-            self._render_target_status(tid)
+        if payload is not None:
+            runtime["lastGoodStatus"] = payload
+            runtime["lastStatusError"] = None
+        else:
+            self._set_status_error(tid, error_message or "status_get failed")
+        self._render_target_status(tid)
+
+    async def _refresh_ipc_targets(self, ipc_targets: list[tuple[dict[str, Any], dict[str, Any]]]) -> None:
+        await asyncio.gather(*(self._refresh_target_ipc(target, control) for target, control in ipc_targets))
+
+    async def _refresh_target_ipc(self, target: dict[str, Any], control: dict[str, Any]) -> None:
+        tid = str(target.get("id") or "")
+        runtime = self.target_runtime.get(tid)
+        if runtime is None:
             return
 
         status = target.get("status")
@@ -3580,16 +3792,16 @@ class MonitorApp:
                 status_timeout = float(status.get("timeoutSeconds") or 0.0)
             except Exception:
                 status_timeout = 0.0
-        timeout_seconds = float(
-            status_timeout or control.get("timeoutSeconds") or self.default_command_timeout_seconds
+        timeout_seconds = (
+            status_timeout or control["configuredTimeoutSeconds"] or self.default_command_timeout_seconds
         )
-        endpoint = str(control.get("endpoint") or "")
-        app_id = str(control.get("appId") or "")
+        endpoint = control["endpoint"]
+        app_id = control["appId"]
 
         payload: dict[str, Any] | None = None
         error_message = ""
         try:
-            rc, response_obj, error_text = _request_ipc_v0(
+            rc, response_obj, error_text = await _request_ipc_v0_async(
                 endpoint,
                 {"method": "status.get", "params": {"appId": app_id}},
                 timeout_seconds=timeout_seconds,
@@ -3619,6 +3831,41 @@ class MonitorApp:
             return
         runtime["lastStatusError"] = {"ts": utc_now_iso(), "message": message}
 
+    def _build_render_plan(self, runtime: dict[str, Any]) -> dict[str, list[Any]]:
+        # Resolve selector dicts into flat tuples once so each status render only walks prepared entries.
+        profile_plan: list[tuple[Any, ...]] = []
+        for selector in list(runtime.get("profileSelectors") or []):
+            if not isinstance(selector, dict):
+                continue
+            combo = selector.get("combo")
+            current_var = selector.get("currentVar")
+            selected_var = selector.get("selectedVar")
+            profile_plan.append(
+                (
+                    compile_json_path(str(selector.get("optionsPath") or "")),
+                    compile_json_path(str(selector.get("currentPath") or "")),
+                    combo if isinstance(combo, ttk.Combobox) else None,
+                    current_var if isinstance(current_var, tk.StringVar) else None,
+                    selected_var if isinstance(selected_var, tk.StringVar) else None,
+                    str(selector.get("emptyLabel") or "Select profile"),
+                )
+            )
+        action_refresh_fns = [
+            selector.get("refreshFn")
+            for selector in list(runtime.get("actionSelectors") or [])
+            if isinstance(selector, dict) and callable(selector.get("refreshFn"))
+        ]
+        bindings = list(runtime.get("bindings") or [])
+        plan = {
+            "bindings": bindings,
+            # Last text pushed into each bound StringVar, so unchanged fields skip the Tcl round-trip.
+            "bindingTexts": [None] * len(bindings),
+            "profileSelectors": profile_plan,
+            "actionRefreshFns": action_refresh_fns,
+        }
+        runtime["renderPlan"] = plan
+        return plan
+
     def _render_target_status(self, target_id: str) -> None:
         runtime = self.target_runtime.get(target_id)
         if runtime is None:
@@ -3626,46 +3873,51 @@ class MonitorApp:
 
         status_payload = runtime.get("lastGoodStatus")
         payload = status_payload if isinstance(status_payload, dict) else {}
-        bindings = list(runtime.get("bindings") or [])
-        profile_selectors = list(runtime.get("profileSelectors") or [])
-        action_selectors = list(runtime.get("actionSelectors") or [])
+        plan = runtime.get("renderPlan")
+        if not isinstance(plan, dict):
+            plan = self._build_render_plan(runtime)
+        bindings = plan["bindings"]
+        binding_texts = plan["bindingTexts"]
+        profile_plan = plan["profileSelectors"]
+        action_refresh_fns = plan["actionRefreshFns"]
         error_obj = runtime.get("lastStatusError")
 
         def update() -> None:
             self._refresh_action_catalog_async(target_id, force=False)
-            for path, var in bindings:
-                value = json_path_get(payload, str(path))
-                var.set(render_value(value))
-            for selector in profile_selectors:
-                if not isinstance(selector, dict):
-                    continue
-                options_path = str(selector.get("optionsPath") or "")
-                current_path = str(selector.get("currentPath") or "")
-                options_raw = json_path_get(payload, options_path)
+            # compile_json_path hands out one getter per path, so keying on the getter
+            # dedupes paths that several widgets bind within this render.
+            resolved: dict[Any, Any] = {}
+
+            def lookup(getter: Any) -> Any:
+                try:
+                    return resolved[getter]
+                except KeyError:
+                    value = resolved[getter] = getter(payload)
+                    return value
+
+            for index, (getter, var) in enumerate(bindings):
+                text = render_value(lookup(getter))
+                if binding_texts[index] != text:
+                    binding_texts[index] = text
+                    var.set(text)
+            for options_getter, current_getter, combo, current_var, selected_var, empty_label in profile_plan:
+                options_raw = lookup(options_getter)
                 options = [str(item) for item in options_raw] if isinstance(options_raw, list) else []
-                combo = selector.get("combo")
-                empty_label = str(selector.get("emptyLabel") or "Select profile")
-                if isinstance(combo, ttk.Combobox):
+                if combo is not None:
                     combo["values"] = options if options else [empty_label]
-                current_value = json_path_get(payload, current_path)
+                current_value = lookup(current_getter)
                 current_text = str(current_value) if current_value is not None else "-"
-                current_var = selector.get("currentVar")
-                if isinstance(current_var, tk.StringVar):
+                if current_var is not None:
                     current_var.set(current_text)
-                selected_var = selector.get("selectedVar")
-                if isinstance(selected_var, tk.StringVar) and options:
+                if selected_var is not None and options:
                     selected = str(selected_var.get() or "").strip()
                     if (not selected or selected == empty_label) and current_text in options:
                         selected_var.set(current_text)
-            for selector in action_selectors:
-                if not isinstance(selector, dict):
-                    continue
-                refresh_fn = selector.get("refreshFn")
-                if callable(refresh_fn):
-                    try:
-                        refresh_fn(payload)
-                    except Exception:
-                        pass
+            for refresh_fn in action_refresh_fns:
+                try:
+                    refresh_fn(payload)
+                except Exception:
+                    pass
             banner_var = runtime.get("bannerVar")
             if isinstance(banner_var, tk.StringVar):
                 if isinstance(error_obj, dict):
@@ -3679,7 +3931,7 @@ class MonitorApp:
             self._refresh_config_file_selectors(runtime)
             self._refresh_config_editors(runtime, payload)
 
-        self.root.after(0, update)
+        self._post_ui(update, key=("status", target_id))
 
     def _apply_log_render(self, target_id: str, stream: str, content: str, active_path: str) -> None:
         runtime = self.target_runtime.get(target_id)
@@ -3710,7 +3962,7 @@ class MonitorApp:
             if isinstance(path_var, tk.StringVar):
                 path_var.set(active_path or "-")
 
-    def _run_action_ipc(
+    async def _run_action_ipc(
         self,
         target_id: str,
         action: dict[str, Any],
@@ -3725,11 +3977,11 @@ class MonitorApp:
             self._append_action_output(target_id, "system", "ipc control is not configured")
             return
 
-        endpoint = str(control.get("endpoint") or "")
-        app_id = str(control.get("appId") or "")
-        timeout_seconds = float(control.get("timeoutSeconds") or DEFAULT_CONTROL_TIMEOUT_SECONDS)
-        job_poll_ms = int(control.get("jobPollMs") or DEFAULT_CONTROL_JOB_POLL_MS)
-        job_timeout_seconds = float(control.get("jobTimeoutSeconds") or DEFAULT_CONTROL_JOB_TIMEOUT_SECONDS)
+        endpoint = control["endpoint"]
+        app_id = control["appId"]
+        timeout_seconds = control["timeoutSeconds"]
+        job_poll_ms = control["jobPollMs"]
+        job_timeout_seconds = control["jobTimeoutSeconds"]
 
         action_name = str(action.get("name") or "")
         action_label = str(action.get("label") or action_name)
@@ -3743,9 +3995,9 @@ class MonitorApp:
             resolved_args["value"] = str(action_value)
 
         self._append_action_output(target_id, "system", f"running {action_label} via ipc")
-        self.root.after(0, lambda: self.console_var.set(f"running action: {action_label}"))
+        self._post_ui(lambda: self.console_var.set(f"running action: {action_label}"))
 
-        rc, invoke_response, invoke_error = _request_ipc_v0(
+        rc, invoke_response, invoke_error = await _request_ipc_v0_async(
             endpoint,
             {
                 "method": "action.invoke",
@@ -3759,27 +4011,31 @@ class MonitorApp:
         )
         if rc != 0:
             self._append_action_output(target_id, "system", f"{action_label}: invoke failed: {invoke_error}")
-            self.root.after(0, lambda: self.console_var.set(f"action failed: {action_label}"))
+            self._post_ui(lambda: self.console_var.set(f"action failed: {action_label}"))
             return
 
         invoke_body = invoke_response.get("response")
         job_id = str(invoke_body.get("jobId") or "") if isinstance(invoke_body, dict) else ""
         if not job_id:
             self._append_action_output(target_id, "system", f"{action_label}: invoke returned no job id")
-            self.root.after(0, lambda: self.console_var.set(f"action failed: {action_label}"))
+            self._post_ui(lambda: self.console_var.set(f"action failed: {action_label}"))
             return
 
         start_time = time.time()
         terminal_states = {"succeeded", "failed", "timeout", "cancelled", "error"}
+        base_interval = max(0.05, float(job_poll_ms) / 1000.0)
+        max_interval = base_interval * CONTROL_JOB_POLL_MAX_FACTOR
+        interval = base_interval
+        prev_state = ""
         while True:
-            poll_rc, poll_response, poll_error = _request_ipc_v0(
+            poll_rc, poll_response, poll_error = await _request_ipc_v0_async(
                 endpoint,
                 {"method": "action.job.get", "params": {"appId": app_id, "jobId": job_id}},
                 timeout_seconds=timeout_seconds,
             )
             if poll_rc != 0:
                 self._append_action_output(target_id, "system", f"{action_label}: job poll failed: {poll_error}")
-                self.root.after(0, lambda: self.console_var.set(f"action failed: {action_label}"))
+                self._post_ui(lambda: self.console_var.set(f"action failed: {action_label}"))
                 return
 
             poll_body = poll_response.get("response")
@@ -3796,10 +4052,10 @@ class MonitorApp:
 
                 if state == "succeeded":
                     self._append_action_output(target_id, "system", f"{action_label}: finished state={state}")
-                    self.root.after(0, lambda: self.console_var.set(f"action done: {action_label}"))
+                    self._post_ui(lambda: self.console_var.set(f"action done: {action_label}"))
                 else:
                     self._append_action_output(target_id, "system", f"{action_label}: finished state={state}")
-                    self.root.after(0, lambda: self.console_var.set(f"action failed: {action_label}"))
+                    self._post_ui(lambda: self.console_var.set(f"action failed: {action_label}"))
                 return
 
             if (time.time() - start_time) >= job_timeout_seconds:
@@ -3808,9 +4064,16 @@ class MonitorApp:
                     "system",
                     f"{action_label}: job timeout after {job_timeout_seconds:.1f}s",
                 )
-                self.root.after(0, lambda: self.console_var.set(f"action timeout: {action_label}"))
+                self._post_ui(lambda: self.console_var.set(f"action timeout: {action_label}"))
                 return
-            time.sleep(max(0.05, float(job_poll_ms) / 1000.0))
+            # Back off while the job sits in one state; poll at the base rate again after a transition.
+            if state != prev_state:
+                interval = base_interval
+                prev_state = state
+            else:
+                interval = min(interval * CONTROL_JOB_POLL_BACKOFF, max_interval)
+            remaining = job_timeout_seconds - (time.time() - start_time)
+            await asyncio.sleep(max(0.05, min(interval, remaining)))
 
     def _run_action(
         self,
@@ -3824,7 +4087,7 @@ class MonitorApp:
         mutex_name = str(action.get("mutex") or "").strip()
         lock: threading.Lock | None = None
         if mutex_name:
-            lock = self.action_mutexes.setdefault(mutex_name, threading.Lock())
+            lock = self.action_mutexes[mutex_name]
 
         if lock is not None:
             lock.acquire()
@@ -3838,13 +4101,14 @@ class MonitorApp:
                         resolved_action_args[key_text] = str(value)
             if action_value is not None and "value" not in resolved_action_args:
                 resolved_action_args["value"] = str(action_value)
-            if resolved_action_args:
+            # Actions loaded from config know up front whether any placeholder scan is needed.
+            has_placeholders = bool(action.get("hasPlaceholders", True))
+            if has_placeholders and resolved_action_args:
                 cmd = _apply_action_placeholders(cmd, resolved_action_args)
             if not cmd:
                 self._append_action_output(target_id, "system", f"{action_label}: empty command")
                 return
-            unresolved_cmd = [part for part in cmd if re.search(r"{[A-Za-z0-9_]+}", part)]
-            if unresolved_cmd:
+            if has_placeholders and any(_has_unresolved_placeholder(part) for part in cmd):
                 self._append_action_output(
                     target_id,
                     "system",
@@ -3853,9 +4117,9 @@ class MonitorApp:
                 return
 
             cwd_text = str(action.get("cwd") or "").strip()
-            if cwd_text and resolved_action_args:
+            if has_placeholders and cwd_text and resolved_action_args:
                 cwd_text = _apply_action_placeholders([cwd_text], resolved_action_args)[0]
-            if cwd_text and re.search(r"{[A-Za-z0-9_]+}", cwd_text):
+            if has_placeholders and cwd_text and _has_unresolved_placeholder(cwd_text):
                 self._append_action_output(
                     target_id,
                     "system",
@@ -3867,7 +4131,7 @@ class MonitorApp:
             detached = bool(action.get("detached", False))
 
             self._append_action_output(target_id, "system", f"running {action_label}: {' '.join(cmd)}")
-            self.root.after(0, lambda: self.console_var.set(f"running action: {action_label}"))
+            self._post_ui(lambda: self.console_var.set(f"running action: {action_label}"))
 
             if detached:
                 subprocess.Popen(
@@ -3876,7 +4140,7 @@ class MonitorApp:
                     creationflags=_no_window_creationflags(),
                 )
                 self._append_action_output(target_id, "system", f"{action_label}: detached process started")
-                self.root.after(0, lambda: self.console_var.set(f"started(detached): {action_label}"))
+                self._post_ui(lambda: self.console_var.set(f"started(detached): {action_label}"))
                 return
 
             process = subprocess.Popen(
@@ -3884,34 +4148,15 @@ class MonitorApp:
                 cwd=str(cwd) if cwd else None,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
+                bufsize=0,
                 creationflags=_no_window_creationflags(),
             )
 
-            stdout_thread = threading.Thread(
-                target=self._drain_action_stream,
-                args=(target_id, "stdout", process.stdout),
-                daemon=True,
-            )
-            stderr_thread = threading.Thread(
-                target=self._drain_action_stream,
-                args=(target_id, "stderr", process.stderr),
-                daemon=True,
-            )
-            stdout_thread.start()
-            stderr_thread.start()
-
-            timed_out = False
-            try:
-                rc = process.wait(timeout=timeout_seconds)
-            except subprocess.TimeoutExpired:
-                timed_out = True
-                process.kill()
-                rc = process.wait()
-
-            stdout_thread.join(timeout=2.0)
-            stderr_thread.join(timeout=2.0)
+            if os.name == "nt":
+                timed_out = self._wait_action_threaded(target_id, process, timeout_seconds)
+            else:
+                timed_out = self._wait_action_selector(target_id, process, timeout_seconds)
+            rc = process.wait()
 
             if timed_out:
                 self._append_action_output(
@@ -3919,25 +4164,103 @@ class MonitorApp:
                     "system",
                     f"{action_label}: timeout after {timeout_seconds:.1f}s (rc={rc})",
                 )
-                self.root.after(0, lambda: self.console_var.set(f"action timeout: {action_label}"))
+                self._post_ui(lambda: self.console_var.set(f"action timeout: {action_label}"))
             else:
                 self._append_action_output(target_id, "system", f"{action_label}: finished rc={rc}")
-                self.root.after(0, lambda: self.console_var.set(f"action done: {action_label} rc={rc}"))
+                self._post_ui(lambda: self.console_var.set(f"action done: {action_label} rc={rc}"))
         except Exception as ex:
             self._append_action_output(target_id, "system", f"{action_label}: failed: {ex}")
-            self.root.after(0, lambda: self.console_var.set(f"action failed: {action_label}"))
+            self._post_ui(lambda: self.console_var.set(f"action failed: {action_label}"))
         finally:
             if lock is not None:
                 lock.release()
 
+    def _wait_action_selector(self, target_id: str, process: subprocess.Popen, timeout_seconds: float) -> bool:
+        # POSIX: multiplex both pipes on the action thread instead of one drain thread per pipe.
+        deadline = time.monotonic() + timeout_seconds
+        drain_deadline: float | None = None
+        timed_out = False
+        partial: dict[str, bytes] = {}
+        selector = selectors.DefaultSelector()
+        for stream_name, handle in (("stdout", process.stdout), ("stderr", process.stderr)):
+            if handle is not None:
+                selector.register(handle, selectors.EVENT_READ, stream_name)
+                partial[stream_name] = b""
+        try:
+            while selector.get_map():
+                now = time.monotonic()
+                if not timed_out and now >= deadline and process.poll() is None:
+                    timed_out = True
+                    process.kill()
+                if drain_deadline is None and process.poll() is not None:
+                    drain_deadline = now + 2.0
+                if drain_deadline is not None and now >= drain_deadline:
+                    break
+                for key, _ in selector.select(0.1):
+                    stream_name = key.data
+                    chunk = os.read(key.fd, 65536)
+                    if not chunk:
+                        selector.unregister(key.fileobj)
+                        if partial[stream_name]:
+                            self._append_action_output(target_id, stream_name, _decode_action_line(partial[stream_name]))
+                            partial[stream_name] = b""
+                        continue
+                    *lines, partial[stream_name] = (partial[stream_name] + chunk).split(b"\n")
+                    for raw in lines:
+                        self._append_action_output(target_id, stream_name, _decode_action_line(raw))
+        finally:
+            selector.close()
+            for handle in (process.stdout, process.stderr):
+                if handle is not None:
+                    try:
+                        handle.close()
+                    except Exception:
+                        pass
+        if not timed_out:
+            # Both pipes can reach EOF long before the child exits (e.g. `exec >log 2>&1`);
+            # the deadline still applies to the process itself.
+            try:
+                process.wait(timeout=max(0.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                timed_out = True
+                process.kill()
+        return timed_out
+
+    def _wait_action_threaded(self, target_id: str, process: subprocess.Popen, timeout_seconds: float) -> bool:
+        # Windows pipes cannot be registered with a selector; keep one drain thread per pipe.
+        stdout_thread = threading.Thread(
+            target=self._drain_action_stream,
+            args=(target_id, "stdout", process.stdout),
+            daemon=True,
+        )
+        stderr_thread = threading.Thread(
+            target=self._drain_action_stream,
+            args=(target_id, "stderr", process.stderr),
+            daemon=True,
+        )
+        stdout_thread.start()
+        stderr_thread.start()
+
+        timed_out = False
+        try:
+            process.wait(timeout=timeout_seconds)
+        except subprocess.TimeoutExpired:
+            timed_out = True
+            process.kill()
+            process.wait()
+
+        stdout_thread.join(timeout=2.0)
+        stderr_thread.join(timeout=2.0)
+        return timed_out
+
     def _drain_action_stream(self, target_id: str, stream_name: str, handle: Any) -> None:
         if handle is None:
             return
         try:
-            for line in iter(handle.readline, ""):
+            for line in iter(handle.readline, b""):
                 if not line:
                     break
-                self._append_action_output(target_id, stream_name, line.rstrip("\r\n"))
+                self._append_action_output(target_id, stream_name, _decode_action_line(line))
         finally:
             try:
                 handle.close()
@@ -3951,25 +4274,83 @@ class MonitorApp:
         buffer = runtime.get("actionOutputBuffer")
         if not isinstance(buffer, ActionOutputBuffer):
             return
-        snapshot, line = buffer.append(stream, text)
+        line = buffer.append(stream, text)
+        with self._action_output_file_lock:
+            handle = self._action_output_handle(runtime)
+            if handle is not None:
+                try:
+                    handle.write(line + "\n")
+                except Exception:
+                    pass
+        runtime["actionOutputPending"].put(line)
+        self._post_ui(lambda: self._flush_action_output(target_id), key=("actionOutput", target_id))
+
+    def _action_output_handle(self, runtime: dict[str, Any]) -> Any | None:
+        handle = runtime.get("actionOutputHandle")
+        if handle is not None:
+            return handle
         output_path = runtime.get("actionOutputPath")
-        if isinstance(output_path, Path):
+        if not isinstance(output_path, Path):
+            return None
+        try:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            handle = output_path.open("a", encoding="utf-8", buffering=65536)
+        except Exception:
+            return None
+        runtime["actionOutputHandle"] = handle
+        return handle
+
+    def _close_action_output_handle(self, runtime: dict[str, Any]) -> None:
+        with self._action_output_file_lock:
+            handle = runtime.pop("actionOutputHandle", None)
+            if handle is None:
+                return
             try:
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                with output_path.open("a", encoding="utf-8") as handle:
-                    handle.write(line + "\n")
+                handle.close()
             except Exception:
                 pass
-        widget = runtime.get("actionOutputWidget")
-        if not isinstance(widget, tk.Text):
-            return
 
-        def update() -> None:
-            widget.delete("1.0", tk.END)
-            widget.insert(tk.END, snapshot + "\n")
-            widget.see(tk.END)
+    def _drain_action_output_pending(self, runtime: dict[str, Any]) -> list[str]:
+        pending = runtime.get("actionOutputPending")
+        lines: list[str] = []
+        if not isinstance(pending, queue.SimpleQueue):
+            return lines
+        while True:
+            try:
+                lines.append(pending.get_nowait())
+            except queue.Empty:
+                return lines
 
-        self.root.after(0, update)
+    def _flush_action_output(self, target_id: str) -> None:
+        runtime = self.target_runtime.get(target_id)
+        if runtime is None:
+            return
+        with self._action_output_file_lock:
+            handle = runtime.get("actionOutputHandle")
+            if handle is not None:
+                try:
+                    handle.flush()
+                except Exception:
+                    pass
+        lines = self._drain_action_output_pending(runtime)
+        widget = runtime.get("actionOutputWidget")
+        if not lines or not isinstance(widget, tk.Text):
+            return
+        text = "\n".join(lines)
+        widget.insert(tk.END, text + "\n")
+        buffer = runtime.get("actionOutputBuffer")
+        if isinstance(buffer, ActionOutputBuffer):
+            # Trim by both caps, so a few very long lines cannot keep more than maxBytes on screen.
+            excess, runtime["actionOutputWidgetBytes"] = _trim_shown_lines(
+                runtime.setdefault("actionOutputWidgetSizes", deque()),
+                int(runtime.get("actionOutputWidgetBytes") or 0),
+                text,
+                max_lines=buffer.max_lines,
+                max_bytes=buffer.max_bytes,
+            )
+            if excess > 0:
+                widget.delete("1.0", f"{excess + 1}.0")
+        widget.see(tk.END)
 
     def _clear_action_output(self, target_id: str) -> None:
         runtime = self.target_runtime.get(target_id)
@@ -3978,16 +4359,28 @@ class MonitorApp:
         buffer = runtime.get("actionOutputBuffer")
         if isinstance(buffer, ActionOutputBuffer):
             buffer.clear()
-        output_path = runtime.get("actionOutputPath")
-        if isinstance(output_path, Path):
+        self._drain_action_output_pending(runtime)
+        with self._action_output_file_lock:
+            handle = runtime.get("actionOutputHandle")
+            output_path = runtime.get("actionOutputPath")
             try:
-                output_path.write_text("", encoding="utf-8")
+                if handle is not None:
+                    # Truncate in place under the write lock so no append can land between clear and reopen.
+                    handle.flush()
+                    os.ftruncate(handle.fileno(), 0)
+                    handle.seek(0)
+                elif isinstance(output_path, Path):
+                    output_path.write_text("", encoding="utf-8")
             except Exception:
                 pass
         widget = runtime.get("actionOutputWidget")
         if isinstance(widget, tk.Text):
             widget.delete("1.0", tk.END)
             widget.insert(tk.END, "(cleared)\n")
+            runtime["actionOutputWidgetSizes"] = deque()
+            _, runtime["actionOutputWidgetBytes"] = _trim_shown_lines(
+                runtime["actionOutputWidgetSizes"], 0, "(cleared)", max_lines=2, max_bytes=1024
+            )
         self.console_var.set("Action output cleared.")
 
     def _relaunch_app(self) -> None:
@@ -4003,6 +4396,10 @@ class MonitorApp:
 
     def _on_close(self) -> None:
         self.stop_event.set()
+        self._refresh_pool.shutdown(wait=False, cancel_futures=True)
+        self._aio_loop.call_soon_threadsafe(self._aio_loop.stop)
+        for runtime in self.target_runtime.values():
+            self._close_action_output_handle(runtime)
         self.root.destroy()
 
 
@@ -4035,6 +4432,7 @@ def main() -> int:
 
     publisher = RuntimeProcessPublisher(str(args.repo_root or ""), str(args.app_id or ""))
     publisher.start()
+    _ensure_tk()
     root = tk.Tk()
     MonitorApp(root, config_path=config_path)
     root.mainloop()
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import functools
 import re
-from typing import Any
+from typing import Any, Callable
 
 from monitor_ipc import json_path_get
 
+_PLACEHOLDER_RE = re.compile(r"\{([^{}]+)\}")
+_UNRESOLVED_PLACEHOLDER_RE = re.compile(r"\{[A-Za-z0-9_]+\}")
+
 
 def _normalize_cmd(value: Any) -> list[str]:
     if not isinstance(value, list):
@@ -55,37 +59,69 @@ def _validate_action_arg_value(raw_value: str, arg_spec: dict[str, Any], options
     if options and text not in options:
         return None, f"{name}: value must be one of available options."
 
-    if arg_type == "int":
-        try:
-            return str(int(text)), None
-        except Exception:
-            return None, f"{name}: value must be an integer."
-    if arg_type == "float":
-        try:
-            return str(float(text)), None
-        except Exception:
-            return None, f"{name}: value must be a number."
-    if arg_type == "bool":
-        lowered = text.lower()
-        if lowered in {"true", "1", "yes", "y"}:
-            return "true", None
-        if lowered in {"false", "0", "no", "n"}:
-            return "false", None
-        return None, f"{name}: value must be true/false."
+    validator = _ARG_TYPE_VALIDATORS.get(arg_type, _validate_string_arg)
+    return validator(name, text, pattern)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_arg_pattern(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern)
+
+
+def _validate_int_arg(name: str, text: str, pattern: str) -> tuple[str | None, str | None]:
+    try:
+        return str(int(text)), None
+    except Exception:
+        return None, f"{name}: value must be an integer."
+
+
+def _validate_float_arg(name: str, text: str, pattern: str) -> tuple[str | None, str | None]:
+    try:
+        return str(float(text)), None
+    except Exception:
+        return None, f"{name}: value must be a number."
+
+
+def _validate_bool_arg(name: str, text: str, pattern: str) -> tuple[str | None, str | None]:
+    lowered = text.lower()
+    if lowered in _BOOL_TRUE_TEXT:
+        return "true", None
+    if lowered in _BOOL_FALSE_TEXT:
+        return "false", None
+    return None, f"{name}: value must be true/false."
 
+
+def _validate_string_arg(name: str, text: str, pattern: str) -> tuple[str | None, str | None]:
     if pattern:
         try:
-            if re.search(pattern, text) is None:
+            if _compile_arg_pattern(pattern).search(text) is None:
                 return None, f"{name}: value does not match required pattern."
         except re.error:
             return None, f"{name}: invalid regex pattern in action metadata."
-
     return text, None
 
 
+_BOOL_TRUE_TEXT = frozenset({"true", "1", "yes", "y"})
+_BOOL_FALSE_TEXT = frozenset({"false", "0", "no", "n"})
+_ARG_TYPE_VALIDATORS: dict[str, Callable[[str, str, str], tuple[str | None, str | None]]] = {
+    "int": _validate_int_arg,
+    "float": _validate_float_arg,
+    "bool": _validate_bool_arg,
+}
+
+
 def _apply_action_placeholders(parts: list[str], values: dict[str, str]) -> list[str]:
-    result = list(parts)
-    for key, value in values.items():
-        token = "{" + str(key) + "}"
-        result = [part.replace(token, str(value)) for part in result]
-    return result
+    lookup = {str(key): str(value) for key, value in values.items()}
+
+    def replace(match: re.Match[str]) -> str:
+        return lookup.get(match.group(1), match.group(0))
+
+    return [_PLACEHOLDER_RE.sub(replace, part) if "{" in part else part for part in parts]
+
+
+def _has_action_placeholders(cmd: list[str], cwd: str = "") -> bool:
+    return any(_PLACEHOLDER_RE.search(part) for part in cmd) or bool(_PLACEHOLDER_RE.search(cwd or ""))
+
+
+def _has_unresolved_placeholder(text: str) -> bool:
+    return _UNRESOLVED_PLACEHOLDER_RE.search(text) is not None
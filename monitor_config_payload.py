@@ -46,21 +46,21 @@ def _normalize_config_entries_payload(entries_raw: Any, paths: list[dict[str, An
     for item in entries_raw:
         if not isinstance(item, dict):
             continue
-        entry = dict(item)
-        key = str(entry.get("key") or "").strip()
+        key = str(item.get("key") or "").strip()
         if not key:
             continue
-        allowed = entry.get("allowed")
-        if not isinstance(allowed, list):
-            legacy_allowed = entry.get("allowedValues")
+        updates: dict[str, Any] = {}
+        if not isinstance(item.get("allowed"), list):
+            legacy_allowed = item.get("allowedValues")
             if isinstance(legacy_allowed, list):
-                entry["allowed"] = list(legacy_allowed)
+                updates["allowed"] = list(legacy_allowed)
         if key in path_values:
-            if not str(entry.get("path") or "").strip():
-                entry["path"] = path_values[key]
-            if "pathEntry" not in entry:
-                entry["pathEntry"] = True
-        normalized.append(entry)
+            if not str(item.get("path") or "").strip():
+                updates["path"] = path_values[key]
+            if "pathEntry" not in item:
+                updates["pathEntry"] = True
+        # Only entries that gain fields are copied; untouched entries are passed through as-is.
+        normalized.append({**item, **updates} if updates else item)
     return normalized
 
 
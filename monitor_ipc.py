@@ -2,53 +2,96 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
+import re
 import socket
-from typing import Any
+from typing import Any, Callable
 from urllib.parse import urlparse
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; the stdlib parser remains the reference behaviour
+    orjson = None
 
-def try_extract_json_object(output: str) -> tuple[dict[str, Any] | None, str]:
-    text = (output or "").strip()
+_JSON_OBJECT_START_RE = re.compile(r'\{[ \t\n\r]*["}]')
+_JSONPATH_TOKEN_RE = re.compile(r"\.([^.\[]+)|\[(\d+)\]")
+
+# The name lookup is reusable across requests. Connections are not: v0 is one
+# request per connection, and servers may hold the socket open after answering.
+_ENDPOINT_ADDRESSES: dict[tuple[str, int], list[tuple[Any, ...]]] = {}
+
+
+def _json_loads(text: str | bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (NaN, >64-bit ints); let json decide what is actually invalid.
+            pass
+    return json.loads(text)
+
+
+def try_extract_json_object(output: str | bytes, *, subject: str = "status output") -> tuple[dict[str, Any] | None, str]:
+    text = output.strip() if output else ""
     if not text:
-        return None, "empty status output"
+        return None, f"empty {subject}"
 
     try:
-        payload = json.loads(text)
+        payload = _json_loads(text)
         if isinstance(payload, dict):
             return payload, ""
-        return None, "status output is not a JSON object"
+        return None, f"{subject} is not a JSON object"
     except Exception:
         pass
 
-    first_brace = text.find("{")
-    if first_brace >= 0:
-        decoder = json.JSONDecoder()
-        best: dict[str, Any] | None = None
-        best_span = -1
-        for index, char in enumerate(text[first_brace:]):
-            if char != "{":
-                continue
-            try:
-                payload, end_index = decoder.raw_decode(text[first_brace + index :])
-            except Exception:
-                continue
-            if isinstance(payload, dict):
-                span = int(end_index)
-                if span > best_span:
-                    best = payload
-                    best_span = span
-        if best is not None:
-            return best, ""
+    if isinstance(text, bytes):
+        text = text.decode("utf-8", errors="replace")
+    # Every brace that can open a JSON object (followed by a key quote or '}') is tried,
+    # including ones inside an object already decoded: a '{' in a string value can start a
+    # longer object that runs past it. Decoding stops once no later start can span more.
+    decoder = json.JSONDecoder()
+    search = _JSON_OBJECT_START_RE.search
+    best: dict[str, Any] | None = None
+    best_span = -1
+    found = search(text)
+    while found is not None:
+        index = found.start()
+        try:
+            payload, end_index = decoder.raw_decode(text, index)
+        except Exception:
+            pass
+        else:
+            span = end_index - index
+            if isinstance(payload, dict) and span > best_span:
+                best = payload
+                best_span = span
+        if len(text) - (index + 1) <= best_span:
+            break
+        found = search(text, index + 1)
+    if best is not None:
+        return best, ""
 
-    return None, "failed to parse JSON object from status output"
+    return None, f"failed to parse JSON object from {subject}"
 
 
+@functools.lru_cache(maxsize=256)
 def _parse_endpoint(endpoint: str) -> tuple[str, int]:
+    # Endpoints come from a handful of target configs and are re-parsed on every request, so the
+    # result is memoized; invalid endpoints raise and are simply not cached.
     text = str(endpoint or "").strip()
     if not text:
         raise ValueError("endpoint is empty")
 
+    authority = text[6:]
+    if text[:6].lower() == "tcp://" and not any(ch in authority for ch in "[]@/?#"):
+        # Plain tcp://host:port: split it directly. Anything urlparse would treat specially
+        # (IPv6 brackets, userinfo, paths, odd ports) takes the general branch below.
+        host, sep, raw_port = authority.rpartition(":")
+        if sep and host and raw_port.isascii() and raw_port.isdigit():
+            return _checked_endpoint(host.lower(), int(raw_port))
+
     if "://" in text:
         parsed = urlparse(text)
         host = str(parsed.hostname or "").strip()
@@ -64,12 +107,109 @@ def _parse_endpoint(endpoint: str) -> tuple[str, int]:
         host, raw_port = text.rsplit(":", 1)
         host = host.strip() or "127.0.0.1"
         port = int(raw_port.strip())
+    return _checked_endpoint(host, port)
 
+
+def _checked_endpoint(host: str, port: int) -> tuple[str, int]:
     if port <= 0 or port > 65535:
         raise ValueError("endpoint port is out of range")
     return host, port
 
 
+def _endpoint_addresses(host: str, port: int) -> list[tuple[Any, ...]]:
+    key = (host, port)
+    addresses = _ENDPOINT_ADDRESSES.get(key)
+    if addresses is None:
+        addresses = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        _ENDPOINT_ADDRESSES[key] = addresses
+    return addresses
+
+
+def _connect_ipc(host: str, port: int, timeout: float) -> socket.socket:
+    last_error: Exception | None = None
+    for family, sock_type, proto, _, sockaddr in _endpoint_addresses(host, port):
+        sock = socket.socket(family, sock_type, proto)
+        try:
+            sock.settimeout(timeout)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.connect(sockaddr)
+            return sock
+        except OSError as ex:
+            last_error = ex
+            sock.close()
+    # Drop the cached lookup so the next attempt re-resolves the host.
+    _ENDPOINT_ADDRESSES.pop((host, port), None)
+    raise last_error or OSError(f"no address for {host}:{port}")
+
+
+def _exchange_ipc_line(sock: socket.socket, payload: bytes) -> bytes:
+    sock.sendall(payload)
+    buffer = bytearray()
+    newline_at = -1
+    while newline_at < 0:
+        chunk = sock.recv(8192)
+        if not chunk:
+            break
+        # Only the new chunk can contain the first newline.
+        search_from = len(buffer)
+        buffer += chunk
+        newline_at = buffer.find(b"\n", search_from)
+    if newline_at >= 0:
+        del buffer[newline_at:]
+    return bytes(buffer).strip()
+
+
+async def _endpoint_addresses_async(host: str, port: int) -> list[tuple[Any, ...]]:
+    # Same cache as _endpoint_addresses, but a miss resolves on the loop's executor so a slow
+    # lookup does not stall the other coroutines on the shared loop.
+    key = (host, port)
+    addresses = _ENDPOINT_ADDRESSES.get(key)
+    if addresses is None:
+        addresses = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        _ENDPOINT_ADDRESSES[key] = addresses
+    return addresses
+
+
+async def _open_ipc_connection(host: str, port: int) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    last_error: Exception | None = None
+    for family, _, _, _, sockaddr in await _endpoint_addresses_async(host, port):
+        try:
+            return await asyncio.open_connection(sockaddr[0], sockaddr[1], family=family)
+        except OSError as ex:
+            last_error = ex
+    _ENDPOINT_ADDRESSES.pop((host, port), None)
+    raise last_error or OSError(f"no address for {host}:{port}")
+
+
+async def _read_ipc_line(reader: asyncio.StreamReader) -> bytes:
+    # StreamReader.readline() gives up past the reader's 64 KiB limit; status and config
+    # replies can be larger, so read up to the newline without a cap, as the sync path does.
+    buffer = bytearray()
+    while True:
+        chunk = await reader.read(65536)
+        if not chunk:
+            return bytes(buffer)
+        newline_at = chunk.find(b"\n")
+        if newline_at >= 0:
+            buffer += chunk[:newline_at]
+            return bytes(buffer)
+        buffer += chunk
+
+
+def _parse_ipc_response_line(response_line: str | bytes) -> tuple[int, dict[str, Any], str]:
+    if not response_line:
+        return 2, {}, "ipc response is empty"
+    response_obj = _json_loads(response_line)
+    if not isinstance(response_obj, dict):
+        return 2, {}, "ipc response is not an object"
+    if bool(response_obj.get("ok", False)):
+        return 0, response_obj, ""
+    error_obj = response_obj.get("error")
+    if isinstance(error_obj, dict):
+        return 2, response_obj, str(error_obj.get("message") or "ipc request failed")
+    return 2, response_obj, "ipc request failed"
+
+
 def _request_ipc_v0(
     endpoint: str,
     request: dict[str, Any],
@@ -79,85 +219,111 @@ def _request_ipc_v0(
     try:
         host, port = _parse_endpoint(endpoint)
         payload = request if isinstance(request, dict) else {}
-        with socket.create_connection((host, port), timeout=max(0.1, float(timeout_seconds))) as sock:
-            sock.settimeout(max(0.1, float(timeout_seconds)))
-            sock.sendall((json.dumps(payload) + "\n").encode("utf-8"))
-            response_line = sock.makefile("r", encoding="utf-8", newline="\n").readline().strip()
-        if not response_line:
-            return 2, {}, "ipc response is empty"
-        response_obj = json.loads(response_line)
-        if not isinstance(response_obj, dict):
-            return 2, {}, "ipc response is not an object"
-        if bool(response_obj.get("ok", False)):
-            return 0, response_obj, ""
-        error_obj = response_obj.get("error")
-        if isinstance(error_obj, dict):
-            return 2, response_obj, str(error_obj.get("message") or "ipc request failed")
-        return 2, response_obj, "ipc request failed"
+        data = (json.dumps(payload) + "\n").encode("utf-8")
+        timeout = max(0.1, float(timeout_seconds))
+        # Sent once on a fresh connection: a request such as action.invoke is never replayed.
+        with _connect_ipc(host, port, timeout) as sock:
+            response_line = _exchange_ipc_line(sock, data)
+        return _parse_ipc_response_line(response_line)
+    except Exception as ex:
+        return 2, {}, f"ipc request failed: {ex}"
+
+
+async def _request_ipc_v0_async(
+    endpoint: str,
+    request: dict[str, Any],
+    *,
+    timeout_seconds: float,
+) -> tuple[int, dict[str, Any], str]:
+    timeout = max(0.1, float(timeout_seconds))
+    writer: asyncio.StreamWriter | None = None
+    try:
+        host, port = _parse_endpoint(endpoint)
+        payload = request if isinstance(request, dict) else {}
+        reader, writer = await asyncio.wait_for(_open_ipc_connection(host, port), timeout=timeout)
+        writer.write((json.dumps(payload) + "\n").encode("utf-8"))
+        await asyncio.wait_for(writer.drain(), timeout=timeout)
+        raw_line = await asyncio.wait_for(_read_ipc_line(reader), timeout=timeout)
+        return _parse_ipc_response_line(raw_line.strip())
+    except asyncio.TimeoutError:
+        return 2, {}, "ipc request failed: timed out"
     except Exception as ex:
         return 2, {}, f"ipc request failed: {ex}"
+    finally:
+        if writer is not None:
+            writer.close()
 
 
-def _iter_jsonpath_tokens(path: str) -> list[str | int] | None:
+@functools.lru_cache(maxsize=256)
+def _iter_jsonpath_tokens(path: str) -> tuple[str | int, ...] | None:
     text = str(path or "").strip()
     if not text.startswith("$"):
         return None
     if text == "$":
-        return []
+        return ()
 
     tokens: list[str | int] = []
     index = 1
     length = len(text)
+    match = _JSONPATH_TOKEN_RE.match
     while index < length:
-        current = text[index]
-        if current == ".":
-            index += 1
-            start = index
-            while index < length and text[index] not in ".[":
-                index += 1
-            key = text[start:index]
-            if not key:
-                return None
-            tokens.append(key)
-            continue
-
-        if current == "[":
-            index += 1
-            start = index
-            while index < length and text[index].isdigit():
-                index += 1
-            if start == index or index >= length or text[index] != "]":
-                return None
-            tokens.append(int(text[start:index]))
-            index += 1
-            continue
+        found = match(text, index)
+        if found is None:
+            return None
+        key, position = found.groups()
+        tokens.append(key if key is not None else int(position))
+        index = found.end()
 
-        return None
+    return tuple(tokens)
 
-    return tokens
 
+def _invalid_json_path(_: Any) -> None:
+    return None
 
-def json_path_get(payload: Any, path: str) -> Any | None:
-    tokens = _iter_jsonpath_tokens(path)
-    if tokens is None:
-        return None
 
-    node: Any = payload
-    for token in tokens:
-        if isinstance(token, int):
-            if not isinstance(node, list):
+@functools.lru_cache(maxsize=4096)
+def compile_json_path(path: str) -> Callable[[Any], Any | None]:
+    compiled = _iter_jsonpath_tokens(path)
+    if compiled is None:
+        return _invalid_json_path
+
+    if all(type(token) is str for token in compiled):
+        # Key-only paths (the common case) subscribe straight through decoded JSON: dict
+        # misses raise KeyError and lists/scalars raise TypeError, both meaning "absent".
+        def key_getter(payload: Any) -> Any | None:
+            node: Any = payload
+            try:
+                for token in compiled:
+                    node = node[token]
+            except (KeyError, TypeError):
                 return None
-            if token < 0 or token >= len(node):
+            return node
+
+        return key_getter
+
+    def getter(payload: Any) -> Any | None:
+        node: Any = payload
+        for token in compiled:
+            if isinstance(token, int):
+                if not isinstance(node, list):
+                    return None
+                if token < 0 or token >= len(node):
+                    return None
+                node = node[token]
+                continue
+
+            if not isinstance(node, dict):
+                return None
+            if token not in node:
                 return None
             node = node[token]
-            continue
+        return node
 
-        if not isinstance(node, dict):
-            return None
-        if token not in node:
-            return None
-        node = node[token]
-    return node
+    return getter
+
+
+def json_path_get(payload: Any, path: str) -> Any | None:
+    return compile_json_path(str(path or ""))(payload)
 
 
 def render_value(value: Any) -> str:
@@ -8,11 +8,27 @@ import json
 import re
 import subprocess
 import sys
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
 
+# Share the runtime's parsing/normalization helpers instead of carrying copies here.
+from monitor_actions import _normalize_cmd as normalize_cmd  # noqa: E402
+from monitor_config_payload import _normalize_config_entries_payload, _normalize_config_paths_payload  # noqa: E402
+from monitor_ipc import try_extract_json_object  # noqa: E402
+
+
+SUMMARY_PREFIX = "SUMMARY: "
 REQUIRED_TOP_TAB_TITLES = {"status", "config", "actions", "logs"}
+# Target files come from json.loads, so the tree walkers below compare exact types
+# (type(x) is dict) rather than paying for isinstance on every node.
+CONFIG_WIDGET_TYPES = frozenset({"config_editor", "config_file_select"})
+ACTION_WIDGET_TYPES = frozenset({"action_select", "action_map"})
 REQUIRED_BASE_STATUS_KEYS = (
     "interfaceName",
     "interfaceVersion",
@@ -24,140 +40,91 @@ REQUIRED_BASE_STATUS_KEYS = (
     "hostRunning",
     "hostPid",
 )
-
-
-def normalize_cmd(value: Any) -> list[str]:
-    if not isinstance(value, list):
-        return []
-    return [str(item) for item in value if str(item).strip()]
-
-
-def try_extract_json_object(output: str) -> tuple[dict[str, Any] | None, str]:
-    text = (output or "").strip()
-    if not text:
-        return None, "empty command output"
-    try:
-        parsed = json.loads(text)
-        if isinstance(parsed, dict):
-            return parsed, ""
-        return None, "output is not a JSON object"
-    except Exception:
-        pass
-
-    decoder = json.JSONDecoder()
-    first_brace = text.find("{")
-    if first_brace < 0:
-        return None, "failed to parse JSON object"
-    best: dict[str, Any] | None = None
-    best_span = -1
-    for index, ch in enumerate(text[first_brace:]):
-        if ch != "{":
-            continue
-        try:
-            candidate, end_index = decoder.raw_decode(text[first_brace + index :])
-        except Exception:
-            continue
-        if isinstance(candidate, dict) and int(end_index) > best_span:
-            best = candidate
-            best_span = int(end_index)
-    if best is None:
-        return None, "failed to parse JSON object"
-    return best, ""
-
-
-def collect_config_widgets(tabs: list[Any], prefix: str = "ui.tabs") -> list[dict[str, str]]:
-    result: list[dict[str, str]] = []
+# A part with both braces (in either order) may be a placeholder. argv cannot contain NUL,
+# so matching over the NUL-joined command never pairs braces from different parts.
+PLACEHOLDER_PARTS_RE = re.compile(r"\{[^\x00]*\}|\}[^\x00]*\{")
+
+
+def _field_text(value: Any) -> str:
+    # Same result as str(value or "").strip(), without the str() round trip for values that are already strings.
+    if type(value) is str:
+        return value.strip()
+    return str(value).strip() if value else ""
+
+
+def collect_widgets(
+    tabs: list[Any],
+    prefix: str = "ui.tabs",
+    config_widgets: list[dict[str, str]] | None = None,
+    action_widgets: list[dict[str, Any]] | None = None,
+) -> tuple[list[dict[str, str]], list[dict[str, Any]]]:
+    # One depth-first walk fills both lists in the same order the separate walks produced.
+    if config_widgets is None:
+        config_widgets = []
+    if action_widgets is None:
+        action_widgets = []
     for index, tab in enumerate(tabs, 1):
-        if not isinstance(tab, dict):
+        if type(tab) is not dict:
             continue
         tab_id = str(tab.get("id") or f"tab-{index}")
         tab_path = f"{prefix}[{index}]({tab_id})"
         widgets = tab.get("widgets")
-        if isinstance(widgets, list):
+        if type(widgets) is list:
             for w_index, widget in enumerate(widgets, 1):
-                if not isinstance(widget, dict):
-                    continue
-                widget_type = str(widget.get("type") or "").strip()
-                if widget_type not in {"config_editor", "config_file_select"}:
+                if type(widget) is not dict:
                     continue
-                result.append(
-                    {
-                        "tabPath": tab_path,
-                        "widgetIndex": str(w_index),
-                        "type": widget_type,
-                        "showAction": str(widget.get("showAction") or "").strip(),
-                        "setAction": str(widget.get("setAction") or "").strip(),
-                        "pathKey": str(widget.get("pathKey") or "").strip(),
-                        "key": str(widget.get("key") or "").strip(),
-                    }
-                )
-        children = tab.get("children")
-        if isinstance(children, list):
-            result.extend(collect_config_widgets(children, prefix=f"{tab_path}.children"))
-    return result
-
-
-def collect_action_widgets(tabs: list[Any], prefix: str = "ui.tabs") -> list[dict[str, Any]]:
-    result: list[dict[str, Any]] = []
-    for index, tab in enumerate(tabs, 1):
-        if not isinstance(tab, dict):
-            continue
-        tab_id = str(tab.get("id") or f"tab-{index}")
-        tab_path = f"{prefix}[{index}]({tab_id})"
-        widgets = tab.get("widgets")
-        if isinstance(widgets, list):
-            for w_index, widget in enumerate(widgets, 1):
-                if not isinstance(widget, dict):
-                    continue
-                widget_type = str(widget.get("type") or "").strip()
-                if widget_type not in {"action_select", "action_map"}:
-                    continue
-                include_commands_raw = widget.get("includeCommands")
-                include_commands: list[str] = []
-                if isinstance(include_commands_raw, list):
-                    include_commands = [str(item).strip() for item in include_commands_raw if str(item).strip()]
-                result.append(
-                    {
-                        "tabPath": tab_path,
-                        "widgetIndex": str(w_index),
-                        "type": widget_type,
-                        "includePrefix": str(widget.get("includePrefix") or "").strip(),
-                        "includeRegex": str(widget.get("includeRegex") or "").strip(),
-                        "includeCommands": include_commands,
-                    }
-                )
+                widget_type = _field_text(widget.get("type"))
+                if widget_type in CONFIG_WIDGET_TYPES:
+                    config_widgets.append(
+                        {
+                            "tabPath": tab_path,
+                            "widgetIndex": str(w_index),
+                            "type": widget_type,
+                            "showAction": _field_text(widget.get("showAction")),
+                            "setAction": _field_text(widget.get("setAction")),
+                            "pathKey": _field_text(widget.get("pathKey")),
+                            "key": _field_text(widget.get("key")),
+                        }
+                    )
+                elif widget_type in ACTION_WIDGET_TYPES:
+                    include_commands_raw = widget.get("includeCommands")
+                    include_commands: list[str] = []
+                    if type(include_commands_raw) is list:
+                        include_commands = [text for item in include_commands_raw if (text := str(item).strip())]
+                    action_widgets.append(
+                        {
+                            "tabPath": tab_path,
+                            "widgetIndex": str(w_index),
+                            "type": widget_type,
+                            "includePrefix": _field_text(widget.get("includePrefix")),
+                            "includeRegex": _field_text(widget.get("includeRegex")),
+                            "includeCommands": include_commands,
+                            "includeCommandSet": frozenset(include_commands),
+                            "includePattern": None,
+                        }
+                    )
         children = tab.get("children")
-        if isinstance(children, list):
-            result.extend(collect_action_widgets(children, prefix=f"{tab_path}.children"))
-    return result
+        if type(children) is list:
+            collect_widgets(children, f"{tab_path}.children", config_widgets, action_widgets)
+    return config_widgets, action_widgets
 
 
 def top_tab_titles(tabs: list[Any]) -> set[str]:
-    titles: set[str] = set()
-    for tab in tabs:
-        if not isinstance(tab, dict):
-            continue
-        text = str(tab.get("title") or "").strip().lower()
-        if text:
-            titles.add(text)
-    return titles
+    return {title for tab in tabs if type(tab) is dict and (title := str(tab.get("title") or "").strip().lower())}
 
 
 def _matches_widget_filters(action_name: str, widget: dict[str, Any]) -> bool:
-    include_commands = widget.get("includeCommands")
-    if isinstance(include_commands, list) and include_commands:
+    include_commands = widget.get("includeCommandSet")
+    if include_commands:
         return action_name in include_commands
 
-    include_prefix = str(widget.get("includePrefix") or "").strip()
-    include_regex = str(widget.get("includeRegex") or "").strip()
-
+    include_prefix = widget.get("includePrefix") or ""
     if include_prefix and not action_name.startswith(include_prefix):
         return False
 
-    if include_regex:
-        pattern = re.compile(include_regex)
-        if pattern.search(action_name) is None:
-            return False
+    pattern = widget.get("includePattern")
+    if pattern is not None and pattern.search(action_name) is None:
+        return False
 
     return True
 
@@ -169,72 +136,38 @@ def is_ipc_mode(target: dict[str, Any]) -> bool:
     return str(control.get("mode") or "").strip().lower() == "ipc"
 
 
-def normalize_config_paths(paths_raw: Any) -> list[dict[str, Any]]:
-    normalized: list[dict[str, Any]] = []
-    if isinstance(paths_raw, list):
-        for item in paths_raw:
-            if not isinstance(item, dict):
-                continue
-            key = str(item.get("key") or "").strip()
-            if not key:
-                continue
-            value = item.get("value")
-            if value is None and "path" in item:
-                value = item.get("path")
-            normalized.append({"key": key, "value": value})
-        return normalized
-
-    if isinstance(paths_raw, dict):
-        for key_raw, value in paths_raw.items():
-            key = str(key_raw or "").strip()
-            if not key:
-                continue
-            normalized.append({"key": key, "value": value})
-    return normalized
-
-
-def normalize_config_entries(entries_raw: Any) -> list[dict[str, Any]]:
-    normalized: list[dict[str, Any]] = []
-    if not isinstance(entries_raw, list):
-        return normalized
-    for item in entries_raw:
-        if not isinstance(item, dict):
-            continue
-        entry = dict(item)
-        key = str(entry.get("key") or "").strip()
-        if not key:
-            continue
-        allowed = entry.get("allowed")
-        if not isinstance(allowed, list):
-            legacy_allowed = entry.get("allowedValues")
-            if isinstance(legacy_allowed, list):
-                entry["allowed"] = list(legacy_allowed)
-        normalized.append(entry)
-    return normalized
-
-
-def run_action(action: dict[str, Any]) -> tuple[int, str, str, str]:
+def run_action(action: dict[str, Any]) -> tuple[int, bytes, bytes, str]:
     cmd = normalize_cmd(action.get("cmd"))
     if not cmd:
-        return 2, "", "", "empty cmd"
-    if any("{" in part and "}" in part for part in cmd):
-        return 2, "", "", "cmd contains placeholders and is not callable for contract check"
+        return 2, b"", b"", "empty cmd"
+    if PLACEHOLDER_PARTS_RE.search("\x00".join(cmd)):
+        return 2, b"", b"", "cmd contains placeholders and is not callable for contract check"
     cwd_text = str(action.get("cwd") or "").strip()
     cwd = Path(cwd_text) if cwd_text else None
     timeout = float(action.get("timeoutSeconds") or 30.0)
     try:
-        completed = subprocess.run(
+        # Output stays as bytes: stdout goes straight to the JSON parser and stderr is
+        # only decoded when a failure message needs it.
+        with subprocess.Popen(
             cmd,
             cwd=str(cwd) if cwd else None,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-        )
-    except subprocess.TimeoutExpired:
-        return 2, "", "", f"timeout after {timeout:.1f}s"
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        ) as process:
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                return 2, b"", b"", f"timeout after {timeout:.1f}s"
     except Exception as ex:
-        return 2, "", "", str(ex)
-    return int(completed.returncode), completed.stdout or "", completed.stderr or "", ""
+        return 2, b"", b"", str(ex)
+    return int(process.returncode), stdout or b"", stderr or b"", ""
+
+
+def _failure_message(rc: int, stdout: bytes, stderr: bytes) -> str:
+    text = (stderr.strip() or stdout.strip()).decode("utf-8", errors="replace")
+    return text.splitlines()[0] if text else f"rc={rc}"
 
 
 def validate_status_payload(payload: dict[str, Any]) -> list[str]:
@@ -245,13 +178,13 @@ def validate_status_payload(payload: dict[str, Any]) -> list[str]:
 
     app_id = payload.get("appId")
     app_title = payload.get("appTitle")
-    if not isinstance(app_id, str) or not app_id.strip():
+    if type(app_id) is not str or not app_id.strip():
         errors.append("status.appId must be a non-empty string")
-    if not isinstance(app_title, str) or not app_title.strip():
+    if type(app_title) is not str or not app_title.strip():
         errors.append("status.appTitle must be a non-empty string")
 
     for bool_key in ("running", "hostRunning"):
-        if bool_key in payload and not isinstance(payload.get(bool_key), bool):
+        if bool_key in payload and type(payload.get(bool_key)) is not bool:
             errors.append(f"status.{bool_key} must be bool")
 
     for int_key in ("pid", "hostPid"):
@@ -262,20 +195,29 @@ def validate_status_payload(payload: dict[str, Any]) -> list[str]:
     return errors
 
 
-def main() -> int:
-    parser = argparse.ArgumentParser(description=__doc__)
-    parser.add_argument("--target", required=True, help="Path to monitor.<name>.target.json")
-    parser.add_argument("--verbose", action="store_true")
-    parser.add_argument("--skip-status-check", action="store_true")
-    parser.add_argument("--enforce-top-tabs", action="store_true")
-    args = parser.parse_args()
+_TARGET_CACHE: dict[Path, tuple[tuple[int, int], Any]] = {}
 
-    target_path = Path(args.target).resolve()
+
+def load_target_json(target_path: Path) -> Any:
+    # Keyed on (mtime_ns, size) so repeated in-process checks of an unchanged file skip
+    # the decode; callers must treat the returned object as read-only.
+    stat = target_path.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _TARGET_CACHE.get(target_path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    # json.loads detects a leading UTF-8 BOM in bytes input, matching the old utf-8-sig read.
+    target = json.loads(target_path.read_bytes())
+    _TARGET_CACHE[target_path] = (key, target)
+    return target
+
+
+def check_target(target_path: Path, args: argparse.Namespace) -> int:
     if not target_path.exists():
         print(f"missing target: {target_path}", file=sys.stderr)
         return 2
     try:
-        target = json.loads(target_path.read_text(encoding="utf-8-sig"))
+        target = load_target_json(target_path)
     except Exception as ex:
         print(f"invalid JSON {target_path}: {ex}", file=sys.stderr)
         return 2
@@ -286,20 +228,20 @@ def main() -> int:
 
     actions_list = target.get("actions")
     actions: dict[str, dict[str, Any]] = {}
-    action_names_in_order: list[str] = []
+    # actions keeps first-seen order itself; only the occurrence counts are needed for duplicates.
+    action_name_counts: Counter[str] = Counter()
     if isinstance(actions_list, list):
         for action in actions_list:
             if not isinstance(action, dict):
                 continue
-            name = str(action.get("name") or "").strip()
+            name = _field_text(action.get("name"))
             if name:
-                action_names_in_order.append(name)
+                action_name_counts[name] += 1
                 actions[name] = action
 
     ui = target.get("ui")
     tabs = ui.get("tabs") if isinstance(ui, dict) and isinstance(ui.get("tabs"), list) else []
-    config_widgets = collect_config_widgets(tabs)
-    action_widgets = collect_action_widgets(tabs)
+    config_widgets, action_widgets = collect_widgets(tabs)
 
     errors: list[str] = []
 
@@ -315,14 +257,14 @@ def main() -> int:
         if missing_top_tabs:
             errors.append(f"missing required top-level tabs: {', '.join(missing_top_tabs)}")
 
-    duplicates = sorted({name for name in action_names_in_order if action_names_in_order.count(name) > 1})
+    duplicates = sorted(name for name, count in action_name_counts.items() if count > 1)
     if duplicates:
         errors.append(f"duplicate action names: {', '.join(duplicates)}")
 
     if not ipc_mode:
         for widget in action_widgets:
-            include_commands = widget.get("includeCommands")
-            if isinstance(include_commands, list) and include_commands:
+            include_commands = widget["includeCommands"]
+            if include_commands:
                 missing_cmd = [name for name in include_commands if name not in actions]
                 if missing_cmd:
                     errors.append(
@@ -330,97 +272,115 @@ def main() -> int:
                     )
                 continue
 
-            include_regex = str(widget.get("includeRegex") or "").strip()
+            include_regex = widget["includeRegex"]
             if include_regex:
                 try:
-                    re.compile(include_regex)
+                    # Compiled once here; _matches_widget_filters reuses it for every action name.
+                    widget["includePattern"] = re.compile(include_regex)
                 except re.error as ex:
                     errors.append(
                         f"{widget['tabPath']}[{widget['widgetIndex']}] invalid includeRegex '{include_regex}': {ex}"
                     )
                     continue
 
-            matched = [name for name in actions.keys() if _matches_widget_filters(name, widget)]
+            matched = [name for name in actions if _matches_widget_filters(name, widget)]
             if not matched:
                 errors.append(f"{widget['tabPath']}[{widget['widgetIndex']}] action filter resolves to zero actions")
 
-    if not args.skip_status_check:
-        status_cfg = target.get("status")
-        if ipc_mode:
-            if status_cfg is not None and not isinstance(status_cfg, dict):
-                errors.append("status section must be an object when present")
-            if isinstance(status_cfg, dict):
-                extras = sorted(set(str(key) for key in status_cfg.keys()) - {"timeoutSeconds"})
-                if extras:
-                    errors.append(f"status supports timeoutSeconds only in IPC mode; unsupported: {', '.join(extras)}")
-            control = target.get("control")
-            if not isinstance(control, dict):
-                errors.append("control section missing or invalid for IPC mode")
-            else:
-                endpoint = str(control.get("endpoint") or "").strip()
-                app_id = str(control.get("appId") or "").strip()
-                if not endpoint:
-                    errors.append("control.endpoint must be non-empty in IPC mode")
-                if not app_id:
-                    errors.append("control.appId must be non-empty in IPC mode")
-        else:
-            if not isinstance(status_cfg, dict):
-                errors.append("status section missing or invalid")
+    # Show actions are independent subprocesses: start them now so they run alongside the
+    # status command, then consume results in sorted order to keep error output stable.
+    show_action_names = sorted({item["showAction"] for item in config_widgets if item["showAction"] in actions})
+    show_pool: ThreadPoolExecutor | None = None
+    show_futures: dict[str, Future[tuple[int, bytes, bytes, str]]] = {}
+    if show_action_names:
+        show_pool = ThreadPoolExecutor(max_workers=min(8, len(show_action_names)))
+    try:
+        if show_pool is not None:
+            show_futures = {name: show_pool.submit(run_action, actions[name]) for name in show_action_names}
+
+        if not args.skip_status_check:
+            status_cfg = target.get("status")
+            if ipc_mode:
+                if status_cfg is not None and not isinstance(status_cfg, dict):
+                    errors.append("status section must be an object when present")
+                if isinstance(status_cfg, dict):
+                    extras = sorted(set(str(key) for key in status_cfg.keys()) - {"timeoutSeconds"})
+                    if extras:
+                        errors.append(f"status supports timeoutSeconds only in IPC mode; unsupported: {', '.join(extras)}")
+                control = target.get("control")
+                if not isinstance(control, dict):
+                    errors.append("control section missing or invalid for IPC mode")
+                else:
+                    endpoint = str(control.get("endpoint") or "").strip()
+                    app_id = str(control.get("appId") or "").strip()
+                    if not endpoint:
+                        errors.append("control.endpoint must be non-empty in IPC mode")
+                    if not app_id:
+                        errors.append("control.appId must be non-empty in IPC mode")
             else:
-                status_action = {
-                    "name": "_status_check",
-                    "cmd": status_cfg.get("cmd"),
-                    "cwd": status_cfg.get("cwd"),
-                    "timeoutSeconds": status_cfg.get("timeoutSeconds", 30.0),
-                }
-                rc, stdout, stderr, err = run_action(status_action)
-                if err:
-                    errors.append(f"status.cmd: {err}")
-                elif rc != 0:
-                    message = (stderr or stdout or f"rc={rc}").strip().splitlines()[0]
-                    errors.append(f"status.cmd failed ({message})")
+                if not isinstance(status_cfg, dict):
+                    errors.append("status section missing or invalid")
                 else:
-                    payload, parse_error = try_extract_json_object(stdout)
-                    if payload is None:
-                        errors.append(f"status.cmd: {parse_error}")
+                    status_action = {
+                        "name": "_status_check",
+                        "cmd": status_cfg.get("cmd"),
+                        "cwd": status_cfg.get("cwd"),
+                        "timeoutSeconds": status_cfg.get("timeoutSeconds", 30.0),
+                    }
+                    rc, stdout, stderr, err = run_action(status_action)
+                    if err:
+                        errors.append(f"status.cmd: {err}")
+                    elif rc != 0:
+                        message = _failure_message(rc, stdout, stderr)
+                        errors.append(f"status.cmd failed ({message})")
                     else:
-                        errors.extend(validate_status_payload(payload))
-
-    if not ipc_mode:
-        for widget in config_widgets:
-            show_action = widget["showAction"]
-            set_action = widget["setAction"]
-            if show_action not in actions:
-                errors.append(f"{widget['tabPath']}[{widget['widgetIndex']}] showAction missing: {show_action}")
-            if set_action not in actions:
-                errors.append(f"{widget['tabPath']}[{widget['widgetIndex']}] setAction missing: {set_action}")
-
-    show_payloads: dict[str, dict[str, Any]] = {}
-    show_action_names = sorted({item["showAction"] for item in config_widgets if item["showAction"] in actions})
-    for show_action in show_action_names:
-        rc, stdout, stderr, err = run_action(actions[show_action])
-        if err:
-            errors.append(f"showAction {show_action}: {err}")
-            continue
-        payload, parse_error = try_extract_json_object(stdout)
-        if payload is None:
-            if rc != 0:
-                message = (stderr or stdout or f"rc={rc}").strip().splitlines()[0]
-                errors.append(f"showAction {show_action}: failed ({message})")
-            else:
-                errors.append(f"showAction {show_action}: {parse_error}")
-            continue
-        show_payloads[show_action] = payload
+                        payload, parse_error = try_extract_json_object(stdout, subject="command output")
+                        if payload is None:
+                            errors.append(f"status.cmd: {parse_error}")
+                        else:
+                            errors.extend(validate_status_payload(payload))
+
+        if not ipc_mode:
+            for widget in config_widgets:
+                show_action = widget["showAction"]
+                set_action = widget["setAction"]
+                if show_action not in actions:
+                    errors.append(f"{widget['tabPath']}[{widget['widgetIndex']}] showAction missing: {show_action}")
+                if set_action not in actions:
+                    errors.append(f"{widget['tabPath']}[{widget['widgetIndex']}] setAction missing: {set_action}")
+
+        # Each show payload is normalized once into key lookups shared by every widget using it.
+        show_payloads: dict[str, tuple[dict[str, dict[str, Any]], set[str]]] = {}
+        for show_action in show_action_names:
+            rc, stdout, stderr, err = show_futures[show_action].result()
+            if err:
+                errors.append(f"showAction {show_action}: {err}")
+                continue
+            payload, parse_error = try_extract_json_object(stdout, subject="command output")
+            if payload is None:
+                if rc != 0:
+                    message = _failure_message(rc, stdout, stderr)
+                    errors.append(f"showAction {show_action}: failed ({message})")
+                else:
+                    errors.append(f"showAction {show_action}: {parse_error}")
+                continue
+            # Only entries and paths are projected out; the rest of the payload is dropped here.
+            entries = _normalize_config_entries_payload(payload.get("entries"), [])
+            paths = _normalize_config_paths_payload(payload.get("paths"))
+            entry_by_key = {key: item for item in entries if (key := _field_text(item.get("key")))}
+            # Normalized paths always carry a stripped, non-empty key.
+            path_keys = {item["key"] for item in paths}
+            show_payloads[show_action] = (entry_by_key, path_keys)
+    finally:
+        # Runs on errors too, so no show action is left queued and every worker is joined.
+        if show_pool is not None:
+            show_pool.shutdown(cancel_futures=True)
 
     for widget in config_widgets:
-        show_action = widget["showAction"]
-        payload = show_payloads.get(show_action)
-        if not isinstance(payload, dict):
+        normalized = show_payloads.get(widget["showAction"])
+        if normalized is None:
             continue
-        entries = normalize_config_entries(payload.get("entries"))
-        paths = normalize_config_paths(payload.get("paths"))
-        entry_by_key = {str(item.get("key") or "").strip(): item for item in entries if str(item.get("key") or "").strip()}
-        path_keys = {str(item.get("key") or "").strip() for item in paths if str(item.get("key") or "").strip()}
+        entry_by_key, path_keys = normalized
 
         path_key = widget["pathKey"]
         if path_key and path_key not in path_keys:
@@ -466,5 +426,30 @@ def main() -> int:
     return 0
 
 
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--target",
+        action="append",
+        required=True,
+        help="Path to monitor.<name>.target.json. May be repeated to check several targets in one run.",
+    )
+    parser.add_argument("--verbose", action="store_true")
+    parser.add_argument("--skip-status-check", action="store_true")
+    parser.add_argument("--enforce-top-tabs", action="store_true")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    target_paths = [Path(text).resolve() for text in args.target]
+    failures = sum(1 for target_path in target_paths if check_target(target_path, args) != 0)
+    if len(target_paths) > 1:
+        # Batch callers read this line instead of re-parsing each target's result.
+        print(f"{SUMMARY_PREFIX}failed={failures} total={len(target_paths)}")
+    return 2 if failures else 0
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
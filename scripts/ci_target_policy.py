@@ -4,28 +4,72 @@
 from __future__ import annotations
 
 import argparse
+import fnmatch
+import functools
+import operator
 import os
-import subprocess
 import sys
 from pathlib import Path
 
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def fast_resolve(text: str | Path) -> Path:
+    # Lexical absolute path: anchors relative input at the cwd and folds ".." without the
+    # per-segment lstat of realpath. Symlinks are kept as given.
+    return Path(os.path.abspath(text))
+
+
 def resolve_target_file(repo: Path, expected_name: str) -> Path:
-    return (repo / "config" / "gui" / expected_name).resolve()
+    return fast_resolve(repo / "config" / "gui" / expected_name)
 
 
-def resolve_repo_target_files(repo: Path) -> list[Path]:
+def _gui_dir_state(repo: Path) -> tuple[str, int]:
+    # Adding, removing or renaming a file bumps the directory mtime, which invalidates
+    # the cached listings below.
     base = (repo / "config" / "gui").resolve()
-    if not base.exists():
-        return []
-    return sorted(
-        (candidate.resolve() for candidate in base.glob("monitor.*.target.json") if candidate.is_file()),
-        key=lambda item: str(item).lower(),
-    )
+    try:
+        return str(base), base.stat().st_mtime_ns
+    except OSError:
+        return str(base), -1
 
 
-def resolve_fixture_target_files(repo: Path) -> list[Path]:
-    base = repo / "config" / "gui"
+def _scan_gui_dir(base: str) -> dict[str, os.DirEntry[str]]:
+    # One directory read replaces a stat/realpath per candidate. The base is resolved once,
+    # so only symlinked entries still need resolve() to match the old fully resolved paths.
+    try:
+        with os.scandir(base) as entries:
+            return {entry.name: entry for entry in entries}
+    except OSError:
+        return {}
+
+
+def _entry_path(entry: os.DirEntry[str]) -> Path:
+    path = Path(entry.path)
+    return path.resolve() if entry.is_symlink() else path
+
+
+@functools.lru_cache(maxsize=64)
+def _repo_target_files(base: str, mtime_ns: int) -> tuple[Path, ...]:
+    # Decorate once with the lowercased text so sorting compares plain strings.
+    decorated = [
+        (str(path).lower(), path)
+        for name, entry in _scan_gui_dir(base).items()
+        if fnmatch.fnmatchcase(name, "monitor.*.target.json") and entry.is_file()
+        for path in (_entry_path(entry),)
+    ]
+    decorated.sort(key=operator.itemgetter(0))
+    return tuple(path for _, path in decorated)
+
+
+def resolve_repo_target_files(repo: Path) -> list[Path]:
+    return list(_repo_target_files(*_gui_dir_state(repo)))
+
+
+@functools.lru_cache(maxsize=64)
+def _fixture_target_files(base: str, mtime_ns: int) -> tuple[Path, ...]:
+    entries = _scan_gui_dir(base)
     names = [
         "monitor.fixture.target.json",
         "monitor.plc-simulator.target.json",
@@ -33,22 +77,23 @@ def resolve_fixture_target_files(repo: Path) -> list[Path]:
     ]
     result: list[Path] = []
     for name in names:
-        candidate = (base / name).resolve()
-        if candidate.exists():
+        entry = entries.get(name)
+        if entry is None:
+            continue
+        candidate = _entry_path(entry)
+        # A listed entry exists unless it is a dangling symlink.
+        if not entry.is_symlink() or candidate.exists():
             result.append(candidate)
-    return result
+    return tuple(result)
+
+
+def resolve_fixture_target_files(repo: Path) -> list[Path]:
+    return list(_fixture_target_files(*_gui_dir_state(repo)))
 
 
 def dedupe_paths(items: list[Path]) -> list[Path]:
-    result: list[Path] = []
-    seen: set[str] = set()
-    for item in items:
-        key = str(item)
-        if key in seen:
-            continue
-        seen.add(key)
-        result.append(item)
-    return result
+    # Dicts keep first-insertion order; duplicates share a key and an equal Path value.
+    return list({str(item): item for item in items}.values())
 
 
 def collect_generic_targets(args: argparse.Namespace) -> list[Path]:
@@ -59,14 +104,14 @@ def collect_generic_targets(args: argparse.Namespace) -> list[Path]:
         text = str(target_text or "").strip()
         if not text:
             continue
-        targets.append(Path(text).resolve())
+        targets.append(fast_resolve(text))
 
     repo_values = args.repo if isinstance(args.repo, list) else []
     for repo_text in repo_values:
         text = str(repo_text or "").strip()
         if not text:
             continue
-        repo = Path(text).resolve()
+        repo = fast_resolve(text)
         discovered = resolve_repo_target_files(repo)
         if not discovered:
             raise RuntimeError(
@@ -82,9 +127,9 @@ def collect_legacy_targets(args: argparse.Namespace) -> list[Path]:
     targets: list[Path] = []
 
     if args.include_fixture:
-        if args.fixture_target.strip():
-            targets.append(Path(args.fixture_target).resolve())
-        elif args.fixture_repo.strip():
+        if args.fixture_target:
+            targets.append(fast_resolve(args.fixture_target))
+        elif args.fixture_repo:
             fixture_targets = resolve_fixture_target_files(Path(args.fixture_repo))
             if fixture_targets:
                 targets.extend(fixture_targets)
@@ -97,9 +142,9 @@ def collect_legacy_targets(args: argparse.Namespace) -> list[Path]:
             )
 
     if args.include_bridge:
-        if args.bridge_target.strip():
-            targets.append(Path(args.bridge_target).resolve())
-        elif args.bridge_repo.strip():
+        if args.bridge_target:
+            targets.append(fast_resolve(args.bridge_target))
+        elif args.bridge_repo:
             targets.append(resolve_target_file(Path(args.bridge_repo), "monitor.bridge.target.json"))
         else:
             raise RuntimeError(
@@ -113,7 +158,48 @@ def collect_legacy_targets(args: argparse.Namespace) -> list[Path]:
     return targets
 
 
-def parse_args() -> argparse.Namespace:
+def run_checker(checker: Path, targets: list[Path], repo_root: Path) -> int:
+    # The checker runs in this interpreter, so no process is started per target. Working
+    # from repo_root keeps relative commands resolving as they did under subprocess.
+    if str(checker.parent) not in sys.path:
+        sys.path.insert(0, str(checker.parent))
+    import check_target_contract
+
+    # The options are the same for every target, so parse them once and check targets directly.
+    argv = ["--enforce-top-tabs"]
+    for target in targets:
+        argv.extend(("--target", str(target)))
+    checker_args = check_target_contract.build_parser().parse_args(argv)
+
+    failures = 0
+    previous_cwd = os.getcwd()
+    os.chdir(repo_root)
+    try:
+        for target in targets:
+            try:
+                returncode = check_target_contract.check_target(target, checker_args)
+            except Exception as ex:
+                print(f"checker failed for {target}: {ex}", file=sys.stderr)
+                returncode = 2
+            if returncode != 0:
+                failures += 1
+            # Piped CI logs are block-buffered; flush so each target's report shows up as it finishes.
+            sys.stdout.flush()
+    finally:
+        os.chdir(previous_cwd)
+    return failures
+
+
+def _env(name: str) -> str:
+    return (os.environ.get(name) or "").strip()
+
+
+def _repo_option(value: str | None, env_name: str) -> str:
+    # Options default to None so the environment is only read when the flag is absent.
+    return _env(env_name) if value is None else value.strip()
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
         "--repo",
@@ -127,10 +213,10 @@ def parse_args() -> argparse.Namespace:
         default=[],
         help="Explicit target file path. May be repeated.",
     )
-    parser.add_argument("--fixture-repo", default=os.getenv("FIXTURE_REPO", "").strip())
-    parser.add_argument("--bridge-repo", default=os.getenv("BRIDGE_REPO", "").strip())
-    parser.add_argument("--fixture-target", default=os.getenv("FIXTURE_TARGET", "").strip())
-    parser.add_argument("--bridge-target", default=os.getenv("BRIDGE_TARGET", "").strip())
+    parser.add_argument("--fixture-repo", default=None)
+    parser.add_argument("--bridge-repo", default=None)
+    parser.add_argument("--fixture-target", default=None)
+    parser.add_argument("--bridge-target", default=None)
     parser.add_argument(
         "--include-fixture",
         action=argparse.BooleanOptionalAction,
@@ -143,13 +229,17 @@ def parse_args() -> argparse.Namespace:
         default=True,
         help="Include bridge target in strict policy check.",
     )
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
-def main() -> int:
-    args = parse_args()
-    repo_root = Path(__file__).resolve().parents[1]
-    checker = (repo_root / "scripts" / "check_target_contract.py").resolve()
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    args.fixture_repo = _repo_option(args.fixture_repo, "FIXTURE_REPO")
+    args.bridge_repo = _repo_option(args.bridge_repo, "BRIDGE_REPO")
+    args.fixture_target = _repo_option(args.fixture_target, "FIXTURE_TARGET")
+    args.bridge_target = _repo_option(args.bridge_target, "BRIDGE_TARGET")
+    repo_root = REPO_ROOT
+    checker = repo_root / "scripts" / "check_target_contract.py"
     if not checker.exists():
         print(f"missing checker: {checker}", file=sys.stderr)
         return 2
@@ -163,24 +253,19 @@ def main() -> int:
     except RuntimeError as ex:
         print(str(ex), file=sys.stderr)
         return 2
+    if not targets:
+        # collect_legacy_targets already refuses an empty selection; keep main safe on its own.
+        print("No targets selected.", file=sys.stderr)
+        return 2
 
-    missing = [str(path) for path in targets if not path.exists()]
+    # A directory at a target path is as unusable as a missing file, so check isfile directly.
+    missing = [text for text in map(str, targets) if not os.path.isfile(text)]
     if missing:
         for item in missing:
             print(f"missing target config: {item}", file=sys.stderr)
         return 2
 
-    failures = 0
-    for target in targets:
-        cmd = [sys.executable, str(checker), "--target", str(target), "--enforce-top-tabs"]
-        completed = subprocess.run(cmd, cwd=repo_root, capture_output=True, text=True, check=False)
-        if completed.stdout.strip():
-            print(completed.stdout.strip())
-        if completed.stderr.strip():
-            print(completed.stderr.strip(), file=sys.stderr)
-        if completed.returncode != 0:
-            failures += 1
-
+    failures = run_checker(checker, targets, repo_root)
     if failures:
         print(f"FAIL: strict policy check failed for {failures}/{len(targets)} target(s).", file=sys.stderr)
         return 2
@@ -4,18 +4,56 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
 import os
 import shutil
+import string
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
 EMBED_RELATIVE = Path("tools") / "ipc-gui-program-interface"
+# Deploy targets are often network shares where each file copy waits on a round trip.
+COPY_WORKERS = 16
+# Written into the embed folder: relative path -> [size, mtime_ns, digest] for every deployed
+# file, so re-deploys copy only what changed.
+MANIFEST_NAME = "deploy.manifest.json"
+IGNORE_NAMES = frozenset({".git", ".pytest_cache", "__pycache__", ".mypy_cache", "monitor_config.generated.json"})
+IGNORE_SUFFIXES = (".pyc", ".pyo", ".log")
+
+if os.name == "nt":
+    import ctypes
+
+    _copy_file_ex = ctypes.WinDLL("kernel32", use_last_error=True).CopyFileExW
+    _copy_file_ex.argtypes = (
+        ctypes.c_wchar_p,
+        ctypes.c_wchar_p,
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        ctypes.c_uint32,
+    )
+    _copy_file_ex.restype = ctypes.c_int
+else:
+    _copy_file_ex = None
+
+
+def _env(name: str) -> str:
+    return (os.environ.get(name) or "").strip()
+
+
+def _repo_option(value: str | None, env_name: str) -> str:
+    # Options default to None so the environment is only read when the flag is absent.
+    return _env(env_name) if value is None else value.strip()
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
-    parser.add_argument("--fixture-repo", default=os.getenv("FIXTURE_REPO", "").strip())
-    parser.add_argument("--bridge-repo", default=os.getenv("BRIDGE_REPO", "").strip())
+    parser.add_argument("--fixture-repo", default=None)
+    parser.add_argument("--bridge-repo", default=None)
     parser.add_argument("--clean", action="store_true", help="Remove existing embed folder before copy.")
     parser.add_argument(
         "--targets",
@@ -28,34 +66,136 @@ def parse_args() -> argparse.Namespace:
 
 
 def ignore_filter(_: str, names: list[str]) -> set[str]:
-    ignored: set[str] = set()
-    for name in names:
-        if name in {".git", ".pytest_cache", "__pycache__", ".mypy_cache"}:
-            ignored.add(name)
-            continue
-        if name.endswith((".pyc", ".pyo", ".log")):
-            ignored.add(name)
-            continue
-        if name in {"monitor_config.generated.json"}:
-            ignored.add(name)
-            continue
-    return ignored
-
-
-def copy_item(source_root: Path, relative: str, destination_root: Path) -> None:
-    source = source_root / relative
-    dest = destination_root / relative
-    if not source.exists():
-        raise RuntimeError(f"Missing source item: {source}")
-    if source.is_dir():
-        shutil.copytree(source, dest, dirs_exist_ok=True, ignore=ignore_filter)
+    return {name for name in names if name in IGNORE_NAMES or name.endswith(IGNORE_SUFFIXES)}
+
+
+def file_digest(path: str | Path) -> str:
+    digest = hashlib.blake2b()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_manifest(embed_root: Path) -> dict[str, list[Any]]:
+    try:
+        payload = json.loads((embed_root / MANIFEST_NAME).read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def save_manifest(embed_root: Path, manifest: dict[str, list[Any]]) -> None:
+    manifest_path = embed_root / MANIFEST_NAME
+    staging = manifest_path.with_name(manifest_path.name + ".tmp")
+    staging.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(staging, manifest_path)
+
+
+def _needs_copy(source: str | Path, dest: str | Path, record: Any) -> tuple[bool, str | None]:
+    # Cheapest test first; the source digest is returned whenever it had to be computed.
+    try:
+        dest_stat = os.stat(dest)
+    except OSError:
+        return True, None
+    source_stat = os.stat(source)
+    if source_stat.st_size != dest_stat.st_size:
+        return True, None
+    dest_matches_record = isinstance(record, list) and record[:2] == [dest_stat.st_size, dest_stat.st_mtime_ns]
+    # copy2 carries the source mtime over, so an edited source no longer matches the destination.
+    if dest_matches_record and source_stat.st_mtime_ns == dest_stat.st_mtime_ns:
+        return False, None
+    digest = file_digest(source)
+    dest_digest = record[2] if dest_matches_record else file_digest(dest)
+    return digest != dest_digest, digest
+
+
+def fast_copy2(source: str | Path, dest: str | Path) -> None:
+    # On Windows shutil copies through a user-space buffer; CopyFileExW copies in the kernel and
+    # lets SMB3 shares copy server-side. It keeps the last-write time, as copy2 does.
+    if _copy_file_ex is not None and _copy_file_ex(str(source), str(dest), None, None, None, 0):
+        return
+    shutil.copy2(source, dest)
+
+
+def copy_file(
+    source: str | Path,
+    dest: str | Path,
+    manifest: dict[str, list[Any]] | None = None,
+    key: str = "",
+) -> None:
+    if manifest is None:
+        fast_copy2(source, dest)
+        return
+    needs_copy, digest = _needs_copy(source, dest, manifest.get(key))
+    if needs_copy:
+        fast_copy2(source, dest)
+    elif digest is None:
+        return
     else:
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(source, dest)
-
-
-def launcher_text_for_fixture() -> str:
-    return """#!/usr/bin/env python3
+        # Same content under a different mtime: realign it so the next run takes the stat-only path.
+        shutil.copystat(source, dest)
+    stat = os.stat(dest)
+    manifest[key] = [stat.st_size, stat.st_mtime_ns, digest or file_digest(source)]
+
+
+def plan_copy(
+    source_root: Path,
+    relative_items: list[str],
+    destination_root: Path,
+) -> tuple[list[str], list[tuple[str, str]], list[tuple[str, str]]]:
+    # One walk over every item yields the directories to create, the file pairs to copy and
+    # the directory pairs whose metadata is copied last, the same as copytree with ignore_filter.
+    make_dirs: set[str] = set()
+    file_pairs: list[tuple[str, str]] = []
+    dir_pairs: list[tuple[str, str]] = []
+    for relative in relative_items:
+        source = os.path.join(source_root, relative)
+        dest = os.path.join(destination_root, relative)
+        if not os.path.exists(source):
+            raise RuntimeError(f"Missing source item: {source}")
+        if not os.path.isdir(source):
+            make_dirs.add(os.path.dirname(dest))
+            file_pairs.append((source, dest))
+            continue
+        for current, dirnames, filenames in os.walk(source, followlinks=True):
+            ignored = ignore_filter(current, dirnames + filenames)
+            dirnames[:] = [name for name in dirnames if name not in ignored]
+            target_dir = os.path.normpath(os.path.join(dest, os.path.relpath(current, source)))
+            make_dirs.add(target_dir)
+            dir_pairs.append((current, target_dir))
+            file_pairs.extend(
+                (os.path.join(current, name), os.path.join(target_dir, name)) for name in filenames if name not in ignored
+            )
+    # Sorted so parents come before children.
+    return sorted(make_dirs), file_pairs, dir_pairs
+
+
+def copy_items(
+    source_root: Path,
+    relative_items: list[str],
+    destination_root: Path,
+    manifest: dict[str, list[Any]] | None = None,
+) -> None:
+    make_dirs, file_pairs, dir_pairs = plan_copy(source_root, relative_items, destination_root)
+    for directory in make_dirs:
+        os.makedirs(directory, exist_ok=True)
+    keys = [os.path.relpath(dest, destination_root).replace(os.sep, "/") for _, dest in file_pairs]
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as pool:
+        # list() re-raises the first copy error, as copytree would.
+        list(pool.map(lambda pair, key: copy_file(pair[0], pair[1], manifest, key), file_pairs, keys))
+    if manifest is not None:
+        # Drop records for files that are no longer part of the bundle.
+        for stale_key in manifest.keys() - set(keys):
+            del manifest[stale_key]
+    for source_dir, target_dir in dir_pairs:
+        shutil.copystat(source_dir, target_dir)
+
+
+# Both generated launchers share one body; the role picks which repo flag the launcher
+# fills in and which partner repo --with-<other> pulls in from the environment.
+LAUNCHER_TEMPLATE = string.Template(
+    """#!/usr/bin/env python3
 from __future__ import annotations
 import argparse
 import json
@@ -71,8 +211,12 @@ def _resolve_canonical_repo(repo_root: Path, explicit: str) -> Path:
     if env_value:
         return Path(env_value).resolve()
     config_path = repo_root / "config" / "gui" / "monitor.canonical.json"
-    if config_path.exists():
-        payload = json.loads(config_path.read_text(encoding="utf-8-sig"))
+    try:
+        config_data = config_path.read_bytes()
+    except FileNotFoundError:
+        config_data = b""
+    if config_data:
+        payload = json.loads(config_data)
         if isinstance(payload, dict):
             configured = str(payload.get("canonicalRepo") or "").strip()
             if configured:
@@ -97,105 +241,52 @@ def main() -> int:
         return 2
 
     argv = passthrough
-    include_bridge = False
-    if "--with-bridge" in argv:
-        include_bridge = True
-        argv.remove("--with-bridge")
+    include_$other = False
+    if "--with-$other" in argv:
+        include_$other = True
+        argv.remove("--with-$other")
 
     cmd = [
         sys.executable,
         str(launcher),
-        "--fixture-repo",
+        "--$role-repo",
         str(repo_root),
-        "--no-include-bridge",
+        "--no-include-$other",
     ]
-    if include_bridge:
-        bridge_repo = os.getenv("BRIDGE_REPO", "").strip()
-        cmd.append("--include-bridge")
-        if bridge_repo and "--bridge-repo" not in argv and "--bridge-target" not in argv:
-            cmd.extend(["--bridge-repo", bridge_repo])
+    if include_$other:
+        ${other}_repo = os.getenv("${OTHER}_REPO", "").strip()
+        cmd.append("--include-$other")
+        if ${other}_repo and "--$other-repo" not in argv and "--$other-target" not in argv:
+            cmd.extend(["--$other-repo", ${other}_repo])
     cmd.extend(argv)
     return subprocess.call(cmd, cwd=gui_root)
 
 if __name__ == "__main__":
     raise SystemExit(main())
 """
+)
 
 
-def launcher_text_for_bridge() -> str:
-    return """#!/usr/bin/env python3
-from __future__ import annotations
-import argparse
-import json
-import os
-import subprocess
-import sys
-from pathlib import Path
-
-def _resolve_canonical_repo(repo_root: Path, explicit: str) -> Path:
-    if explicit.strip():
-        return Path(explicit).resolve()
-    env_value = os.getenv("IPC_GUI_CANONICAL_REPO", "").strip()
-    if env_value:
-        return Path(env_value).resolve()
-    config_path = repo_root / "config" / "gui" / "monitor.canonical.json"
-    if config_path.exists():
-        payload = json.loads(config_path.read_text(encoding="utf-8-sig"))
-        if isinstance(payload, dict):
-            configured = str(payload.get("canonicalRepo") or "").strip()
-            if configured:
-                return Path(configured).resolve()
-    raise RuntimeError(
-        "Canonical GUI repo not set. Use --canonical-repo, IPC_GUI_CANONICAL_REPO, "
-        "or config/gui/monitor.canonical.json."
-    )
-
-def _parse_known_args(argv: list[str]) -> tuple[argparse.Namespace, list[str]]:
-    parser = argparse.ArgumentParser(add_help=False)
-    parser.add_argument("--canonical-repo", default="")
-    return parser.parse_known_args(argv)
-
-def main() -> int:
-    known, passthrough = _parse_known_args(list(sys.argv[1:]))
-    repo_root = Path(__file__).resolve().parents[1]
-    gui_root = _resolve_canonical_repo(repo_root, str(known.canonical_repo or ""))
-    launcher = gui_root / "scripts" / "launch_monitor.py"
-    if not launcher.exists():
-        print(f"missing launcher: {launcher}", file=sys.stderr)
-        return 2
-
-    argv = passthrough
-    include_fixture = False
-    if "--with-fixture" in argv:
-        include_fixture = True
-        argv.remove("--with-fixture")
-
-    cmd = [
-        sys.executable,
-        str(launcher),
-        "--bridge-repo",
-        str(repo_root),
-        "--no-include-fixture",
-    ]
-    if include_fixture:
-        fixture_repo = os.getenv("FIXTURE_REPO", "").strip()
-        cmd.append("--include-fixture")
-        if fixture_repo and "--fixture-repo" not in argv and "--fixture-target" not in argv:
-            cmd.extend(["--fixture-repo", fixture_repo])
-    cmd.extend(argv)
-    return subprocess.call(cmd, cwd=gui_root)
-
-if __name__ == "__main__":
-    raise SystemExit(main())
-"""
+def launcher_text(role: str) -> str:
+    other = "bridge" if role == "fixture" else "fixture"
+    return LAUNCHER_TEMPLATE.substitute(role=role, other=other, OTHER=other.upper())
 
 
 def write_launcher(repo_root: Path, role: str) -> Path:
     scripts_dir = repo_root / "scripts"
     scripts_dir.mkdir(parents=True, exist_ok=True)
     launcher = scripts_dir / "gui_monitor.py"
-    content = launcher_text_for_fixture() if role == "fixture" else launcher_text_for_bridge()
-    launcher.write_text(content, encoding="utf-8")
+    content = launcher_text(role)
+    try:
+        # Text-mode read undoes the platform newline translation applied when it was written.
+        if launcher.read_text(encoding="utf-8") == content:
+            return launcher
+    except (OSError, UnicodeDecodeError):
+        pass
+    # Write beside the launcher and swap it in, so an interrupted deploy never leaves half a script.
+    staging = launcher.with_name(launcher.name + ".tmp")
+    staging.write_text(content, encoding="utf-8")
+    os.replace(staging, launcher)
     return launcher
 
 
@@ -218,8 +309,9 @@ def deploy_to_repo(source_root: Path, repo_root: Path, role: str, clean: bool) -
         "scripts/ci_target_policy.py",
         "scripts/sync_target_schema.py",
     ]
-    for item in runtime_items:
-        copy_item(source_root, item, embed_root)
+    manifest = load_manifest(embed_root)
+    copy_items(source_root, runtime_items, embed_root, manifest)
+    save_manifest(embed_root, manifest)
 
     launcher = write_launcher(repo_root, role)
     print(f"[{role}] copied_gui={embed_root}")
@@ -228,9 +320,9 @@ def deploy_to_repo(source_root: Path, repo_root: Path, role: str, clean: bool) -
 
 def main() -> int:
     args = parse_args()
-    source_root = Path(__file__).resolve().parents[1]
-    fixture_repo_text = str(args.fixture_repo or "").strip()
-    bridge_repo_text = str(args.bridge_repo or "").strip()
+    source_root = REPO_ROOT
+    fixture_repo_text = _repo_option(args.fixture_repo, "FIXTURE_REPO")
+    bridge_repo_text = _repo_option(args.bridge_repo, "BRIDGE_REPO")
     if not fixture_repo_text:
         raise RuntimeError("fixture repo not provided (--fixture-repo or FIXTURE_REPO).")
     if not bridge_repo_text:
@@ -4,25 +4,88 @@
 from __future__ import annotations
 
 import argparse
+import fnmatch
+import functools
 import json
+import operator
 import os
-import subprocess
 import sys
 from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; json.dumps produces the same document
+    orjson = None
+
+
+def fast_resolve(text: str | Path) -> Path:
+    # Lexical absolute path: anchors relative input at the cwd and folds ".." without the
+    # per-segment lstat of realpath. Symlinks are kept as given.
+    return Path(os.path.abspath(text))
+
+
+@functools.lru_cache(maxsize=None)
+def _stat_path(path_text: str) -> os.stat_result | None:
+    # A launcher run is short-lived, so each include file is stat'ed once however many checks ask.
+    try:
+        return os.stat(path_text)
+    except OSError:
+        return None
+
+
+def path_exists(path: Path) -> bool:
+    return _stat_path(str(path)) is not None
+
+
+def find_missing(path_texts: list[str]) -> list[str]:
+    # Include files mostly share a few config/gui folders: read each folder once and test
+    # names against it instead of stat'ing every file.
+    listings: dict[str, dict[str, os.DirEntry[str]] | None] = {}
+    missing: list[str] = []
+    for text in path_texts:
+        parent, name = os.path.split(text)
+        if parent not in listings:
+            try:
+                with os.scandir(parent) as entries:
+                    # normcase keeps lookups case-insensitive where the filesystem is.
+                    listings[parent] = {os.path.normcase(entry.name): entry for entry in entries}
+            except OSError:
+                listings[parent] = None
+        listing = listings[parent]
+        entry = listing.get(os.path.normcase(name)) if listing is not None else None
+        # A listed symlink still has to point somewhere.
+        if entry is None or (entry.is_symlink() and _stat_path(text) is None):
+            missing.append(text)
+    return missing
 
 
 def resolve_target_file(repo: Path, expected_name: str) -> Path:
-    return (repo / "config" / "gui" / expected_name).resolve()
+    return fast_resolve(repo / "config" / "gui" / expected_name)
 
 
 def resolve_repo_target_files(repo: Path) -> list[Path]:
+    # DirEntry carries the file type from the directory read, so matching names costs no stat.
+    # The base is resolved once; only symlinked entries still need their own resolve().
     base = (repo / "config" / "gui").resolve()
-    if not base.exists():
+    # (lowercased text, path) pairs: the sort key is built once, from the string scandir already has.
+    decorated: list[tuple[str, Path]] = []
+    try:
+        with os.scandir(base) as entries:
+            for entry in entries:
+                if not fnmatch.fnmatchcase(entry.name, "monitor.*.target.json") or not entry.is_file():
+                    continue
+                if entry.is_symlink():
+                    path = Path(entry.path).resolve()
+                    decorated.append((str(path).lower(), path))
+                else:
+                    decorated.append((entry.path.lower(), Path(entry.path)))
+    except OSError:
         return []
-    return sorted(
-        (candidate.resolve() for candidate in base.glob("monitor.*.target.json") if candidate.is_file()),
-        key=lambda item: str(item).lower(),
-    )
+    decorated.sort(key=operator.itemgetter(0))
+    return [path for _, path in decorated]
 
 
 def resolve_fixture_target_files(repo: Path) -> list[Path]:
@@ -34,25 +97,45 @@ def resolve_fixture_target_files(repo: Path) -> list[Path]:
     ]
     result: list[Path] = []
     for name in names:
-        candidate = (base / name).resolve()
-        if candidate.exists():
+        candidate = fast_resolve(base / name)
+        if path_exists(candidate):
             result.append(candidate)
     return result
 
 
-def build_root_config(include_files: list[Path], refresh: float, timeout: float) -> dict:
+def build_root_config(include_files: list[str], refresh: float, timeout: float) -> dict:
     return {
         "refreshSeconds": refresh,
         "commandTimeoutSeconds": timeout,
-        "includeFiles": [str(path) for path in include_files],
+        "includeFiles": include_files,
     }
 
 
+def dump_json(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
+def write_bytes(path: Path, data: bytes) -> None:
+    # Raw fd write: the config is a single small blob, so the buffered text layer adds nothing.
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        # os.write may accept fewer bytes than offered (e.g. on a full disk or a network share).
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 def dedupe_paths(items: list[Path]) -> list[Path]:
     result: list[Path] = []
     seen: set[str] = set()
     for item in items:
-        key = str(item)
+        # normcase folds case and separators on Windows (identity elsewhere), so UNC spellings
+        # of one file collapse to a single include.
+        key = os.path.normcase(os.path.normpath(str(item)))
         if key in seen:
             continue
         seen.add(key)
@@ -68,14 +151,14 @@ def collect_generic_targets(args: argparse.Namespace) -> list[Path]:
         text = str(target_text or "").strip()
         if not text:
             continue
-        targets.append(Path(text).resolve())
+        targets.append(fast_resolve(text))
 
     repo_values = args.repo if isinstance(args.repo, list) else []
     for repo_text in repo_values:
         text = str(repo_text or "").strip()
         if not text:
             continue
-        repo = Path(text).resolve()
+        repo = fast_resolve(text)
         discovered = resolve_repo_target_files(repo)
         if not discovered:
             raise RuntimeError(
@@ -91,10 +174,10 @@ def collect_legacy_targets(args: argparse.Namespace) -> list[Path]:
     include_files: list[Path] = []
 
     if args.include_fixture:
-        if args.fixture_target.strip():
-            fixture_target = Path(args.fixture_target).resolve()
+        if args.fixture_target:
+            fixture_target = fast_resolve(args.fixture_target)
             include_files.append(fixture_target)
-        elif args.fixture_repo.strip():
+        elif args.fixture_repo:
             fixture_targets = resolve_fixture_target_files(Path(args.fixture_repo))
             if not fixture_targets:
                 fixture_target = resolve_target_file(Path(args.fixture_repo), "monitor.fixture.target.json")
@@ -108,9 +191,9 @@ def collect_legacy_targets(args: argparse.Namespace) -> list[Path]:
             )
 
     if args.include_bridge:
-        if args.bridge_target.strip():
-            bridge_target = Path(args.bridge_target).resolve()
-        elif args.bridge_repo.strip():
+        if args.bridge_target:
+            bridge_target = fast_resolve(args.bridge_target)
+        elif args.bridge_repo:
             bridge_target = resolve_target_file(Path(args.bridge_repo), "monitor.bridge.target.json")
         else:
             raise RuntimeError(
@@ -125,7 +208,16 @@ def collect_legacy_targets(args: argparse.Namespace) -> list[Path]:
     return include_files
 
 
-def parse_args() -> argparse.Namespace:
+def _env(name: str) -> str:
+    return (os.environ.get(name) or "").strip()
+
+
+def _repo_option(value: str | None, env_name: str) -> str:
+    # Options default to None so the environment is only read when the flag is absent.
+    return _env(env_name) if value is None else value.strip()
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
         "--repo",
@@ -139,10 +231,10 @@ def parse_args() -> argparse.Namespace:
         default=[],
         help="Explicit target file path. May be repeated.",
     )
-    parser.add_argument("--fixture-repo", default=os.getenv("FIXTURE_REPO", "").strip())
-    parser.add_argument("--bridge-repo", default=os.getenv("BRIDGE_REPO", "").strip())
-    parser.add_argument("--fixture-target", default=os.getenv("FIXTURE_TARGET", "").strip())
-    parser.add_argument("--bridge-target", default=os.getenv("BRIDGE_TARGET", "").strip())
+    parser.add_argument("--fixture-repo", default=None)
+    parser.add_argument("--bridge-repo", default=None)
+    parser.add_argument("--fixture-target", default=None)
+    parser.add_argument("--bridge-target", default=None)
     parser.add_argument(
         "--include-fixture",
         action=argparse.BooleanOptionalAction,
@@ -161,12 +253,18 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--validate-only", action="store_true")
     parser.add_argument("--no-launch", action="store_true")
     parser.add_argument("--print-config", action="store_true")
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
-def main() -> int:
-    args = parse_args()
-    repo_root = Path(__file__).resolve().parents[1]
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    args.fixture_repo = _repo_option(args.fixture_repo, "FIXTURE_REPO")
+    args.bridge_repo = _repo_option(args.bridge_repo, "BRIDGE_REPO")
+    args.fixture_target = _repo_option(args.fixture_target, "FIXTURE_TARGET")
+    args.bridge_target = _repo_option(args.bridge_target, "BRIDGE_TARGET")
+    repo_root = REPO_ROOT
+    # The stat cache is per run; a caller invoking main() again must see files created since.
+    _stat_path.cache_clear()
 
     try:
         generic_targets = collect_generic_targets(args)
@@ -178,7 +276,9 @@ def main() -> int:
         print(str(ex), file=sys.stderr)
         return 2
 
-    missing = [str(path) for path in include_files if not path.exists()]
+    # Paths become strings once; the existence check and the config both use them as-is.
+    include_paths = [str(path) for path in include_files]
+    missing = find_missing(include_paths)
     if missing:
         for item in missing:
             print(f"missing target config: {item}", file=sys.stderr)
@@ -190,15 +290,16 @@ def main() -> int:
     config_out.parent.mkdir(parents=True, exist_ok=True)
 
     payload = build_root_config(
-        include_files=include_files,
+        include_files=include_paths,
         refresh=args.refresh_seconds,
         timeout=args.timeout_seconds,
     )
-    config_out.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    config_data = dump_json(payload)
+    write_bytes(config_out, config_data)
 
     print(f"wrote config: {config_out}")
     if args.print_config:
-        print(json.dumps(payload, indent=2))
+        print(config_data.decode("utf-8"))
 
     if args.no_launch:
         return 0
@@ -207,6 +308,9 @@ def main() -> int:
     cmd = [sys.executable, str(monitor_py), "--config", str(config_out)]
     if args.validate_only:
         cmd.append("--validate-config")
+    # Only the launch path needs subprocess; --no-launch runs never import it.
+    import subprocess
+
     return subprocess.call(cmd, cwd=repo_root)
 
 
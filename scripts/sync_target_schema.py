@@ -4,11 +4,13 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import os
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
 SCHEMA_NAME = "monitor.target.v2.schema.json"
 
 
@@ -16,6 +18,8 @@ def _target_schema_path(repo_root: Path) -> Path:
     return (repo_root / "config" / "gui" / SCHEMA_NAME).resolve()
 
 
+# The source schema lives in this repo, so repeated main() calls in one process probe it once.
+@functools.lru_cache(maxsize=1)
 def _canonical_schema_path(repo_root: Path) -> Path:
     preferred = (repo_root / "contract" / "schemas" / SCHEMA_NAME).resolve()
     if preferred.exists():
@@ -23,7 +27,58 @@ def _canonical_schema_path(repo_root: Path) -> Path:
     return (repo_root / "schemas" / SCHEMA_NAME).resolve()
 
 
-def parse_args() -> argparse.Namespace:
+def _copy_file_range(src: Path, dst: Path) -> bool:
+    # In-kernel copy (reflink or server-side copy on NFS/SMB where supported). Returns False
+    # when the kernel or filesystem pair cannot do it, leaving the caller to copy normally.
+    if not hasattr(os, "copy_file_range"):
+        return False
+    try:
+        with open(src, "rb") as source:
+            # Not truncated on open: the old bytes are overwritten in place and any tail is cut
+            # only once the whole source has been copied.
+            target = os.open(dst, os.O_WRONLY | os.O_CREAT, 0o666)
+            try:
+                size = os.fstat(source.fileno()).st_size
+                remaining = size
+                while remaining > 0:
+                    copied = os.copy_file_range(source.fileno(), target, remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                if remaining > 0:
+                    return False
+                os.ftruncate(target, size)
+            finally:
+                os.close(target)
+        return True
+    except OSError:
+        return False
+
+
+def _copy_schema(src_schema: Path, dst: Path) -> None:
+    # Deferred so --dry-run never imports shutil.
+    import shutil
+
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    # A destination that resolves to the source (e.g. a symlinked schema) must not be opened
+    # for writing; refuse it as shutil.copy2 does.
+    if dst.exists() and os.path.samefile(src_schema, dst):
+        raise shutil.SameFileError(f"{src_schema} and {dst} are the same file")
+    if not _copy_file_range(src_schema, dst):
+        shutil.copyfile(src_schema, dst)
+    shutil.copystat(src_schema, dst)
+
+
+def _env(name: str) -> str:
+    return (os.environ.get(name) or "").strip()
+
+
+def _repo_option(value: str | None, env_name: str) -> str:
+    # Options default to None so the environment is only read when the flag is absent.
+    return _env(env_name) if value is None else value.strip()
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
         "--repo",
@@ -31,16 +86,15 @@ def parse_args() -> argparse.Namespace:
         default=[],
         help="Generic app repo root to receive schema copy. May be repeated.",
     )
-    parser.add_argument("--fixture-repo", default=os.getenv("FIXTURE_REPO", "").strip())
-    parser.add_argument("--bridge-repo", default=os.getenv("BRIDGE_REPO", "").strip())
+    parser.add_argument("--fixture-repo", default=None)
+    parser.add_argument("--bridge-repo", default=None)
     parser.add_argument("--dry-run", action="store_true")
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
-def main() -> int:
-    args = parse_args()
-    repo_root = Path(__file__).resolve().parents[1]
-    src_schema = _canonical_schema_path(repo_root)
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    src_schema = _canonical_schema_path(REPO_ROOT)
     if not src_schema.exists():
         raise SystemExit(f"missing canonical schema: {src_schema}")
 
@@ -51,8 +105,8 @@ def main() -> int:
         if text:
             repo_roots.append(Path(text).resolve())
 
-    fixture_repo = str(args.fixture_repo or "").strip()
-    bridge_repo = str(args.bridge_repo or "").strip()
+    fixture_repo = _repo_option(args.fixture_repo, "FIXTURE_REPO")
+    bridge_repo = _repo_option(args.bridge_repo, "BRIDGE_REPO")
     if fixture_repo:
         repo_roots.append(Path(fixture_repo).resolve())
     if bridge_repo:
@@ -83,11 +137,12 @@ def main() -> int:
 
     for dst in destinations:
         print(f"{src_schema} -> {dst}")
-        if args.dry_run:
-            continue
-        dst.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(src_schema, dst)
+    if args.dry_run or not destinations:
+        return 0
 
+    # Destinations are independent (often separate network shares), so copies overlap.
+    with ThreadPoolExecutor(max_workers=min(8, len(destinations))) as pool:
+        list(pool.map(lambda dst: _copy_schema(src_schema, dst), destinations))
     return 0
 
 
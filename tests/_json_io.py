@@ -0,0 +1,24 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; the stdlib path decodes the same documents
+    orjson = None
+
+_BOM = b"\xef\xbb\xbf"
+
+
+def loads(data: bytes) -> Any:
+    # Some checked-in JSON is saved with a UTF-8 BOM, which orjson rejects.
+    if data.startswith(_BOM):
+        data = data[len(_BOM):]
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
@@ -0,0 +1,5 @@
+import os
+
+# Test fixtures are tiny files written and read straight back; keep them in RAM when the
+# host has a writable tmpfs. None lets tempfile fall back to its usual directory.
+TMP_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
@@ -1,47 +1,64 @@
+import contextlib
+import io
 import subprocess
+import sys
 import unittest
 from pathlib import Path
 
+from scripts import check_target_contract
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _run_script(script: Path, args: list[str], cwd: Path) -> subprocess.CompletedProcess:
+    # Same interpreter as the test run; -I skips user site scanning and close_fds=False lets
+    # subprocess take its posix_spawn/vfork path.
+    return subprocess.run(
+        [sys.executable, "-I", str(script), *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=False,
+        close_fds=False,
+    )
+
+
+def _run_main(argv: list[str]) -> tuple[int, str, str]:
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        returncode = check_target_contract.main(argv)
+    return returncode, stdout.getvalue(), stderr.getvalue()
+
 
 class CheckTargetContractTests(unittest.TestCase):
     def test_accepts_ipc_target_without_local_actions(self):
-        repo_root = Path(__file__).resolve().parents[1]
+        repo_root = REPO_ROOT
         script = repo_root / "scripts" / "check_target_contract.py"
         target = repo_root / "contract" / "golden" / "target.v2.config_widgets.json"
 
-        completed = subprocess.run(
-            ["python", str(script), "--target", str(target)],
-            cwd=repo_root,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        completed = _run_script(script, ["--target", str(target)], repo_root)
         self.assertEqual(completed.returncode, 0, msg=f"stdout={completed.stdout}\nstderr={completed.stderr}")
 
     def test_top_tab_policy_is_opt_in(self):
-        repo_root = Path(__file__).resolve().parents[1]
-        script = repo_root / "scripts" / "check_target_contract.py"
+        repo_root = REPO_ROOT
         target = repo_root / "contract" / "golden" / "target.v2.ipc.min.json"
 
-        default_run = subprocess.run(
-            ["python", str(script), "--target", str(target)],
-            cwd=repo_root,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        self.assertEqual(default_run.returncode, 0, msg=f"stdout={default_run.stdout}\nstderr={default_run.stderr}")
-
-        strict_run = subprocess.run(
-            ["python", str(script), "--target", str(target), "--enforce-top-tabs"],
-            cwd=repo_root,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        self.assertNotEqual(strict_run.returncode, 0)
-        self.assertIn("missing required top-level tabs", strict_run.stdout)
+        returncode, stdout, stderr = _run_main(["--target", str(target)])
+        self.assertEqual(returncode, 0, msg=f"stdout={stdout}\nstderr={stderr}")
+
+        returncode, stdout, _ = _run_main(["--target", str(target), "--enforce-top-tabs"])
+        self.assertNotEqual(returncode, 0)
+        self.assertIn("missing required top-level tabs", stdout)
+
+    def test_checks_repeated_targets_in_one_run(self):
+        repo_root = REPO_ROOT
+        config_target = repo_root / "contract" / "golden" / "target.v2.config_widgets.json"
+        min_target = repo_root / "contract" / "golden" / "target.v2.ipc.min.json"
 
+        returncode, stdout, stderr = _run_main(["--target", str(config_target), "--target", str(min_target)])
+        self.assertEqual(returncode, 0, msg=f"stdout={stdout}\nstderr={stderr}")
+        self.assertEqual(stdout.count("OK: "), 2)
+        self.assertIn("SUMMARY: failed=0 total=2", stdout)
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,105 +1,76 @@
-﻿import subprocess
+﻿import contextlib
+import io
 import tempfile
 import unittest
 from pathlib import Path
 
+from _tmpfs import TMP_ROOT
+from scripts import ci_target_policy
+
 
 FULL_TABS_TARGET = (
-    '{"configVersion":2,"id":"fixture","title":"Fixture","control":{"mode":"ipc","endpoint":"127.0.0.1:8766","appId":"fixture"},'
-    '"ui":{"tabs":['
-    '{"id":"status","title":"Status","widgets":[{"type":"text_block","title":"Status","text":"ok"}]},'
-    '{"id":"config","title":"Config","widgets":[{"type":"text_block","title":"Config","text":"ok"}]},'
-    '{"id":"actions","title":"Actions","widgets":[{"type":"text_block","title":"Actions","text":"ok"}]},'
-    '{"id":"logs","title":"Logs","widgets":[{"type":"text_block","title":"Logs","text":"ok"}]}'
-    ']}}'
+    b'{"configVersion":2,"id":"fixture","title":"Fixture","control":{"mode":"ipc","endpoint":"127.0.0.1:8766","appId":"fixture"},'
+    b'"ui":{"tabs":['
+    b'{"id":"status","title":"Status","widgets":[{"type":"text_block","title":"Status","text":"ok"}]},'
+    b'{"id":"config","title":"Config","widgets":[{"type":"text_block","title":"Config","text":"ok"}]},'
+    b'{"id":"actions","title":"Actions","widgets":[{"type":"text_block","title":"Actions","text":"ok"}]},'
+    b'{"id":"logs","title":"Logs","widgets":[{"type":"text_block","title":"Logs","text":"ok"}]}'
+    b']}}'
 )
 
 MISSING_TABS_TARGET = (
-    '{"configVersion":2,"id":"fixture","title":"Fixture","control":{"mode":"ipc","endpoint":"127.0.0.1:8766","appId":"fixture"},'
-    '"ui":{"tabs":[{"id":"status","title":"Status","widgets":[{"type":"text_block","title":"Status","text":"ok"}]}]}}'
+    b'{"configVersion":2,"id":"fixture","title":"Fixture","control":{"mode":"ipc","endpoint":"127.0.0.1:8766","appId":"fixture"},'
+    b'"ui":{"tabs":[{"id":"status","title":"Status","widgets":[{"type":"text_block","title":"Status","text":"ok"}]}]}}'
 )
 
 
-class CiTargetPolicyTests(unittest.TestCase):
-    def test_passes_when_required_top_tabs_exist(self):
-        repo_root = Path(__file__).resolve().parents[1]
-        script = repo_root / "scripts" / "ci_target_policy.py"
-
-        with tempfile.TemporaryDirectory() as fixture_tmp:
-            fixture_repo = Path(fixture_tmp)
-            target = fixture_repo / "config" / "gui" / "monitor.fixture.target.json"
-            target.parent.mkdir(parents=True, exist_ok=True)
-            target.write_text(FULL_TABS_TARGET, encoding="utf-8")
-
-            completed = subprocess.run(
-                [
-                    "python",
-                    str(script),
-                    "--fixture-repo",
-                    str(fixture_repo),
-                    "--no-include-bridge",
-                ],
-                cwd=repo_root,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-
-        self.assertEqual(completed.returncode, 0, msg=f"stdout={completed.stdout}\nstderr={completed.stderr}")
-        self.assertIn("OK: strict policy check passed", completed.stdout)
+def _run_main(argv: list[str]) -> tuple[int, str, str]:
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        returncode = ci_target_policy.main(argv)
+    return returncode, stdout.getvalue(), stderr.getvalue()
 
-    def test_fails_when_required_top_tabs_missing(self):
-        repo_root = Path(__file__).resolve().parents[1]
-        script = repo_root / "scripts" / "ci_target_policy.py"
 
-        with tempfile.TemporaryDirectory() as fixture_tmp:
-            fixture_repo = Path(fixture_tmp)
-            target = fixture_repo / "config" / "gui" / "monitor.fixture.target.json"
+class CiTargetPolicyTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Target files are only read by the policy check, so every test shares one tree.
+        cls._tmp = tempfile.TemporaryDirectory(dir=TMP_ROOT)
+        root = Path(cls._tmp.name)
+        cls.full_repo = root / "full"
+        cls.missing_repo = root / "missing"
+        # Generic --repo discovery must find target names other than fixture/bridge.
+        cls.sample_repo = root / "sample"
+        trees = (
+            (cls.full_repo, "monitor.fixture.target.json", FULL_TABS_TARGET),
+            (cls.missing_repo, "monitor.fixture.target.json", MISSING_TABS_TARGET),
+            (cls.sample_repo, "monitor.sample.target.json", FULL_TABS_TARGET),
+        )
+        for repo, name, text in trees:
+            target = repo / "config" / "gui" / name
             target.parent.mkdir(parents=True, exist_ok=True)
-            target.write_text(MISSING_TABS_TARGET, encoding="utf-8")
-
-            completed = subprocess.run(
-                [
-                    "python",
-                    str(script),
-                    "--fixture-repo",
-                    str(fixture_repo),
-                    "--no-include-bridge",
-                ],
-                cwd=repo_root,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-
-        self.assertNotEqual(completed.returncode, 0)
-        self.assertIn("missing required top-level tabs", completed.stdout)
+            target.write_bytes(text)
 
-    def test_passes_with_generic_repo_flag(self):
-        repo_root = Path(__file__).resolve().parents[1]
-        script = repo_root / "scripts" / "ci_target_policy.py"
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
 
-        with tempfile.TemporaryDirectory() as app_tmp:
-            app_repo = Path(app_tmp)
-            target = app_repo / "config" / "gui" / "monitor.sample.target.json"
-            target.parent.mkdir(parents=True, exist_ok=True)
-            target.write_text(FULL_TABS_TARGET, encoding="utf-8")
+    def test_passes_when_required_top_tabs_exist(self):
+        cases = {
+            "fixture-repo": ["--fixture-repo", str(self.full_repo), "--no-include-bridge"],
+            "generic-repo": ["--repo", str(self.sample_repo)],
+        }
+        for name, argv in cases.items():
+            with self.subTest(name):
+                returncode, stdout, stderr = _run_main(argv)
+                self.assertEqual(returncode, 0, msg=f"stdout={stdout}\nstderr={stderr}")
+                self.assertIn("OK: strict policy check passed", stdout)
 
-            completed = subprocess.run(
-                [
-                    "python",
-                    str(script),
-                    "--repo",
-                    str(app_repo),
-                ],
-                cwd=repo_root,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
+    def test_fails_when_required_top_tabs_missing(self):
+        returncode, stdout, _ = _run_main(["--fixture-repo", str(self.missing_repo), "--no-include-bridge"])
 
-        self.assertEqual(completed.returncode, 0, msg=f"stdout={completed.stdout}\nstderr={completed.stderr}")
-        self.assertIn("OK: strict policy check passed", completed.stdout)
+        self.assertNotEqual(returncode, 0)
+        self.assertIn("missing required top-level tabs", stdout)
 
 
 if __name__ == "__main__":
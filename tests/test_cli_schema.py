@@ -1,37 +1,36 @@
-import json
 import unittest
 from pathlib import Path
 
+from _json_io import loads
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
 
 class CliSchemaTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Parse each schema copy once; the tests only read from the loaded documents.
+        repo_root = REPO_ROOT
+        cls._root_schema = loads((repo_root / "cli.schema.json").read_bytes())
+        cls._nested_schema = loads((repo_root / "schemas" / "cli.schema.json").read_bytes())
+        # Subscripting raises KeyError on a missing section, which fails the class just as loudly.
+        cls._root_props = cls._root_schema["properties"]
+        cls._cmd_def = cls._root_schema["$defs"]["command"]
+
     def test_cli_schema_has_core_keys(self):
-        schema_path = Path(__file__).resolve().parents[1] / "cli.schema.json"
-        self.assertTrue(schema_path.exists(), "cli.schema.json must exist")
-        payload = json.loads(schema_path.read_text(encoding="utf-8"))
+        payload = self._root_schema
         self.assertIn("$schema", payload)
         self.assertIn("$defs", payload)
-        self.assertEqual(payload.get("properties", {}).get("root", {}).get("const"), "dev")
-        commands_items = payload.get("properties", {}).get("commands", {}).get("items", {})
-        self.assertEqual(commands_items.get("$ref"), "#/$defs/command")
+        self.assertEqual(self._root_props["root"]["const"], "dev")
+        self.assertEqual(self._root_props["commands"]["items"]["$ref"], "#/$defs/command")
 
     def test_cli_schema_copies_are_identical(self):
-        repo_root = Path(__file__).resolve().parents[1]
-        root_schema = repo_root / "cli.schema.json"
-        nested_schema = repo_root / "schemas" / "cli.schema.json"
-        self.assertTrue(root_schema.exists())
-        self.assertTrue(nested_schema.exists())
-        self.assertEqual(
-            json.loads(root_schema.read_text(encoding="utf-8")),
-            json.loads(nested_schema.read_text(encoding="utf-8")),
-        )
+        self.assertEqual(self._root_schema, self._nested_schema)
 
     def test_cli_schema_command_requires_expected_fields(self):
-        schema_path = Path(__file__).resolve().parents[1] / "cli.schema.json"
-        payload = json.loads(schema_path.read_text(encoding="utf-8"))
-        command_required = payload.get("$defs", {}).get("command", {}).get("required", [])
-        self.assertEqual(command_required, ["id", "scope", "syntax", "brief"])
-        scopes = payload.get("$defs", {}).get("command", {}).get("properties", {}).get("scope", {}).get("enum", [])
-        self.assertEqual(scopes, ["universal", "fixture-only", "bridge-only"])
+        self.assertEqual(self._cmd_def["required"], ["id", "scope", "syntax", "brief"])
+        self.assertEqual(self._cmd_def["properties"]["scope"]["enum"], ["universal", "fixture-only", "bridge-only"])
 
 
 if __name__ == "__main__":
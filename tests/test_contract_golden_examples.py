@@ -1,26 +1,35 @@
-import json
 import tempfile
 import unittest
 from pathlib import Path
 
 import monitor
+from _json_io import dumps, loads
+from _tmpfs import TMP_ROOT
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
 
 
 class ContractGoldenExamplesTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Glob and resolve the golden set once for the class.
+        cls._golden_dir = REPO_ROOT / "contract" / "golden"
+        cls._target_files = [str(path.resolve()) for path in sorted(cls._golden_dir.glob("target.v2.*.json"))]
+        cls._canonical_show_payload = loads((cls._golden_dir / "config_show_payload.json").read_bytes())
+
     def test_loads_all_target_golden_examples(self):
-        repo_root = Path(__file__).resolve().parents[1]
-        golden_dir = repo_root / "contract" / "golden"
-        target_files = sorted(golden_dir.glob("target.v2.*.json"))
+        target_files = self._target_files
         self.assertGreaterEqual(len(target_files), 2)
 
-        with tempfile.TemporaryDirectory() as tmp:
+        with tempfile.TemporaryDirectory(dir=TMP_ROOT) as tmp:
             root_config = Path(tmp) / "monitor_config.json"
             payload = {
                 "refreshSeconds": 1.0,
                 "commandTimeoutSeconds": 10.0,
-                "includeFiles": [str(path.resolve()) for path in target_files],
+                "includeFiles": target_files,
             }
-            root_config.write_text(json.dumps(payload), encoding="utf-8")
+            root_config.write_bytes(dumps(payload))
 
             loaded = monitor.load_monitor_config(root_config)
             targets = loaded.get("targets", [])
@@ -30,11 +39,7 @@ class ContractGoldenExamplesTests(unittest.TestCase):
         self.assertIn("sample-config", ids)
 
     def test_canonical_config_show_payload_shape_is_supported(self):
-        repo_root = Path(__file__).resolve().parents[1]
-        payload_path = repo_root / "contract" / "golden" / "config_show_payload.json"
-        payload = json.loads(payload_path.read_text(encoding="utf-8-sig"))
-
-        normalized = monitor._normalize_config_show_payload(payload)
+        normalized = monitor._normalize_config_show_payload(self._canonical_show_payload)
         self.assertIsInstance(normalized.get("paths"), list)
         self.assertIsInstance(normalized.get("entries"), list)
 
@@ -67,6 +72,17 @@ class ContractGoldenExamplesTests(unittest.TestCase):
         self.assertEqual(entries[0].get("allowed"), ["sim", "lab"])
         self.assertEqual(entries[0].get("path"), "C:/repos/sample/config/profiles/sim.json")
 
+    def test_config_show_keeps_path_order_and_returns_copies(self):
+        for order in (["zeta", "alpha"], ["alpha", "zeta"]):
+            with self.subTest(order=order):
+                payload = {"paths": {key: f"C:/cfg/{key}.json" for key in order}, "entries": []}
+                first = monitor._normalize_config_show_payload(payload)
+                self.assertEqual([item["key"] for item in first["paths"]], order)
+
+                first["paths"].clear()
+                second = monitor._normalize_config_show_payload(payload)
+                self.assertEqual([item["key"] for item in second["paths"]], order)
+
 
 if __name__ == "__main__":
     unittest.main()
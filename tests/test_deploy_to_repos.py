@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from _tmpfs import TMP_ROOT
+from scripts import deploy_to_repos
+
+
+class DeployToReposTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory(dir=TMP_ROOT)
+        cls.addClassCleanup(cls._tmp.cleanup)
+
+    def _source_and_dest(self) -> tuple[Path, Path]:
+        case_dir = Path(tempfile.mkdtemp(dir=self._tmp.name))
+        source, dest = case_dir / "source", case_dir / "dest"
+        (source / "bundle" / "nested").mkdir(parents=True)
+        (source / "bundle" / "a.txt").write_bytes(b"alpha")
+        (source / "bundle" / "nested" / "b.txt").write_bytes(b"beta")
+        (source / "bundle" / "nested" / "skip.pyc").write_bytes(b"\0")
+        (source / "top.md").write_bytes(b"# top")
+        dest.mkdir()
+        return source, dest
+
+    def test_copy_items_records_manifest_and_skips_unchanged_files(self):
+        source, dest = self._source_and_dest()
+        manifest: dict = {}
+        deploy_to_repos.copy_items(source, ["bundle", "top.md"], dest, manifest)
+
+        self.assertEqual(sorted(manifest), ["bundle/a.txt", "bundle/nested/b.txt", "top.md"])
+        self.assertEqual((dest / "bundle" / "nested" / "b.txt").read_bytes(), b"beta")
+        self.assertFalse((dest / "bundle" / "nested" / "skip.pyc").exists())
+
+        with mock.patch.object(deploy_to_repos, "fast_copy2", side_effect=AssertionError("copied")):
+            deploy_to_repos.copy_items(source, ["bundle", "top.md"], dest, manifest)
+
+        (source / "bundle" / "a.txt").write_bytes(b"alpha, edited")
+        with mock.patch.object(deploy_to_repos, "fast_copy2", wraps=deploy_to_repos.fast_copy2) as copy:
+            deploy_to_repos.copy_items(source, ["bundle"], dest, manifest)
+        self.assertEqual([Path(call.args[1]).name for call in copy.call_args_list], ["a.txt"])
+        self.assertEqual((dest / "bundle" / "a.txt").read_bytes(), b"alpha, edited")
+        # top.md is no longer part of the bundle, so its record is dropped.
+        self.assertEqual(sorted(manifest), ["bundle/a.txt", "bundle/nested/b.txt"])
+
+    def test_manifest_round_trips_and_ignores_corrupt_files(self):
+        _, dest = self._source_and_dest()
+        manifest = {"bundle/a.txt": [5, 1, "digest"]}
+        deploy_to_repos.save_manifest(dest, manifest)
+        self.assertEqual(deploy_to_repos.load_manifest(dest), manifest)
+
+        (dest / deploy_to_repos.MANIFEST_NAME).write_bytes(b"{not json")
+        self.assertEqual(deploy_to_repos.load_manifest(dest), {})
+
+    def test_fast_copy2_keeps_content_and_mtime(self):
+        source, dest = self._source_and_dest()
+        source_file = source / "top.md"
+        os.utime(source_file, ns=(1_700_000_000_000_000_000, 1_700_000_000_000_000_000))
+        deploy_to_repos.fast_copy2(source_file, dest / "top.md")
+        self.assertEqual((dest / "top.md").read_bytes(), b"# top")
+        self.assertEqual((dest / "top.md").stat().st_mtime_ns, source_file.stat().st_mtime_ns)
+
+
+if __name__ == "__main__":
+    unittest.main()
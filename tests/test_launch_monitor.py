@@ -1,65 +1,88 @@
-import json
+import contextlib
+import io
 import os
 import subprocess
+import sys
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
+
+from _json_io import loads
+from _tmpfs import TMP_ROOT
+from scripts import launch_monitor
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+# The test interpreter, isolated (-I) and without site-packages (-S); orjson is optional for the script.
+PYTHON = [sys.executable, "-I", "-S"]
+
+FIXTURE_TARGET = b'{"configVersion":2,"id":"fixture","title":"Fixture","control":{"mode":"ipc","endpoint":"127.0.0.1:8766","appId":"fixture"},"ui":{"tabs":[]}}'
+BRIDGE_TARGET = b'{"configVersion":2,"id":"bridge","title":"Bridge","control":{"mode":"ipc","endpoint":"127.0.0.1:8765","appId":"bridge"},"ui":{"tabs":[]}}'
+
+
+def _run_main(argv: list[str]) -> tuple[int, str, str]:
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        returncode = launch_monitor.main(argv)
+    return returncode, stdout.getvalue(), stderr.getvalue()
 
 
 class LaunchMonitorTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Cases get directories under one class-level temp tree, removed in a single sweep.
+        cls._tmp = tempfile.TemporaryDirectory(dir=TMP_ROOT)
+        cls.addClassCleanup(cls._tmp.cleanup)
+
+    def _case_dirs(self, count: int) -> list[Path]:
+        return [Path(tempfile.mkdtemp(dir=self._tmp.name)) for _ in range(count)]
+
     def test_generates_root_config_from_repo_paths(self):
-        repo_root = Path(__file__).resolve().parents[1]
+        repo_root = REPO_ROOT
         script = repo_root / "scripts" / "launch_monitor.py"
         self.assertTrue(script.exists())
 
-        with tempfile.TemporaryDirectory() as fixture_tmp, tempfile.TemporaryDirectory() as bridge_tmp, tempfile.TemporaryDirectory() as out_tmp:
-            fixture_repo = Path(fixture_tmp)
-            bridge_repo = Path(bridge_tmp)
-            fixture_target = fixture_repo / "config" / "gui" / "monitor.fixture.target.json"
-            bridge_target = bridge_repo / "config" / "gui" / "monitor.bridge.target.json"
-            fixture_target.parent.mkdir(parents=True, exist_ok=True)
-            bridge_target.parent.mkdir(parents=True, exist_ok=True)
-            fixture_target.write_text('{"configVersion":2,"id":"fixture","title":"Fixture","control":{"mode":"ipc","endpoint":"127.0.0.1:8766","appId":"fixture"},"ui":{"tabs":[]}}', encoding="utf-8")
-            bridge_target.write_text('{"configVersion":2,"id":"bridge","title":"Bridge","control":{"mode":"ipc","endpoint":"127.0.0.1:8765","appId":"bridge"},"ui":{"tabs":[]}}', encoding="utf-8")
-
-            config_out = Path(out_tmp) / "generated.json"
-            cmd = [
-                "python",
-                str(script),
-                "--fixture-repo",
-                str(fixture_repo),
-                "--bridge-repo",
-                str(bridge_repo),
-                "--config-out",
-                str(config_out),
-                "--no-launch",
-            ]
-            completed = subprocess.run(cmd, cwd=repo_root, capture_output=True, text=True, check=False)
-            self.assertEqual(completed.returncode, 0, msg=completed.stderr)
-            self.assertTrue(config_out.exists())
-
-            payload = json.loads(config_out.read_text(encoding="utf-8"))
-            includes = payload.get("includeFiles", [])
-            self.assertEqual(len(includes), 2)
-            self.assertTrue(any("monitor.fixture.target.json" in item for item in includes))
-            self.assertTrue(any("monitor.bridge.target.json" in item for item in includes))
+        fixture_repo, bridge_repo, out_dir = self._case_dirs(3)
+        fixture_target = fixture_repo / "config" / "gui" / "monitor.fixture.target.json"
+        bridge_target = bridge_repo / "config" / "gui" / "monitor.bridge.target.json"
+        fixture_target.parent.mkdir(parents=True, exist_ok=True)
+        bridge_target.parent.mkdir(parents=True, exist_ok=True)
+        fixture_target.write_bytes(FIXTURE_TARGET)
+        bridge_target.write_bytes(BRIDGE_TARGET)
+
+        config_out = out_dir / "generated.json"
+        # One run through the real CLI; the other cases call main() in-process.
+        cmd = [
+            *PYTHON,
+            str(script),
+            "--fixture-repo",
+            str(fixture_repo),
+            "--bridge-repo",
+            str(bridge_repo),
+            "--config-out",
+            str(config_out),
+            "--no-launch",
+        ]
+        completed = subprocess.run(cmd, cwd=repo_root, capture_output=True, text=True, check=False)
+        self.assertEqual(completed.returncode, 0, msg=completed.stderr)
+        self.assertTrue(config_out.exists())
+
+        payload = loads(config_out.read_bytes())
+        includes = payload.get("includeFiles", [])
+        self.assertEqual(len(includes), 2)
+        self.assertTrue(any("monitor.fixture.target.json" in item for item in includes))
+        self.assertTrue(any("monitor.bridge.target.json" in item for item in includes))
 
     def test_can_generate_fixture_only_config(self):
-        repo_root = Path(__file__).resolve().parents[1]
-        script = repo_root / "scripts" / "launch_monitor.py"
-        self.assertTrue(script.exists())
-
-        with tempfile.TemporaryDirectory() as fixture_tmp, tempfile.TemporaryDirectory() as bridge_tmp, tempfile.TemporaryDirectory() as out_tmp:
-            fixture_repo = Path(fixture_tmp)
-            bridge_repo = Path(bridge_tmp)
-            fixture_target = fixture_repo / "config" / "gui" / "monitor.fixture.target.json"
-            fixture_target.parent.mkdir(parents=True, exist_ok=True)
-            fixture_target.write_text('{"configVersion":2,"id":"fixture","title":"Fixture","control":{"mode":"ipc","endpoint":"127.0.0.1:8766","appId":"fixture"},"ui":{"tabs":[]}}', encoding="utf-8")
-
-            config_out = Path(out_tmp) / "generated-fixture-only.json"
-            cmd = [
-                "python",
-                str(script),
+        fixture_repo, bridge_repo, out_dir = self._case_dirs(3)
+        fixture_target = fixture_repo / "config" / "gui" / "monitor.fixture.target.json"
+        fixture_target.parent.mkdir(parents=True, exist_ok=True)
+        fixture_target.write_bytes(FIXTURE_TARGET)
+
+        config_out = out_dir / "generated-fixture-only.json"
+        returncode, _, stderr = _run_main(
+            [
                 "--fixture-repo",
                 str(fixture_repo),
                 "--bridge-repo",
@@ -69,75 +92,52 @@ class LaunchMonitorTests(unittest.TestCase):
                 str(config_out),
                 "--no-launch",
             ]
-            completed = subprocess.run(cmd, cwd=repo_root, capture_output=True, text=True, check=False)
-            self.assertEqual(completed.returncode, 0, msg=completed.stderr)
-            self.assertTrue(config_out.exists())
+        )
+        self.assertEqual(returncode, 0, msg=stderr)
+        self.assertTrue(config_out.exists())
 
-            payload = json.loads(config_out.read_text(encoding="utf-8"))
-            includes = payload.get("includeFiles", [])
-            self.assertEqual(len(includes), 1)
-            self.assertTrue(any("monitor.fixture.target.json" in item for item in includes))
+        payload = loads(config_out.read_bytes())
+        includes = payload.get("includeFiles", [])
+        self.assertEqual(len(includes), 1)
+        self.assertTrue(any("monitor.fixture.target.json" in item for item in includes))
 
     def test_requires_explicit_paths_when_env_is_empty(self):
-        repo_root = Path(__file__).resolve().parents[1]
-        script = repo_root / "scripts" / "launch_monitor.py"
-        self.assertTrue(script.exists())
-
-        env = dict(os.environ)
-        env.pop("FIXTURE_REPO", None)
-        env.pop("BRIDGE_REPO", None)
-        env.pop("FIXTURE_TARGET", None)
-        env.pop("BRIDGE_TARGET", None)
-
-        completed = subprocess.run(
-            ["python", str(script), "--no-launch"],
-            cwd=repo_root,
-            env=env,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        self.assertNotEqual(completed.returncode, 0)
-        self.assertIn("fixture target requested", completed.stderr)
+        env = {key: value for key, value in os.environ.items() if key not in {"FIXTURE_REPO", "BRIDGE_REPO", "FIXTURE_TARGET", "BRIDGE_TARGET"}}
+        with mock.patch.dict(os.environ, env, clear=True):
+            returncode, _, stderr = _run_main(["--no-launch"])
+        self.assertNotEqual(returncode, 0)
+        self.assertIn("fixture target requested", stderr)
 
     def test_can_generate_config_from_generic_repo_flag(self):
-        repo_root = Path(__file__).resolve().parents[1]
-        script = repo_root / "scripts" / "launch_monitor.py"
-        self.assertTrue(script.exists())
+        app_repo, out_dir = self._case_dirs(2)
+        target_a = app_repo / "config" / "gui" / "monitor.alpha.target.json"
+        target_b = app_repo / "config" / "gui" / "monitor.beta.target.json"
+        target_a.parent.mkdir(parents=True, exist_ok=True)
+        target_a.write_bytes(
+            b'{"configVersion":2,"id":"alpha","title":"Alpha","control":{"mode":"ipc","endpoint":"127.0.0.1:8761","appId":"alpha"},"ui":{"tabs":[]}}'
+        )
+        target_b.write_bytes(
+            b'{"configVersion":2,"id":"beta","title":"Beta","control":{"mode":"ipc","endpoint":"127.0.0.1:8762","appId":"beta"},"ui":{"tabs":[]}}'
+        )
 
-        with tempfile.TemporaryDirectory() as app_tmp, tempfile.TemporaryDirectory() as out_tmp:
-            app_repo = Path(app_tmp)
-            target_a = app_repo / "config" / "gui" / "monitor.alpha.target.json"
-            target_b = app_repo / "config" / "gui" / "monitor.beta.target.json"
-            target_a.parent.mkdir(parents=True, exist_ok=True)
-            target_a.write_text(
-                '{"configVersion":2,"id":"alpha","title":"Alpha","control":{"mode":"ipc","endpoint":"127.0.0.1:8761","appId":"alpha"},"ui":{"tabs":[]}}',
-                encoding="utf-8",
-            )
-            target_b.write_text(
-                '{"configVersion":2,"id":"beta","title":"Beta","control":{"mode":"ipc","endpoint":"127.0.0.1:8762","appId":"beta"},"ui":{"tabs":[]}}',
-                encoding="utf-8",
-            )
-
-            config_out = Path(out_tmp) / "generated-generic.json"
-            cmd = [
-                "python",
-                str(script),
-                "--repo",
-                str(app_repo),
-                "--config-out",
-                str(config_out),
-                "--no-launch",
-            ]
-            completed = subprocess.run(cmd, cwd=repo_root, capture_output=True, text=True, check=False)
-            self.assertEqual(completed.returncode, 0, msg=completed.stderr)
-            self.assertTrue(config_out.exists())
-
-            payload = json.loads(config_out.read_text(encoding="utf-8"))
-            includes = payload.get("includeFiles", [])
-            self.assertEqual(len(includes), 2)
-            self.assertTrue(any("monitor.alpha.target.json" in item for item in includes))
-            self.assertTrue(any("monitor.beta.target.json" in item for item in includes))
+        config_out = out_dir / "generated-generic.json"
+        returncode, _, stderr = _run_main(["--repo", str(app_repo), "--config-out", str(config_out), "--no-launch"])
+        self.assertEqual(returncode, 0, msg=stderr)
+        self.assertTrue(config_out.exists())
+
+        payload = loads(config_out.read_bytes())
+        includes = payload.get("includeFiles", [])
+        self.assertEqual(len(includes), 2)
+        self.assertTrue(any("monitor.alpha.target.json" in item for item in includes))
+        self.assertTrue(any("monitor.beta.target.json" in item for item in includes))
+
+    def test_write_bytes_finishes_short_writes(self):
+        (out_dir,) = self._case_dirs(1)
+        data = b'{"includeFiles": []}\n' * 8
+        real_write = os.write
+        with mock.patch.object(launch_monitor.os, "write", side_effect=lambda fd, buf: real_write(fd, buf[:5])):
+            launch_monitor.write_bytes(out_dir / "config.json", data)
+        self.assertEqual((out_dir / "config.json").read_bytes(), data)
 
 
 if __name__ == "__main__":
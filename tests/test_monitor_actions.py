@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import monitor
+
+
+# Closes both pipes straight away, like `exec >log 2>&1; long_job`, then keeps running.
+CLOSED_PIPES_CHILD = "import os, time; os.close(1); os.close(2); time.sleep(10)"
+
+
+@unittest.skipIf(os.name == "nt", "the selector wait is the POSIX path")
+class ActionWaitTests(unittest.TestCase):
+    def test_timeout_applies_after_the_child_closes_its_pipes(self):
+        app = SimpleNamespace(_append_action_output=mock.Mock())
+        process = subprocess.Popen(
+            [sys.executable, "-I", "-S", "-c", CLOSED_PIPES_CHILD],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=0,
+        )
+        self.addCleanup(process.kill)
+        started = time.monotonic()
+        timed_out = monitor.MonitorApp._wait_action_selector(app, "bridge", process, 0.5)
+        self.assertTrue(timed_out)
+        self.assertLess(time.monotonic() - started, 5.0)
+        self.assertIsNotNone(process.wait(timeout=5.0))
+
+
+class ActionOutputTrimTests(unittest.TestCase):
+    def test_widget_trim_matches_the_buffer_for_both_caps(self):
+        long_text = "y" * 600
+        cases = {"lines": (3, 4096, ["a", "b", "c", "d", "e"]), "bytes": (100, 1024, ["a", long_text, "b", long_text])}
+        for name, (max_lines, max_bytes, texts) in cases.items():
+            with self.subTest(name):
+                buffer = monitor.ActionOutputBuffer(max_lines=max_lines, max_bytes=max_bytes)
+                shown: list[str] = []
+                sizes = monitor.deque()
+                total = 0
+                for text in texts:
+                    line = buffer.append("stdout", text)
+                    shown.append(line)
+                    excess, total = monitor._trim_shown_lines(
+                        sizes, total, line, max_lines=buffer.max_lines, max_bytes=buffer.max_bytes
+                    )
+                    del shown[:excess]
+                self.assertEqual("\n".join(shown), buffer.snapshot())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,203 +2,173 @@ import os
 import tempfile
 import unittest
 from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
 
 import monitor
+from _json_io import dumps
+from _tmpfs import TMP_ROOT
 
 
-def _write_json(path: Path, text: str) -> None:
+IPC_CONTROL = {"mode": "ipc", "endpoint": "127.0.0.1:8765", "appId": "bridge"}
+BRIDGE_TARGET = {"configVersion": 2, "id": "bridge", "title": "Bridge", "control": IPC_CONTROL, "ui": {"tabs": []}}
+ROOT_CONFIG = {"refreshSeconds": 1.0, "commandTimeoutSeconds": 10.0, "includeFiles": ["target.json"]}
+ACTION_OUTPUT_WIDGET = {"type": "action_output", "title": "Output"}
+
+
+def _write_json(path: Path, payload: dict) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(text, encoding="utf-8")
+    path.write_bytes(dumps(payload))
+
+
+def _bridge_with_tabs(*tabs: dict, **extra) -> dict:
+    return {**BRIDGE_TARGET, "ui": {"tabs": list(tabs)}, **extra}
+
+
+# (name, target, root config, loads cleanly?) for cases that only need pass/fail.
+VALIDATION_CASES = [
+    ("unknown root key", BRIDGE_TARGET, {**ROOT_CONFIG, "unknownKey": True}, False),
+    ("unknown v2 target key", {**BRIDGE_TARGET, "unknownKey": 123}, ROOT_CONFIG, False),
+    (
+        "ipc control missing endpoint",
+        _bridge_with_tabs(
+            {"id": "actions", "title": "Actions", "widgets": [ACTION_OUTPUT_WIDGET]},
+            control={"mode": "ipc", "appId": "bridge"},
+        ),
+        ROOT_CONFIG,
+        False,
+    ),
+    (
+        "status cmd in v2 target",
+        _bridge_with_tabs({"id": "status", "title": "Status", "widgets": []}, status={"cmd": ["python", "-V"]}),
+        ROOT_CONFIG,
+        False,
+    ),
+    (
+        "config_editor widget",
+        _bridge_with_tabs(
+            {
+                "id": "cfg",
+                "title": "Config",
+                "widgets": [
+                    {"type": "config_editor", "title": "Editor", "showAction": "config_show", "setAction": "config_set_key"}
+                ],
+            },
+            actions=[
+                {"name": "config_show", "label": "Show", "cwd": ".", "cmd": ["python", "-V"]},
+                {"name": "config_set_key", "label": "Set", "cwd": ".", "cmd": ["python", "-V"]},
+            ],
+        ),
+        ROOT_CONFIG,
+        True,
+    ),
+    (
+        "action_output widget",
+        _bridge_with_tabs({"id": "actions", "title": "Actions", "widgets": [ACTION_OUTPUT_WIDGET]}),
+        ROOT_CONFIG,
+        True,
+    ),
+]
 
 
 class MonitorConfigValidationTests(unittest.TestCase):
-    def test_top_tab_order_preserves_config_sequence(self):
-        tabs = [
-            {"id": "config", "title": "Config"},
-            {"id": "misc", "title": "Misc"},
-            {"id": "status", "title": "Status"},
-            {"id": "actions", "title": "Actions"},
-            {"id": "logs", "title": "Logs"},
-        ]
-        ordered = monitor._order_top_level_tabs(tabs)
-        self.assertEqual([str(item.get("id") or "") for item in ordered], ["config", "misc", "status", "actions", "logs"])
-
-    def test_rejects_unknown_root_key(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            root = Path(tmp)
-            target = root / "target.json"
-            _write_json(
-                target,
-                '{"configVersion":2,"id":"bridge","title":"Bridge","control":{"mode":"ipc","endpoint":"127.0.0.1:8765","appId":"bridge"},"ui":{"tabs":[]}}',
-            )
-            root_config = root / "monitor_config.json"
-            _write_json(
-                root_config,
-                '{"refreshSeconds":1.0,"commandTimeoutSeconds":10.0,"includeFiles":["target.json"],"unknownKey":true}',
-            )
+    @classmethod
+    def setUpClass(cls):
+        # Only the end-to-end reload test touches disk; it writes under this class-level tree.
+        cls._tmp = tempfile.TemporaryDirectory(dir=TMP_ROOT)
+        cls.addClassCleanup(cls._tmp.cleanup)
+
+    def _load(self, target: dict, root: dict = ROOT_CONFIG) -> list[dict]:
+        # Validation cases skip the disk: the root is checked for its defaults and `target` is
+        # normalized as the root's "target.json" include.
+        defaults = monitor._root_config_defaults(root, Path("monitor_config.json"))
+        return monitor._normalize_include(target, Path("target.json"), defaults)
 
-            with self.assertRaises(ValueError):
-                monitor.load_monitor_config(root_config)
+    def test_top_tab_order_preserves_config_sequence(self):
+        # There is no canonical tab order: ui.tabs[] is rendered as written, whatever the ids.
+        for ids in (["config", "misc", "status", "actions", "logs"], ["logs", "actions", "status", "misc", "config"]):
+            with self.subTest(ids=ids):
+                tabs = [{"id": tab_id, "title": tab_id.title()} for tab_id in ids]
+                ordered = monitor._order_top_level_tabs([*tabs[:2], "not-a-tab", *tabs[2:]])
+                self.assertEqual([str(item.get("id") or "") for item in ordered], ids)
+
+    def test_validation_cases(self):
+        for name, target, root, valid in VALIDATION_CASES:
+            with self.subTest(name):
+                if valid:
+                    self.assertEqual(len(self._load(target, root)), 1)
+                else:
+                    with self.assertRaises(ValueError):
+                        self._load(target, root)
 
     def test_allows_schema_metadata_keys(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            root = Path(tmp)
-            target = root / "target.json"
-            _write_json(
-                target,
-                '{"$schema":"./monitor.target.v2.schema.json","configVersion":2,"id":"bridge","title":"Bridge","control":{"mode":"ipc","endpoint":"127.0.0.1:8765","appId":"bridge"},"ui":{"tabs":[]}}',
-            )
-            root_config = root / "monitor_config.json"
-            _write_json(
-                root_config,
-                '{"$schema":"./schemas/monitor.root.schema.json","refreshSeconds":1.0,"commandTimeoutSeconds":10.0,"includeFiles":["target.json"]}',
-            )
-
-            loaded = monitor.load_monitor_config(root_config)
-            targets = loaded.get("targets", [])
-            self.assertEqual(len(targets), 1)
-            self.assertEqual(str(targets[0].get("id") or ""), "bridge")
-
-    def test_rejects_unknown_v2_target_key(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            root = Path(tmp)
-            target = root / "target.json"
-            _write_json(
-                target,
-                '{"configVersion":2,"id":"bridge","title":"Bridge","control":{"mode":"ipc","endpoint":"127.0.0.1:8765","appId":"bridge"},"ui":{"tabs":[]},"unknownKey":123}',
-            )
-            root_config = root / "monitor_config.json"
-            _write_json(
-                root_config,
-                '{"refreshSeconds":1.0,"commandTimeoutSeconds":10.0,"includeFiles":["target.json"]}',
-            )
-
-            with self.assertRaises(ValueError):
-                monitor.load_monitor_config(root_config)
-
-    def test_accepts_config_editor_widget(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            root = Path(tmp)
-            target = root / "target.json"
-            _write_json(
-                target,
-                (
-                    '{"configVersion":2,"id":"bridge","title":"Bridge",'
-                    '"control":{"mode":"ipc","endpoint":"127.0.0.1:8765","appId":"bridge"},'
-                    '"ui":{"tabs":[{"id":"cfg","title":"Config","widgets":['
-                    '{"type":"config_editor","title":"Editor","showAction":"config_show","setAction":"config_set_key"}'
-                    ']}]},'
-                    '"actions":[{"name":"config_show","label":"Show","cwd":".","cmd":["python","-V"]},'
-                    '{"name":"config_set_key","label":"Set","cwd":".","cmd":["python","-V"]}]}'
-                ),
-            )
-            root_config = root / "monitor_config.json"
-            _write_json(
-                root_config,
-                '{"refreshSeconds":1.0,"commandTimeoutSeconds":10.0,"includeFiles":["target.json"]}',
-            )
-
-            loaded = monitor.load_monitor_config(root_config)
-            targets = loaded.get("targets", [])
-            self.assertEqual(len(targets), 1)
-
-    def test_accepts_action_output_widget(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            root = Path(tmp)
-            target = root / "target.json"
-            _write_json(
-                target,
-                (
-                    '{"configVersion":2,"id":"bridge","title":"Bridge",'
-                    '"control":{"mode":"ipc","endpoint":"127.0.0.1:8765","appId":"bridge"},'
-                    '"ui":{"tabs":[{"id":"actions","title":"Actions","widgets":['
-                    '{"type":"action_output","title":"Output"}'
-                    ']}]}}'
-                ),
-            )
-            root_config = root / "monitor_config.json"
-            _write_json(
-                root_config,
-                '{"refreshSeconds":1.0,"commandTimeoutSeconds":10.0,"includeFiles":["target.json"]}',
-            )
-
-            loaded = monitor.load_monitor_config(root_config)
-            targets = loaded.get("targets", [])
-            self.assertEqual(len(targets), 1)
+        targets = self._load(
+            {"$schema": "./monitor.target.v2.schema.json", **BRIDGE_TARGET},
+            {"$schema": "./schemas/monitor.root.schema.json", **ROOT_CONFIG},
+        )
+        self.assertEqual(len(targets), 1)
+        self.assertEqual(str(targets[0].get("id") or ""), "bridge")
 
     def test_accepts_ipc_control_without_target_actions(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            root = Path(tmp)
-            target = root / "target.json"
-            _write_json(
-                target,
-                (
-                    '{"configVersion":2,"id":"bridge","title":"Bridge",'
-                    '"control":{"mode":"ipc","endpoint":"127.0.0.1:8765","appId":"bridge"},'
-                    '"ui":{"tabs":[{"id":"actions","title":"Actions","widgets":['
-                    '{"type":"action_select","title":"Run Action"},'
-                    '{"type":"action_output","title":"Output"}'
-                    ']}]}}'
-                ),
-            )
-            root_config = root / "monitor_config.json"
-            _write_json(
-                root_config,
-                '{"refreshSeconds":1.0,"commandTimeoutSeconds":10.0,"includeFiles":["target.json"]}',
-            )
-            loaded = monitor.load_monitor_config(root_config)
-            targets = loaded.get("targets", [])
-            self.assertEqual(len(targets), 1)
-            control = targets[0].get("control")
-            self.assertIsInstance(control, dict)
-            self.assertEqual(str(control.get("mode") or ""), "ipc")
-
-    def test_rejects_ipc_control_missing_endpoint(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            root = Path(tmp)
-            target = root / "target.json"
-            _write_json(
-                target,
-                (
-                    '{"configVersion":2,"id":"bridge","title":"Bridge",'
-                    '"control":{"mode":"ipc","appId":"bridge"},'
-                    '"ui":{"tabs":[{"id":"actions","title":"Actions","widgets":[{"type":"action_output","title":"Output"}]}]}}'
-                ),
-            )
-            root_config = root / "monitor_config.json"
-            _write_json(
-                root_config,
-                '{"refreshSeconds":1.0,"commandTimeoutSeconds":10.0,"includeFiles":["target.json"]}',
-            )
-            with self.assertRaises(ValueError):
-                monitor.load_monitor_config(root_config)
-
-    def test_rejects_status_cmd_in_v2_target(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            root = Path(tmp)
-            target = root / "target.json"
-            _write_json(
-                target,
-                (
-                    '{"configVersion":2,"id":"bridge","title":"Bridge",'
-                    '"control":{"mode":"ipc","endpoint":"127.0.0.1:8765","appId":"bridge"},'
-                    '"status":{"cmd":["python","-V"]},'
-                    '"ui":{"tabs":[{"id":"status","title":"Status","widgets":[]}]}}'
-                ),
-            )
-            root_config = root / "monitor_config.json"
-            _write_json(
-                root_config,
-                '{"refreshSeconds":1.0,"commandTimeoutSeconds":10.0,"includeFiles":["target.json"]}',
-            )
-            with self.assertRaises(ValueError):
-                monitor.load_monitor_config(root_config)
+        targets = self._load(
+            _bridge_with_tabs(
+                {
+                    "id": "actions",
+                    "title": "Actions",
+                    "widgets": [{"type": "action_select", "title": "Run Action"}, ACTION_OUTPUT_WIDGET],
+                }
+            )
+        )
+        self.assertEqual(len(targets), 1)
+        control = targets[0].get("control")
+        self.assertIsInstance(control, dict)
+        self.assertEqual(str(control.get("mode") or ""), "ipc")
+
+    def test_reload_reuses_unchanged_includes(self):
+        monitor.clear_config_cache()
+        case_dir = Path(tempfile.mkdtemp(dir=self._tmp.name))
+        _write_json(case_dir / "target.json", BRIDGE_TARGET)
+        _write_json(case_dir / "monitor_config.json", ROOT_CONFIG)
+
+        first = monitor.load_monitor_config(case_dir / "monitor_config.json")
+        second = monitor.load_monitor_config(case_dir / "monitor_config.json")
+        self.assertEqual(first["targets"], second["targets"])
+        self.assertIsNot(first["targets"][0], second["targets"][0])
+
+        _write_json(case_dir / "target.json", {**BRIDGE_TARGET, "title": "Bridge Renamed"})
+        reloaded = monitor.load_monitor_config(case_dir / "monitor_config.json")
+        self.assertEqual(str(reloaded["targets"][0].get("title") or ""), "Bridge Renamed")
+
+    def test_identical_includes_are_parsed_once(self):
+        monitor.clear_config_cache()
+        case_dirs = [Path(tempfile.mkdtemp(dir=self._tmp.name)) for _ in range(2)]
+        for case_dir in case_dirs:
+            _write_json(case_dir / "target.json", BRIDGE_TARGET)
+            _write_json(case_dir / "monitor_config.json", ROOT_CONFIG)
+
+        first = monitor.load_monitor_config(case_dirs[0] / "monitor_config.json")
+        with mock.patch.object(monitor, "_normalize_include", side_effect=AssertionError("re-parsed")):
+            second = monitor.load_monitor_config(case_dirs[1] / "monitor_config.json")
+        first_target, second_target = first["targets"][0], second["targets"][0]
+        self.assertIsNot(first_target, second_target)
+        # Shared by content, but each target still names the file it was loaded from.
+        self.assertEqual(first_target.pop("sourcePath"), str((case_dirs[0] / "target.json").resolve()))
+        self.assertEqual(second_target.pop("sourcePath"), str((case_dirs[1] / "target.json").resolve()))
+        self.assertEqual(first_target, second_target)
 
     def test_missing_jsonpath_returns_none(self):
         payload = {"a": {"b": 1}}
         self.assertIsNone(monitor.json_path_get(payload, "$.a.c"))
         self.assertIsNone(monitor.json_path_get(payload, "$.a.b[0]"))
 
+    def test_compiled_jsonpath_is_cached_and_matches_lookup(self):
+        payload = {"a": {"b": [10, 20]}}
+        getter = monitor.compile_json_path("$.a.b[1]")
+        self.assertIs(getter, monitor.compile_json_path("$.a.b[1]"))
+        self.assertEqual(getter(payload), 20)
+        self.assertEqual(getter(payload), monitor.json_path_get(payload, "$.a.b[1]"))
+        self.assertIsNone(monitor.compile_json_path("a.b")(payload))
+
     def test_parse_endpoint_accepts_host_port(self):
         host, port = monitor._parse_endpoint("127.0.0.1:8765")
         self.assertEqual(host, "127.0.0.1")
@@ -214,20 +184,19 @@ class MonitorConfigValidationTests(unittest.TestCase):
             monitor._parse_endpoint("tcp://127.0.0.1")
 
     def test_latest_file_prefers_name_when_mtime_equal(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            root = Path(tmp)
-            a_file = root / "a.log"
-            b_file = root / "b.log"
-            a_file.write_text("a", encoding="utf-8")
-            b_file.write_text("b", encoding="utf-8")
-
-            mtime = 1_700_000_000
-            os.utime(a_file, (mtime, mtime))
-            os.utime(b_file, (mtime, mtime))
-
-            selected = monitor.resolve_latest_file(str(root / "*.log"))
-            self.assertIsNotNone(selected)
-            self.assertEqual(selected.name, "b.log")
+        # Selection only looks at the listing's names and mtimes, so no files are needed;
+        # this also keeps the tie independent of the filesystem's mtime granularity.
+        stat = SimpleNamespace(st_mtime_ns=1_700_000_000 * 1_000_000_000)
+        entries = [
+            SimpleNamespace(name=name, is_file=lambda: True, stat=lambda: stat)
+            for name in ("a.log", "b.log")
+        ]
+        with mock.patch.object(monitor.os, "scandir") as scandir:
+            scandir.return_value.__enter__.return_value = entries
+            selected = monitor.resolve_latest_file(os.path.join("logs", "*.log"))
+        scandir.assert_called_once_with("logs")
+        self.assertIsNotNone(selected)
+        self.assertEqual(selected.name, "b.log")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,145 @@
+import asyncio
+import socket
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import monitor
+import monitor_ipc
+from _json_io import dumps
+
+
+# Bigger than asyncio's default 64 KiB StreamReader limit.
+LARGE_BLOB = "x" * (200 * 1024)
+
+
+def _serve_lines(test: unittest.TestCase, reply: bytes, *, hold_open: float = 0.0) -> tuple[str, list[bytes]]:
+    # One-line-per-connection server on an ephemeral port. Each connection gets `reply` and is
+    # closed after `hold_open` seconds; requests are recorded in arrival order.
+    listener = socket.create_server(("127.0.0.1", 0))
+    test.addCleanup(listener.close)
+    received: list[bytes] = []
+    done = threading.Event()
+    test.addCleanup(done.set)
+
+    def handle(conn: socket.socket) -> None:
+        with conn:
+            data = b""
+            while not data.endswith(b"\n"):
+                chunk = conn.recv(65536)
+                if not chunk:
+                    break
+                data += chunk
+            received.append(data)
+            conn.sendall(reply)
+            done.wait(hold_open)
+
+    def accept_loop() -> None:
+        while True:
+            try:
+                conn, _ = listener.accept()
+            except OSError:
+                return
+            threading.Thread(target=handle, args=(conn,), daemon=True).start()
+
+    threading.Thread(target=accept_loop, daemon=True).start()
+    return f"tcp://127.0.0.1:{listener.getsockname()[1]}", received
+
+
+class ExtractJsonObjectTests(unittest.TestCase):
+    def test_longest_object_wins_even_when_it_starts_inside_another(self):
+        # `{"a": "x{"}` decodes first, but the '{' in its string opens a longer object.
+        payload, error = monitor_ipc.try_extract_json_object('{"a": "x{"}": 1, "pad": "yyyy"}')
+        self.assertEqual(error, "")
+        self.assertEqual(payload, {"}": 1, "pad": "yyyy"})
+
+    def test_picks_the_longest_object_among_log_noise(self):
+        payload, _ = monitor_ipc.try_extract_json_object('log {"c": 2} then {"a": {"b": 1}} tail')
+        self.assertEqual(payload, {"a": {"b": 1}})
+
+
+class IpcRequestTests(unittest.TestCase):
+    def test_large_reply_is_read_by_sync_and_async_requests(self):
+        endpoint, _ = _serve_lines(self, dumps({"ok": True, "result": {"blob": LARGE_BLOB}}) + b"\n")
+        request = {"method": "status.get"}
+        results = {
+            "sync": monitor_ipc._request_ipc_v0(endpoint, request, timeout_seconds=5.0),
+            "async": asyncio.run(monitor_ipc._request_ipc_v0_async(endpoint, request, timeout_seconds=5.0)),
+        }
+        for name, (returncode, response, error) in results.items():
+            with self.subTest(name):
+                self.assertEqual(returncode, 0, msg=error)
+                self.assertEqual(response["result"]["blob"], LARGE_BLOB)
+
+    def test_requests_do_not_wait_on_a_server_that_keeps_the_socket_open(self):
+        endpoint, received = _serve_lines(self, b'{"ok": true}\n', hold_open=5.0)
+        started = time.monotonic()
+        for _ in range(3):
+            returncode, _, error = monitor_ipc._request_ipc_v0(endpoint, {"method": "status.get"}, timeout_seconds=2.0)
+            self.assertEqual(returncode, 0, msg=error)
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertEqual(len(received), 3)
+
+    def test_invoke_is_sent_once_when_the_server_closes_without_replying(self):
+        endpoint, received = _serve_lines(self, b"")
+        request = {"method": "action.invoke", "params": {"appId": "bridge", "action": "flash"}}
+        for _ in range(2):
+            returncode, _, error = monitor_ipc._request_ipc_v0(endpoint, request, timeout_seconds=2.0)
+            self.assertEqual(returncode, 2)
+            self.assertIn("empty", error)
+        self.assertEqual(len(received), 2)
+
+    def test_async_request_reports_timeouts_and_refused_connections(self):
+        silent_endpoint, _ = _serve_lines(self, b"", hold_open=5.0)
+        with socket.create_server(("127.0.0.1", 0)) as closed:
+            closed_endpoint = f"tcp://127.0.0.1:{closed.getsockname()[1]}"
+        cases = {"timeout": (silent_endpoint, "timed out"), "refused": (closed_endpoint, "ipc request failed")}
+        for name, (endpoint, message) in cases.items():
+            with self.subTest(name):
+                returncode, _, error = asyncio.run(
+                    monitor_ipc._request_ipc_v0_async(endpoint, {"method": "status.get"}, timeout_seconds=0.2)
+                )
+                self.assertEqual(returncode, 2)
+                self.assertIn(message, error)
+
+    def test_status_refresh_accepts_large_payload(self):
+        endpoint, _ = _serve_lines(self, dumps({"ok": True, "response": {"blob": LARGE_BLOB}}) + b"\n")
+        runtime = {"control": {"mode": "ipc", "endpoint": endpoint, "appId": "bridge", "timeoutSeconds": 5.0}}
+        # _refresh_target_ipc only touches the runtime map and the two status hooks.
+        app = SimpleNamespace(
+            target_runtime={"bridge": runtime},
+            _render_target_status=mock.Mock(),
+            _set_status_error=mock.Mock(),
+        )
+        control = monitor.MonitorApp._ipc_control_for_runtime(app, runtime)
+        asyncio.run(monitor.MonitorApp._refresh_target_ipc(app, {"id": "bridge"}, control))
+        app._set_status_error.assert_not_called()
+        self.assertEqual(runtime["lastGoodStatus"]["blob"], LARGE_BLOB)
+
+    def test_status_timeout_falls_back_to_root_command_timeout(self):
+        app = SimpleNamespace(
+            target_runtime={},
+            default_command_timeout_seconds=3.5,
+            _render_target_status=mock.Mock(),
+            _set_status_error=mock.Mock(),
+        )
+        request = mock.AsyncMock(return_value=(0, {"response": {}}, ""))
+        cases = [
+            ({"id": "bridge"}, {}, 3.5),
+            ({"id": "bridge"}, {"timeoutSeconds": 2.0}, 2.0),
+            ({"id": "bridge", "status": {"timeoutSeconds": 1.0}}, {"timeoutSeconds": 2.0}, 1.0),
+        ]
+        for target, control_extra, expected in cases:
+            with self.subTest(target=target, control=control_extra):
+                runtime = {"control": {"mode": "ipc", "endpoint": "127.0.0.1:1", "appId": "bridge", **control_extra}}
+                app.target_runtime["bridge"] = runtime
+                control = monitor.MonitorApp._ipc_control_for_runtime(app, runtime)
+                with mock.patch.object(monitor, "_request_ipc_v0_async", request):
+                    asyncio.run(monitor.MonitorApp._refresh_target_ipc(app, target, control))
+                self.assertEqual(request.await_args.kwargs["timeout_seconds"], expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,10 @@
-import json
 import tempfile
 import unittest
 from pathlib import Path
 
 import monitor
+from _json_io import dumps
+from _tmpfs import TMP_ROOT
 
 
 FIXTURE_TARGET = Path(r"\\H3FT06-40318\c\40318-SOFT\config\gui\monitor.fixture.target.json")
@@ -15,14 +16,14 @@ class MonitorSmokeConfigTests(unittest.TestCase):
         if not FIXTURE_TARGET.exists() or not BRIDGE_TARGET.exists():
             self.skipTest("fixture/bridge target files are not present on this machine")
 
-        with tempfile.TemporaryDirectory() as tmp:
+        with tempfile.TemporaryDirectory(dir=TMP_ROOT) as tmp:
             root_config = Path(tmp) / "monitor.root.json"
             payload = {
                 "refreshSeconds": 1.0,
                 "commandTimeoutSeconds": 10.0,
                 "includeFiles": [str(FIXTURE_TARGET), str(BRIDGE_TARGET)],
             }
-            root_config.write_text(json.dumps(payload), encoding="utf-8")
+            root_config.write_bytes(dumps(payload))
 
             config = monitor.load_monitor_config(root_config)
             targets = config.get("targets", [])
@@ -1,59 +1,61 @@
-import subprocess
+import contextlib
+import io
+import os
+import shutil
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
+
+from _tmpfs import TMP_ROOT
+from scripts import sync_target_schema
+
+
+SCHEMA_RELATIVE = Path("config") / "gui" / "monitor.target.v2.schema.json"
 
 
 class SyncTargetSchemaTests(unittest.TestCase):
-    def test_sync_copies_schema_to_both_repos(self):
-        repo_root = Path(__file__).resolve().parents[1]
-        script = repo_root / "scripts" / "sync_target_schema.py"
-        self.assertTrue(script.exists())
-
-        with tempfile.TemporaryDirectory() as fixture_tmp, tempfile.TemporaryDirectory() as bridge_tmp:
-            fixture_repo = Path(fixture_tmp)
-            bridge_repo = Path(bridge_tmp)
-
-            cmd = [
-                "python",
-                str(script),
-                "--fixture-repo",
-                str(fixture_repo),
-                "--bridge-repo",
-                str(bridge_repo),
-            ]
-            completed = subprocess.run(cmd, cwd=repo_root, capture_output=True, text=True, check=False)
-            self.assertEqual(completed.returncode, 0, msg=completed.stderr)
-
-            fixture_schema = fixture_repo / "config" / "gui" / "monitor.target.v2.schema.json"
-            bridge_schema = bridge_repo / "config" / "gui" / "monitor.target.v2.schema.json"
-            self.assertTrue(fixture_schema.exists())
-            self.assertTrue(bridge_schema.exists())
-
-    def test_sync_copies_schema_with_generic_repo_flag(self):
-        repo_root = Path(__file__).resolve().parents[1]
-        script = repo_root / "scripts" / "sync_target_schema.py"
-        self.assertTrue(script.exists())
-
-        with tempfile.TemporaryDirectory() as app_a_tmp, tempfile.TemporaryDirectory() as app_b_tmp:
-            app_repo_a = Path(app_a_tmp)
-            app_repo_b = Path(app_b_tmp)
-
-            cmd = [
-                "python",
-                str(script),
-                "--repo",
-                str(app_repo_a),
-                "--repo",
-                str(app_repo_b),
-            ]
-            completed = subprocess.run(cmd, cwd=repo_root, capture_output=True, text=True, check=False)
-            self.assertEqual(completed.returncode, 0, msg=completed.stderr)
-
-            schema_a = app_repo_a / "config" / "gui" / "monitor.target.v2.schema.json"
-            schema_b = app_repo_b / "config" / "gui" / "monitor.target.v2.schema.json"
-            self.assertTrue(schema_a.exists())
-            self.assertTrue(schema_b.exists())
+    @classmethod
+    def setUpClass(cls):
+        # Cases get directories under one class-level temp tree, removed in a single sweep.
+        cls._tmp = tempfile.TemporaryDirectory(dir=TMP_ROOT)
+        cls.addClassCleanup(cls._tmp.cleanup)
+
+    def _case_dirs(self, count: int) -> list[Path]:
+        return [Path(tempfile.mkdtemp(dir=self._tmp.name)) for _ in range(count)]
+
+    def test_sync_copies_schema_to_every_repo(self):
+        # Legacy and generic flags, with the repo env fallbacks cleared so only argv picks targets.
+        env = {key: value for key, value in os.environ.items() if key not in {"FIXTURE_REPO", "BRIDGE_REPO"}}
+        for flags in (("--fixture-repo", "--bridge-repo"), ("--repo", "--repo")):
+            with self.subTest(flags=flags):
+                repos = self._case_dirs(2)
+                argv = [item for flag, repo in zip(flags, repos) for item in (flag, str(repo))]
+                stdout = io.StringIO()
+                with mock.patch.dict(os.environ, env, clear=True), contextlib.redirect_stdout(stdout):
+                    returncode = sync_target_schema.main(argv)
+                self.assertEqual(returncode, 0, msg=stdout.getvalue())
+                for repo in repos:
+                    self.assertTrue((repo / SCHEMA_RELATIVE).exists())
+
+    def test_copy_overwrites_a_longer_destination(self):
+        (case_dir,) = self._case_dirs(1)
+        src, dst = case_dir / "src.json", case_dir / "out" / "dst.json"
+        src.write_bytes(b'{"new": 1}')
+        dst.parent.mkdir()
+        dst.write_bytes(b'{"old": "a much longer schema body"}')
+        sync_target_schema._copy_schema(src, dst)
+        self.assertEqual(dst.read_bytes(), b'{"new": 1}')
+
+    @unittest.skipIf(not hasattr(os, "symlink") or os.name == "nt", "needs POSIX symlinks")
+    def test_copy_refuses_a_destination_linked_to_the_source(self):
+        (case_dir,) = self._case_dirs(1)
+        src, dst = case_dir / "src.json", case_dir / "dst.json"
+        src.write_bytes(b'{"schema": true}')
+        dst.symlink_to(src)
+        with self.assertRaises(shutil.SameFileError):
+            sync_target_schema._copy_schema(src, dst)
+        self.assertEqual(src.read_bytes(), b'{"schema": true}')
 
 
 if __name__ == "__main__":